@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:14:27 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import json
+import time
+import asyncio
+import inspect
+import argparse
+
+import random
+
+import httpx
+
+#pylint: disable=wrong-import-position, wrong-import-order
+import models
+from modules import statics, helpers, computing, memory, words_index
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Concurrent players against main.py, in process (ASGI transport, nothing listens) or against a server on localhost (--url).
+# Every request is timed per endpoint, answers refused because the server is full (MAX_SESSIONS) count as busy, not as errors.
+PLAYER_MODES = [statics.GameMode.GAME_MODE_PLAY.name, statics.GameMode.GAME_MODE_SOLVE.name, statics.GameMode.GAME_MODE_ASSISTED.name]
+BUSY_ERRORS = ('MAX_SESSIONS',)
+BUSY_BACKOFF_SECONDS = 0.05
+RSS_SAMPLING_INTERVAL = 0.5
+PERCENTILES = (50, 95, 99)
+
+
+def get_players_words(conf: dict, langs: list[str] | None=None,
+                      word_lenghts: list[int] | None=None) -> dict[tuple[str, int], list[tuple[int, ...]]]:
+    # The players read the same data folder as the server, to pick the words to play and to guess
+    lang_files, exhaustive_files, _ = models.get_data_files(conf)
+    players_words: dict[tuple[str, int], list[tuple[int, ...]]] = {}
+
+    for lang_file in sorted(lang_files):
+        if langs and lang_file.stem not in langs:
+            continue
+
+        lang_word_lenghts = [word_lenght for word_lenght in sorted(helpers.get_lang_exhaustive_files(lang_file, exhaustive_files))
+                             if not word_lenghts or word_lenght in word_lenghts]
+
+        for word_lenght, words in words_index.load_words_buckets(lang_file, set(lang_word_lenghts)).items():
+            if words:
+                players_words[(lang_file.stem, word_lenght)] = sorted(words)
+
+    return players_words
+
+
+def get_percentile(sorted_values: list[float], percent: int) -> float:
+    # Nearest rank
+    if not sorted_values:
+        return 0.0
+
+    return sorted_values[max(0, min(len(sorted_values) - 1, -(-percent*len(sorted_values) // 100) - 1))]
+
+
+def record_request(requests_stats: dict[str, dict], endpoint: str, duration: float, outcome: str) -> None:
+    endpoint_stats = requests_stats.setdefault(endpoint, {'latencies': [], statics.StatusFunction.ERROR.name: 0, 'BUSY': 0})
+    endpoint_stats['latencies'].append(duration)
+
+    if outcome != statics.StatusFunction.SUCCESS.name:
+        endpoint_stats[outcome] = endpoint_stats[outcome] + 1
+
+
+async def send_request(client: httpx.AsyncClient, requests_stats: dict[str, dict], endpoint: str,
+                       params: dict | None=None, think_time: float=0.0) -> None | dict:
+    tic = time.perf_counter()
+
+    try:
+        response = await client.post(endpoint, params=params)
+        body = response.json()
+
+    except Exception:
+        record_request(requests_stats, endpoint, time.perf_counter() - tic, statics.StatusFunction.ERROR.name)
+        await asyncio.sleep(think_time)
+        return None
+
+    outcome = statics.StatusFunction.SUCCESS.name
+
+    if response.status_code != 200:
+        outcome = statics.StatusFunction.ERROR.name
+
+    elif body.get('status') == statics.StatusFunction.ERROR.name:
+        outcome = 'BUSY' if any(busy_error in body.get('error', '') for busy_error in BUSY_ERRORS) else statics.StatusFunction.ERROR.name
+
+    record_request(requests_stats, endpoint, time.perf_counter() - tic, outcome)
+
+    # In process, an answer does not wait on any socket: the other players only get a turn here
+    await asyncio.sleep(think_time)
+
+    return body if outcome == statics.StatusFunction.SUCCESS.name else None
+
+
+async def play_game(client: httpx.AsyncClient, requests_stats: dict[str, dict], rng: random.Random,
+                    lang: str, words: list[tuple[int, ...]], game_mode: str,
+                    max_tries: int=6, limit: int=10, think_time: float=0.0) -> bool:
+    # One game from creation to deletion: PLAY guesses at random, ASSISTED and SOLVE follow the solver guess of /get_guess_stats
+    word_lenght = len(words[0])
+
+    if (created := await send_request(client, requests_stats, "/create_game_session",
+                                      {'lang': lang, 'word_lenght': word_lenght, 'max_tries': max_tries, 'game_mode': game_mode}, think_time)) is None:
+        await asyncio.sleep(BUSY_BACKOFF_SECONDS)
+        return False
+
+    session_uuid = created['session_uuid']
+    solved_pattern = statics.code_to_emoji(statics.get_solved_code(word_lenght), word_lenght)
+    # SOLVE sessions never see the word, the player keeps it and gives the patterns
+    target = rng.choice(words)
+    guess = rng.choice(words)
+    # Only games played to the end count, an error on the way still frees the session
+    completed = True
+
+    for _ in range(max_tries):
+        str_guess = "".join(chr(ord_letter) for ord_letter in guess)
+
+        if game_mode == statics.GameMode.GAME_MODE_SOLVE.name:
+            pattern = statics.code_to_emoji(computing.compute_pattern(guess=guess, word=target), word_lenght)
+
+        elif (submitted := await send_request(client, requests_stats, "/submit_guess", {'session_uuid': session_uuid, 'word': str_guess}, think_time)) is not None:
+            pattern = submitted['pattern']
+
+        else:
+            completed = False
+            break
+
+        if pattern == solved_pattern:
+            break
+
+        if game_mode == statics.GameMode.GAME_MODE_PLAY.name:
+            guess = rng.choice(words)
+            continue
+
+        if (stats := await send_request(client, requests_stats, "/get_guess_stats",
+                                        {'session_uuid': session_uuid, 'word': str_guess, 'pattern': pattern, 'limit': limit}, think_time)) is None or \
+        not stats['guess_stats']:
+            completed = False
+            break
+
+        guess = tuple(ord(letter) for letter in stats['guess_stats']['solver_guess'])
+
+    await send_request(client, requests_stats, "/get_game_session_stats", {'session_uuid': session_uuid}, think_time)
+    await send_request(client, requests_stats, "/delete_game_session", {'session_uuid': session_uuid}, think_time)
+
+    return completed
+
+
+async def run_player(client: httpx.AsyncClient, requests_stats: dict[str, dict], games: dict[str, int],
+                     players_words: dict[tuple[str, int], list[tuple[int, ...]]], modes: list[str],
+                     deadline: float, seed: int, max_tries: int=6, limit: int=10, think_time: float=0.0) -> None:
+    rng = random.Random(seed)
+    lang_lenghts = sorted(players_words)
+
+    while time.perf_counter() < deadline:
+        game_mode = rng.choice(modes)
+        lang, word_lenght = rng.choice(lang_lenghts)
+
+        if await play_game(client, requests_stats, rng, lang, players_words[(lang, word_lenght)], game_mode, max_tries, limit, think_time):
+            games[game_mode] = games.get(game_mode, 0) + 1
+
+
+async def sample_rss(rss_samples: list[int], stop: asyncio.Event) -> None:
+    # In process only: the server is this very process
+    while not stop.is_set():
+        rss_samples.append(memory.get_rss_bytes())
+
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=RSS_SAMPLING_INTERVAL)
+
+        except asyncio.TimeoutError:
+            pass
+
+
+async def get_server_rss(client: httpx.AsyncClient) -> int:
+    try:
+        return (await client.get("/memory_report")).json()['memory_report']['rss_bytes']
+
+    except Exception:
+        return 0
+
+
+def build_load_report(requests_stats: dict[str, dict], games: dict[str, int], duration: float,
+                      nb_players: int, rss_samples: list[int]) -> dict[str, int | float | dict]:
+    nb_requests = sum(len(endpoint_stats['latencies']) for endpoint_stats in requests_stats.values())
+    nb_errors = sum(endpoint_stats[statics.StatusFunction.ERROR.name] for endpoint_stats in requests_stats.values())
+    nb_busy = sum(endpoint_stats['BUSY'] for endpoint_stats in requests_stats.values())
+
+    endpoints: dict[str, dict[str, int | float]] = {}
+
+    for endpoint, endpoint_stats in sorted(requests_stats.items()):
+        latencies = sorted(endpoint_stats['latencies'])
+        endpoints[endpoint] = {'requests': len(latencies),
+                               **{f"p{percent}_ms": round(1000*get_percentile(latencies, percent), 2) for percent in PERCENTILES},
+                               'max_ms': round(1000*latencies[-1], 2),
+                               'error_rate': round(endpoint_stats[statics.StatusFunction.ERROR.name] / len(latencies), 4),
+                               'busy_rate': round(endpoint_stats['BUSY'] / len(latencies), 4)}
+
+    return {'players': nb_players,
+            'duration_seconds': round(duration, 2),
+            'requests': nb_requests,
+            'throughput_rps': round(nb_requests / duration, 2) if duration > 0 else 0.0,
+            'games': games,
+            'games_per_second': round(sum(games.values()) / duration, 3) if duration > 0 else 0.0,
+            'error_rate': round(nb_errors / nb_requests, 4) if nb_requests else 0.0,
+            'busy_rate': round(nb_busy / nb_requests, 4) if nb_requests else 0.0,
+            'endpoints': endpoints,
+            'rss_bytes': {'start': rss_samples[0] if rss_samples else 0,
+                          'peak': max(rss_samples, default=0),
+                          'end': rss_samples[-1] if rss_samples else 0}}
+
+
+async def run_load_test(players_words: dict[tuple[str, int], list[tuple[int, ...]]], nb_players: int, duration: float,
+                        modes: list[str], url: str | None=None, seed: int=0, max_tries: int=6, limit: int=10,
+                        think_time: float=0.0, timeout: float=60.0) -> dict[str, int | float | dict]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    if url is None:
+        # Loads every language as the server does on start up, before the clock starts
+        import main as server #pylint: disable=import-outside-toplevel
+        transport = httpx.ASGITransport(app=server.app)
+        url = "http://in-process"
+
+    else:
+        transport = None
+
+    requests_stats: dict[str, dict] = {}
+    games: dict[str, int] = {}
+    rss_samples: list[int] = []
+    stop = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url=url, timeout=timeout) as client:
+        in_process = transport is not None
+        rss_sampler = asyncio.create_task(sample_rss(rss_samples, stop)) if in_process else None
+
+        if not in_process:
+            rss_samples.append(await get_server_rss(client))
+
+        print(f"{curr_func} -- {nb_players} player(s) for {duration} second(s) on {url} ({', '.join(modes)})...")
+
+        tic = time.perf_counter()
+
+        await asyncio.gather(*[run_player(client, requests_stats, games, players_words, modes, tic + duration,
+                                          seed + idx, max_tries, limit, think_time) for idx in range(nb_players)])
+
+        # Games started before the deadline are played to their end
+        tac = time.perf_counter() - tic
+
+        if in_process:
+            stop.set()
+            await rss_sampler
+            rss_samples.append(memory.get_rss_bytes())
+
+        else:
+            rss_samples.append(await get_server_rss(client))
+
+    return build_load_report(requests_stats, games, tac, nb_players, rss_samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent players against the server, in process or on localhost")
+    parser.add_argument('--players', type=int, default=8, help="Concurrent players")
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds during which new games are started")
+    parser.add_argument('--modes', nargs='*', default=PLAYER_MODES, choices=PLAYER_MODES, help="Game modes the players pick from")
+    parser.add_argument('--lang', nargs='*', default=None, help="Only these languages")
+    parser.add_argument('--lenght', type=int, nargs='*', default=None, help="Only these word lenghts")
+    parser.add_argument('--url', default=None, help="Server to load (default: the app, in process)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first player, the others follow")
+    parser.add_argument('--max-tries', type=int, default=6, help="Tries per game")
+    parser.add_argument('--limit', type=int, default=10, help="Page size asked to /get_guess_stats")
+    parser.add_argument('--think-time', type=float, default=0.0, help="Seconds a player waits after every answer")
+    parser.add_argument('--timeout', type=float, default=60.0, help="Seconds before a request counts as an error")
+    args = parser.parse_args()
+
+    players_words = get_players_words(models.load_config(), args.lang, args.lenght)
+
+    if not players_words:
+        print("No language to play")
+        return
+
+    report = asyncio.run(run_load_test(players_words, args.players, args.duration, args.modes, args.url,
+                                       args.seed, args.max_tries, args.limit, args.think_time, args.timeout))
+
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
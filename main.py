@@ -9,11 +9,18 @@ Created on Tue Apr 30 11:28:51 2024
 
 #===================================================================================================
 import time
-from fastapi import FastAPI
+import json
+import asyncio
+import pathlib
+
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse, PlainTextResponse, FileResponse
 
 #pylint: disable=wrong-import-position, wrong-import-order
 import models
-from modules import statics
+from modules import statics, solver, metrics, profiling, scorers, memory, multi_wordle
 #pylint: enable=wrong-import-position, wrong-import-order
 #===================================================================================================
 
@@ -23,6 +30,20 @@ app = FastAPI()
 
 APP_SOURCES = models.init_app_sources()
 APP_SESSIONS = models.APP_SESSIONS
+PROFILES_FOLDER = pathlib.Path.cwd()/APP_SOURCES.get('profiles_folder', 'profiles/')
+BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=APP_SOURCES.get('MAX_BATCH_WORKERS', 1))
+
+metrics.ACTIVE_SESSIONS.set_function(lambda: len(APP_SESSIONS))
+# Solves submitted to the batch pool and not done yet, kept up to date by submit_batch_job
+metrics.WORKER_QUEUE_DEPTH.set(0)
+
+
+def submit_batch_job(loop: asyncio.AbstractEventLoop, func: Callable, *args) -> asyncio.Future:
+    metrics.WORKER_QUEUE_DEPTH.inc()
+    job = loop.run_in_executor(BATCH_EXECUTOR, func, *args)
+    job.add_done_callback(lambda _: metrics.WORKER_QUEUE_DEPTH.dec())
+
+    return job
 
 
 @app.get("/version")
@@ -30,6 +51,24 @@ async def get_version() -> dict[str, str]:
     return { 'status': statics.StatusFunction.SUCCESS.name, 'version': APP_SOURCES.get('version'), 'error': '' }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/memory_report")
+def get_memory_report(count_rows: bool=False) -> dict[str, str | dict]:
+    try:
+        # Walks every structure held by the server, meant for capacity planning rather than frequent polling.
+        # A plain def on purpose: the walk runs in the threadpool, the event loop keeps serving the other requests
+        report = memory.build_memory_report(APP_SOURCES, APP_SESSIONS, count_rows)
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'memory_report': report, 'error': '' }
+
+
 @app.get("/get_active_games")
 async def get_active_games() -> dict[str, str | int]:
     try:
@@ -56,14 +95,52 @@ async def get_app_sources() -> dict[str, str | dict[str, dict[str, str | dict[st
 
 
 @app.post("/create_game_session")
-async def create_game_session(lang: str, word_lenght: int, max_tries: int, game_mode: str=statics.GameMode.GAME_MODE_PLAY.name) -> dict [str, str]:
+async def create_game_session(lang: str, word_lenght: int, max_tries: int, game_mode: str=statics.GameMode.GAME_MODE_PLAY.name,
+                              strategy: str=statics.SolverStrategy.STRATEGY_FAST.name, move_time_budget: float | None=None,
+                              scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict [str, str]:
     try:
         if len(APP_SESSIONS) >= APP_SOURCES['MAX_SESSIONS']:
             return { 'status': statics.StatusFunction.ERROR.name, 'error': 'MAX_SESSIONS limit reached' }
 
+        if solver.get_strategy(strategy) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_STRATEGY {strategy}' }
+
+        if scorers.get_scorer(scorer) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_SCORER {scorer}' }
+
         game_session = models.create_game_session(APP_SOURCES.get(lang.lower(), {}).get('pre_computed', {}).get(str(word_lenght), {}).get('lang_launcher'),
                                                   APP_SOURCES.get('compute_best_opening', False),
-                                                  game_mode, max_tries)
+                                                  game_mode, max_tries,
+                                                  strategy, models.get_strategy_options(APP_SOURCES, move_time_budget),
+                                                  scorer)
+        APP_SESSIONS.update({game_session['session_uuid']: game_session})
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'session_uuid': game_session['session_uuid'], 'error': '' }
+
+
+@app.post("/create_multi_game_session")
+async def create_multi_game_session(lang: str="en",
+                                    word_lenght: int=5,
+                                    nb_boards: int=4,
+                                    max_tries: int | None=None,
+                                    game_mode: str="GAME_MODE_PLAY",
+                                    scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict [str, str]:
+    try:
+        if len(APP_SESSIONS) >= APP_SOURCES['MAX_SESSIONS']:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': 'MAX_SESSIONS limit reached' }
+
+        if not 1 <= nb_boards <= multi_wordle.MAX_BOARDS:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_NB_BOARDS {nb_boards}' }
+
+        if scorers.get_scorer(scorer) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_SCORER {scorer}' }
+
+        game_session = models.create_multi_game_session(APP_SOURCES.get(lang.lower(), {}).get('pre_computed', {}).get(str(word_lenght), {}).get('lang_launcher'),
+                                                        APP_SOURCES.get('compute_best_opening', False),
+                                                        game_mode, nb_boards, max_tries, scorer)
         APP_SESSIONS.update({game_session['session_uuid']: game_session})
 
     except Exception as err:
@@ -75,7 +152,8 @@ async def create_game_session(lang: str, word_lenght: int, max_tries: int, game_
 @app.post("/reset_game_session")
 async def reset_game_session(session_uuid: str, game_mode: str="GAME_MODE_PLAY") -> dict[str, str]:
     try:
-        models.reset_game_session(APP_SESSIONS[session_uuid], game_mode)
+        if not models.reset_game_session(APP_SESSIONS[session_uuid], game_mode):
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_GAME_MODE {game_mode}' }
 
     except Exception as err:
         return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
@@ -117,11 +195,22 @@ async def get_word_to_guess(session_uuid: str) -> dict[str, str]:
 
 
 @app.post("/get_guess_stats")
-async def get_guess_stats(session_uuid: str,
-                          word: str,
-                          pattern: str) -> dict[str, str | dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]]]]:
+def get_guess_stats(session_uuid: str,
+                    word: str,
+                    pattern: str,
+                    limit: int | None=None,
+                    response_format: str=statics.ResponseFormat.FORMAT_DEFAULT.name,
+                    profile: bool=False) -> dict[str, str | dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]]]]:
     try:
-        stats = models.get_guess_stats(APP_SESSIONS[session_uuid], word, pattern)
+        # A plain def on purpose: picking the solver guess may take up to MOVE_TIME_BUDGET_SECONDS (lookahead),
+        # it runs in the threadpool while the event loop keeps serving the other sessions
+        if profile or APP_SOURCES.get('profiling', False):
+            stats, profile_id = profiling.profile_call(PROFILES_FOLDER, "get_guess_stats", models.get_guess_stats,
+                                                       APP_SESSIONS[session_uuid], word, pattern, limit, response_format.upper(),
+                                                       max_profiles=APP_SOURCES.get('MAX_PROFILES', profiling.MAX_PROFILES))
+            return { 'status': statics.StatusFunction.SUCCESS.name, 'guess_stats': stats, 'profile_id': profile_id, 'error': '' }
+
+        stats = models.get_guess_stats(APP_SESSIONS[session_uuid], word, pattern, limit, response_format.upper())
 
     except Exception as err:
         return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
@@ -129,6 +218,135 @@ async def get_guess_stats(session_uuid: str,
     return { 'status': statics.StatusFunction.SUCCESS.name, 'guess_stats': stats, 'error': '' }
 
 
+@app.get("/list_profiles")
+async def list_profiles() -> dict[str, str | list[str]]:
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'profiles': profiling.list_profiles(PROFILES_FOLDER), 'error': '' }
+
+
+@app.get("/get_profile", response_model=None)
+async def get_profile(profile_id: str, summary: bool=False) -> FileResponse | PlainTextResponse | dict[str, str]:
+    try:
+        if (path := profiling.get_profile_path(PROFILES_FOLDER, profile_id)) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'UNKNOWN_PROFILE {profile_id}' }
+
+        if summary:
+            return PlainTextResponse(profiling.summarize_profile(path))
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
+@app.post("/get_guess_stats_page")
+async def get_guess_stats_page(session_uuid: str,
+                               cursor: int=0,
+                               limit: int | None=None,
+                               response_format: str=statics.ResponseFormat.FORMAT_DEFAULT.name) -> dict[str, str | dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]] | int | None]]:
+    try:
+        stats = models.get_guess_stats_page(APP_SESSIONS[session_uuid], cursor, limit, response_format.upper())
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'guess_stats': stats, 'error': '' }
+
+
+@app.post("/stream_guess_stats", response_model=None)
+def stream_guess_stats(session_uuid: str,
+                       word: str,
+                       pattern: str,
+                       cursor: int=0,
+                       limit: int | None=None) -> StreamingResponse | dict[str, str]:
+    try:
+        # Same as /get_guess_stats: the guess is submitted and scored off the event loop
+        game_session = APP_SESSIONS[session_uuid]
+
+        if game_session['game_mode'] in (statics.GameMode.GAME_MODE_PLAY.name, statics.GameMode.GAME_MODE_ADVERSARIAL.name):
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_GAME_MODE {game_session["game_mode"]}' }
+
+        if not models.submit_guess_stats(game_session, word, pattern):
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_MOVE {word} {pattern}' }
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return StreamingResponse(models.stream_guess_stats(game_session, cursor, limit), media_type="application/x-ndjson")
+
+
+@app.websocket("/session_channel/{session_uuid}")
+async def session_channel(websocket: WebSocket, session_uuid: str) -> None:
+    # One message per move ({"word", "pattern", "limit"}), answered by a heuristic ranking right away, then by refined ones
+    await websocket.accept()
+
+    if (game_session := APP_SESSIONS.get(session_uuid)) is None:
+        await websocket.send_json({ 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_SESSION {session_uuid}' })
+        await websocket.close()
+        return
+
+    loop = asyncio.get_running_loop()
+    # A single worker per channel: the moves of a session never overlap, a new move only waits for the step in flight
+    executor = ThreadPoolExecutor(max_workers=1)
+    refining: asyncio.Task | None = None
+    move = 0
+
+    async def refine_move(move: int, limit: int | None) -> None:
+        refinements = models.iter_move_refinements(game_session, limit)
+
+        try:
+            while (refinement := await loop.run_in_executor(executor, next, refinements, None)) is not None:
+                stage, progress, stats = refinement
+                await websocket.send_json({ 'status': statics.StatusFunction.ONGOING.name, 'move': move, 'stage': stage,
+                                            'progress': round(progress, 3), 'guess_stats': stats, 'error': '' })
+
+        except asyncio.CancelledError:
+            raise
+
+        except WebSocketDisconnect:
+            return
+
+        except Exception as err:
+            await websocket.send_json({ 'status': statics.StatusFunction.ERROR.name, 'move': move, 'error': repr(err) })
+            return
+
+        await websocket.send_json({ 'status': statics.StatusFunction.DONE.name, 'move': move, 'error': '' })
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            move = move + 1
+
+            # The rankings of the previous move are worthless once the client played the next one
+            if refining is not None and not refining.done():
+                refining.cancel()
+
+            try:
+                stats = await loop.run_in_executor(executor, models.submit_move_heuristic, game_session,
+                                                   message['word'], message['pattern'], message.get('limit'))
+
+            except Exception as err:
+                await websocket.send_json({ 'status': statics.StatusFunction.ERROR.name, 'move': move, 'error': repr(err) })
+                continue
+
+            if not stats:
+                await websocket.send_json({ 'status': statics.StatusFunction.ERROR.name, 'move': move, 'error': f'INVALID_MOVE {message["word"]} {message["pattern"]}' })
+                continue
+
+            await websocket.send_json({ 'status': statics.StatusFunction.ONGOING.name, 'move': move, 'stage': statics.ChannelStage.STAGE_HEURISTIC.name,
+                                        'progress': 0.0, 'guess_stats': stats, 'error': '' })
+
+            refining = asyncio.create_task(refine_move(move, message.get('limit')))
+
+    except WebSocketDisconnect:
+        pass
+
+    finally:
+        if refining is not None:
+            refining.cancel()
+
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 @app.post("/submit_guess")
 async def submit_guess(session_uuid: str, word: str) -> dict[str, str]:
     try:
@@ -140,4 +358,92 @@ async def submit_guess(session_uuid: str, word: str) -> dict[str, str]:
 
     return { 'status': statics.StatusFunction.SUCCESS.name, 'pattern': pattern, 'error': '' }
 
+
+@app.post("/submit_multi_guess")
+async def submit_multi_guess(session_uuid: str, word: str) -> dict[str, str | list[str]]:
+    try:
+        if (patterns := models.submit_multi_guess(APP_SESSIONS[session_uuid], word)) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_WORD {word}' }
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'patterns': patterns, 'error': '' }
+
+
+@app.post("/get_multi_guess_stats")
+async def get_multi_guess_stats(multi_guess: models.MultiGuess) -> dict[str, str | dict]:
+    try:
+        stats = models.get_multi_guess_stats(APP_SESSIONS[multi_guess.session_uuid], multi_guess.word, multi_guess.patterns, multi_guess.limit)
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    return { 'status': statics.StatusFunction.SUCCESS.name, 'guess_stats': stats, 'error': '' }
+
+
+@app.post("/batch_solve", response_model=None)
+async def batch_solve(batch: models.BatchSolve) -> StreamingResponse | dict[str, str]:
+    try:
+        lang_launcher = APP_SOURCES.get(batch.lang.lower(), {}).get('pre_computed', {}).get(str(batch.word_lenght), {}).get('lang_launcher')
+
+        if lang_launcher is None or not lang_launcher.words_information:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'SOLVER_UNAVAILABLE {batch.lang} {batch.word_lenght}' }
+
+        if solver.get_strategy(batch.strategy) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_STRATEGY {batch.strategy}' }
+
+        if scorers.get_scorer(batch.scorer) is None:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': f'INVALID_SCORER {batch.scorer}' }
+
+        targets = models.get_batch_targets(lang_launcher, batch.targets)
+
+        if not targets:
+            return { 'status': statics.StatusFunction.ERROR.name, 'error': 'NO_VALID_TARGET' }
+
+    except Exception as err:
+        return { 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }
+
+    async def stream_results():
+        loop = asyncio.get_running_loop()
+        tic = time.perf_counter()
+
+        # Every batch shares BATCH_EXECUTOR, so MAX_BATCH_WORKERS caps the solver load server-wide
+        strategy_options = models.get_strategy_options(APP_SOURCES, batch.move_time_budget)
+
+        if batch.lockstep:
+            jobs = [submit_batch_job(loop, models.batch_simulate_words, lang_launcher, targets, batch.strategy, batch.max_tries, strategy_options, batch.scorer)]
+        else:
+            jobs = [submit_batch_job(loop, models.batch_solve_word, lang_launcher, target, batch.strategy, batch.max_tries, strategy_options, batch.scorer)
+                    for target in targets]
+
+        nb_guesses: list[int] = []
+        nb_solved = 0
+
+        try:
+            for job in asyncio.as_completed(jobs):
+                try:
+                    job_results = await job
+
+                except Exception as err:
+                    yield json.dumps({ 'status': statics.StatusFunction.ERROR.name, 'error': repr(err) }) + "\n"
+                    continue
+
+                for result in job_results if batch.lockstep else [job_results]:
+                    nb_guesses.append(result['tries'])
+                    nb_solved = nb_solved + int(result['solved'])
+
+                    yield json.dumps({ 'status': statics.StatusFunction.ONGOING.name, 'result': result, 'error': '' }) + "\n"
+
+        finally:
+            # Client went away (or the stream ended): drop every solve still waiting for a worker
+            for job in jobs:
+                job.cancel()
+
+        stats = solver.compute_batch_stats(nb_guesses, nb_solved, time.perf_counter() - tic)
+
+        yield json.dumps({ 'status': statics.StatusFunction.DONE.name, 'batch_stats': stats, 'error': '' }) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 # fastapi dev main.py
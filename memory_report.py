@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:54:07 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import json
+import inspect
+import argparse
+
+#pylint: disable=wrong-import-position, wrong-import-order
+import models
+from modules import statics, solver, memory
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+
+def simulate_sessions(app_sources: dict, nb_sessions: int, nb_guesses: int) -> dict[str, dict]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    # Sessions as the server holds them, played a few guesses in so that their pools and rankings are populated
+    game_sessions: dict[str, dict] = {}
+
+    for lang, lang_sources in app_sources.items():
+        if not isinstance(lang_sources, dict) or 'pre_computed' not in lang_sources:
+            continue
+
+        for pre_computed in lang_sources['pre_computed'].values():
+            lang_launcher = pre_computed['lang_launcher']
+
+            for _ in range(nb_sessions):
+                game_session = models.create_game_session(lang_launcher, True, statics.GameMode.GAME_MODE_ASSISTED.name)
+                game = game_session['game_session']
+                guess = solver.get_opening(lang_launcher)
+
+                for _ in range(nb_guesses):
+                    pattern = game.submit_guess(guess)
+
+                    if pattern == statics.get_solved_code(lang_launcher.word_lenght) or \
+                    (pool := game.submit_guess_and_pattern(guess, pattern)) is None:
+                        break
+
+                    guess = pool[0][0]
+
+                game_sessions[game_session['session_uuid']] = game_session
+
+            print(f"{curr_func} -- Simulated {nb_sessions} session(s) for {lang} ({lang_launcher.word_lenght} letters)")
+
+    return game_sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory footprint of the languages, caches and sessions the server would hold")
+    parser.add_argument('--sessions', type=int, default=1, help="Sessions simulated per language and lenght")
+    parser.add_argument('--guesses', type=int, default=1, help="Guesses played in each simulated session")
+    parser.add_argument('--count-rows', action='store_true', help="Count the rows of every compendium cache table")
+    args = parser.parse_args()
+
+    app_sources = models.init_app_sources()
+    game_sessions = simulate_sessions(app_sources, args.sessions, args.guesses)
+
+    report = memory.build_memory_report(app_sources, game_sessions, args.count_rows)
+    report['sessions'].pop('per_session')
+
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
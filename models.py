@@ -12,11 +12,18 @@ import time
 import uuid
 import json
 import inspect
+import base64
 import pathlib
+import sys
+
+import itertools as it
+
+from array import array
+from typing import Iterator
 from pydantic import BaseModel
 
 #pylint: disable=wrong-import-position, wrong-import-order
-from modules import statics, helpers, computing, wordle
+from modules import statics, helpers, computing, wordle, multi_wordle, solver, metrics, streaming_build, simulation, sampling
 #pylint: enable=wrong-import-position, wrong-import-order
 #===================================================================================================
 
@@ -32,29 +39,69 @@ class Config(BaseModel):
     word_lenght: int
 
 
-def init_app_sources(client: bool=False) -> dict[str, dict[str, str | pathlib.Path | dict[str, dict[str, str | pathlib.Path | int | helpers.LangLauncher]] | int] | str | int | bool]:
+class BatchSolve(BaseModel):
+    lang: str
+    word_lenght: int
+    strategy: str = statics.SolverStrategy.STRATEGY_FAST.name
+    scorer: str = statics.GuessScorer.SCORER_ENTROPY.name
+    max_tries: int = 6
+    move_time_budget: float | None = None
+    targets: list[str] | str = "all"
+    # Every target played at once (see modules/simulation.py), results come all together once the simulation is over
+    lockstep: bool = False
+
+
+class MultiGuess(BaseModel):
+    session_uuid: str
+    word: str
+    # One pattern per board, an empty one for the boards already solved
+    patterns: list[str]
+    limit: int | None = None
+
+
+def load_config() -> dict[str, str | int | float | bool | list]:
     cwd = pathlib.Path.cwd()
 
     config_file = 'config.json'
 
     with open(cwd/config_file, encoding='utf-8') as f:
-        conf: dict[str, str] = json.load(f)
+        conf: dict[str, str | int | float | bool | list] = json.load(f)
+
+    return conf
+
 
-    data_files = pathlib.Path(cwd/conf["data_folder"]).glob('*.txt')
+def get_data_files(conf: dict[str, str | int | float | bool | list]) -> tuple[list[pathlib.Path], list[pathlib.Path], list[pathlib.Path]]:
+    data_files = pathlib.Path(pathlib.Path.cwd()/conf["data_folder"]).glob('*.txt')
     lang_files: list[pathlib.Path] = []
     exhaustive_files: list[pathlib.Path] = []
+    allowed_files: list[pathlib.Path] = []
 
     for file in data_files:
         if '_' not in file.name:
             lang_files.append(file)
 
+        elif file.stem.endswith('_allowed'):
+            allowed_files.append(file)
+
         else:
             exhaustive_files.append(file)
 
+    return lang_files, exhaustive_files, allowed_files
+
+
+def init_app_sources(client: bool=False) -> dict[str, dict[str, str | pathlib.Path | dict[str, dict[str, str | pathlib.Path | int | helpers.LangLauncher]] | int] | str | int | bool]:
+    conf = load_config()
+    lang_files, exhaustive_files, allowed_files = get_data_files(conf)
+
     app_sources = helpers.init_lang_app_data(lang_files,
                                              exhaustive_files,
                                              compute_best_opening=not client if client else conf.get('compute_best_opening', False),
-                                             client=client)
+                                             client=client,
+                                             allowed_files=allowed_files,
+                                             streaming_lenghts=conf.get('streaming_build_lenghts', []),
+                                             memory_ceiling_mb=conf.get('STREAMING_MEMORY_CEILING_MB', streaming_build.DEFAULT_MEMORY_CEILING_MB),
+                                             # Deploys with artifacts built offline (precompute.py) never compute at start-up
+                                             load_only=conf.get('precomputed_only', False))
     app_sources.update(conf)
 
     game_modes = {g.name: g.value for g in statics.GameMode}
@@ -69,10 +116,13 @@ def init_lang_launcher(config: Config) -> helpers.LangLauncher:
 
 def create_game_session(lang_launcher: helpers.LangLauncher,
                         compute_best_opening: bool,
-                        game_mode: str, max_tries: int=6) -> dict[str, str | wordle.Wordle | int | list[str]]:
+                        game_mode: str, max_tries: int=6,
+                        strategy: str=statics.SolverStrategy.STRATEGY_FAST.name,
+                        strategy_options: dict[str, int | float] | None=None,
+                        scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict[str, str | wordle.Wordle | int | list[str]]:
     curr_func = inspect.currentframe().f_code.co_name
 
-    if not compute_best_opening and game_mode != statics.GameMode.GAME_MODE_PLAY.name:
+    if not compute_best_opening and game_mode not in (statics.GameMode.GAME_MODE_PLAY.name, statics.GameMode.GAME_MODE_ADVERSARIAL.name):
         return {}
 
     session_uuid = str(uuid.uuid4())
@@ -80,28 +130,69 @@ def create_game_session(lang_launcher: helpers.LangLauncher,
     print(f"{curr_func} -- Creating game_session {session_uuid}")
 
     return {'session_uuid': session_uuid,
-            'game_session': wordle.Wordle(lang_launcher),
+            'game_session': wordle.Wordle(lang_launcher, scorer, (strategy_options or {}).get('approximate_pool_size', sampling.APPROXIMATE_POOL_SIZE)),
             'game_mode': game_mode,
+            'strategy': strategy.upper(),
+            'strategy_options': strategy_options or {},
+            'scorer': scorer.upper(),
             'max_tries': max_tries,
             'current_tries': 0,
             'guesses': [],
             'patterns': [],
+            'last_guess_stats': {},
             'created_timestamp': int(time.time()),
             'last_active_timestamp': int(time.time())}
 
 
-def reset_game_session(game_session: dict[str, str | wordle.Wordle | int | list[str]], game_mode: str, max_tries: int=6) -> None:
+def create_multi_game_session(lang_launcher: helpers.LangLauncher,
+                              compute_best_opening: bool,
+                              game_mode: str, nb_boards: int=4,
+                              max_tries: int | None=None,
+                              scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict[str, str | multi_wordle.MultiWordle | int | list[str]]:
+    # The boards' words are drawn up front
+    if game_mode == statics.GameMode.GAME_MODE_ADVERSARIAL.name:
+        return {}
+
+    game_session = create_game_session(lang_launcher, compute_best_opening, game_mode,
+                                       max_tries if max_tries is not None else multi_wordle.get_default_max_tries(nb_boards),
+                                       scorer=scorer)
+
+    if not game_session:
+        return {}
+
+    # Same session as a single board one, the endpoints on the boards tell them apart with 'nb_boards'
+    game_session['game_session'] = multi_wordle.MultiWordle(lang_launcher, nb_boards, scorer)
+    game_session['nb_boards'] = game_session['game_session'].nb_boards
+
+    return game_session
+
+
+def reset_game_session(game_session: dict[str, str | wordle.Wordle | int | list[str]], game_mode: str, max_tries: int | None=None) -> bool:
+    # Same refusal as create_multi_game_session: the boards' words are drawn up front
+    if 'nb_boards' in game_session and game_mode == statics.GameMode.GAME_MODE_ADVERSARIAL.name:
+        return False
+
     game_session['game_session'].reset()
     game_session['game_mode'] = game_mode
-    game_session['max_tries'] = max_tries
+
+    # The tries the session was created with are kept unless new ones are given
+    if max_tries is not None:
+        game_session['max_tries'] = max_tries
+
     game_session['current_tries'] = 0
     game_session['guesses'] = []
     game_session['patterns'] = []
+    game_session['last_guess_stats'] = {}
     game_session['last_active_timestamp'] = int(time.time())
 
+    return True
+
 
 def get_game_session_stats(game_session: dict[str, str | wordle.Wordle | int | list[str]]) -> dict[str, str | int | list[str]]:
     return {'game_mode': game_session['game_mode'],
+            'nb_boards': game_session.get('nb_boards', 1),
+            'strategy': game_session['strategy'],
+            'scorer': game_session['scorer'],
             'max_tries': game_session['max_tries'],
             'current_tries': game_session['current_tries'],
             'guesses': game_session['guesses'],
@@ -111,49 +202,206 @@ def get_game_session_stats(game_session: dict[str, str | wordle.Wordle | int | l
 
 
 def get_word_to_guess(game_session: dict[str, str | wordle.Wordle | int | list[str]]) -> str:
+    if 'nb_boards' in game_session:
+        return ",".join("".join(chr(ord_letter) for ord_letter in board.word) for board in game_session['game_session'].boards)
+
     return "".join(chr(ord_letter) for ord_letter in game_session['game_session'].word)
 
 
 def get_guess_stats(game_session: dict[str, str | wordle.Wordle | int | list[str]],
                     word: str,
-                    pattern: str) -> dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]]]:
-    if game_session['game_mode'] == statics.GameMode.GAME_MODE_PLAY.name:
+                    pattern: str,
+                    limit: int | None=None,
+                    response_format: str=statics.ResponseFormat.FORMAT_DEFAULT.name) -> dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]]]:
+    if not submit_guess_stats(game_session, word, pattern):
         return {}
 
+    return get_guess_stats_page(game_session, 0, limit, response_format)
+
+
+def submit_guess_stats(game_session: dict[str, str | wordle.Wordle | int | list[str]],
+                       word: str,
+                       pattern: str) -> bool:
+    if game_session['game_mode'] in (statics.GameMode.GAME_MODE_PLAY.name, statics.GameMode.GAME_MODE_ADVERSARIAL.name):
+        return False
+
+    if len(pattern) != len(word):
+        return False
+
     t_word = tuple(ord(letter) for letter in word)
-    t_pattern = tuple(int(letter_status) for letter_status in statics.emoji_to_pattern(pattern))
+    t_pattern = statics.emoji_to_code(pattern)
+
+    if not game_session['game_session'].is_valid_move(t_word, t_pattern):
+        return False
+
+    # Refused moves (no pool word left) must not reach the letter extractor, or later suggestions would be skewed
+    if (pool := game_session['game_session'].submit_guess_and_pattern(t_word, t_pattern)) is None:
+        return False
 
-    pool = game_session['game_session'].submit_guess_and_pattern(t_word, t_pattern)
     game_session['game_session'].letter_extractor = computing.update_letter_extractor(game_session['game_session'].letter_extractor,
                                                                                       computing.build_letter_extractor(t_word, t_pattern))
+
+    with metrics.SUGGESTION_BUILDING_SECONDS.time(**game_session['game_session'].language_launcher.metric_labels()):
+        pool_letters, pool_letters_dupes = computing.gather_pool_letters(pool)
+        suggestions = computing.build_suggestion(game_session['game_session'].language_launcher.words_information,
+                                                 pool_letters,
+                                                 pool_letters_dupes,
+                                                 game_session['game_session'].letter_extractor)
+
+    solver_guess, _ = solver.pick_guess(game_session['game_session'], pool, t_pattern, suggestions,
+                                        game_session['strategy'], **game_session['strategy_options'])
+
+    if game_session['game_mode'] == statics.GameMode.GAME_MODE_SOLVE.name:
+        game_session['guesses'].append(word)
+        game_session['patterns'].append(pattern)
+        game_session['last_active_timestamp'] = int(time.time())
+
+    # Kept so that the following pages are served from the ranked lists without submitting the guess again
+    game_session['last_guess_stats'] = {'pool': pool,
+                                        'pool_letters': pool_letters,
+                                        'pool_letters_dupes': pool_letters_dupes,
+                                        'suggestions': suggestions,
+                                        'solver_guess': solver_guess}
+
+    return True
+
+
+def get_guess_stats_page(game_session: dict[str, str | wordle.Wordle | int | list[str]],
+                         cursor: int=0,
+                         limit: int | None=None,
+                         response_format: str=statics.ResponseFormat.FORMAT_DEFAULT.name) -> dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]] | int | None]:
+    if not (last_guess_stats := game_session.get('last_guess_stats')):
+        return {}
+
+    pool = last_guess_stats['pool']
+    suggestions = last_guess_stats['suggestions']
+
+    with metrics.RESPONSE_SERIALIZATION_SECONDS.time(response_format=response_format):
+        if response_format == statics.ResponseFormat.FORMAT_DEFAULT.name:
+            pool_words = convert_pool_words(pool, cursor, limit)
+            elimination_suggestions = convert_elimination_suggestions(suggestions, cursor, limit)
+
+        else:
+            packed = response_format == statics.ResponseFormat.FORMAT_PACKED.name
+            pool_words = convert_pool_words_columnar(pool, cursor, limit, packed)
+            elimination_suggestions = convert_elimination_suggestions_columnar(suggestions, cursor, limit, packed)
+
+        return {'pool_words': pool_words,
+                'pool_letters': convert_pool_letters(last_guess_stats['pool_letters']),
+                'pool_letters_dupes': convert_pool_letters_dupes(last_guess_stats['pool_letters_dupes']),
+                'elimination_suggestions': elimination_suggestions,
+                'information': game_session['game_session'].information,
+                'solver_guess': "".join(chr(ord_letter) for ord_letter in last_guess_stats['solver_guess']),
+                'next_cursor': get_next_cursor(max(len(pool), count_suggestions(suggestions)), cursor, limit)}
+
+
+def stream_guess_stats(game_session: dict[str, str | wordle.Wordle | int | list[str]],
+                       cursor: int=0,
+                       limit: int | None=None) -> Iterator[str]:
+    if not (last_guess_stats := game_session.get('last_guess_stats')):
+        return
+
+    yield json.dumps({'pool_letters': convert_pool_letters(last_guess_stats['pool_letters']),
+                      'pool_letters_dupes': convert_pool_letters_dupes(last_guess_stats['pool_letters_dupes']),
+                      'information': game_session['game_session'].information,
+                      'solver_guess': "".join(chr(ord_letter) for ord_letter in last_guess_stats['solver_guess'])}) + "\n"
+
+    for pool_word in iter_pool_words(last_guess_stats['pool'], cursor, limit):
+        yield json.dumps({'pool_word': pool_word}) + "\n"
+
+    for rank, suggestion in iter_elimination_suggestions(last_guess_stats['suggestions'], cursor, limit):
+        yield json.dumps({'rank': rank, 'elimination_suggestion': suggestion}) + "\n"
+
+
+def submit_move_heuristic(game_session: dict[str, str | wordle.Wordle | int | list[str]],
+                          word: str,
+                          pattern: str,
+                          limit: int | None=None) -> dict | dict[str, list | list[dict[str, float]] | list[str] | dict | dict[str, int] | dict[int, list[dict[str, float]]] | int | None]:
+    # First answer to a move of the session channel: the pool is filtered, but only ranked by letter coverage and opening scores
+    if game_session['game_mode'] in (statics.GameMode.GAME_MODE_PLAY.name, statics.GameMode.GAME_MODE_ADVERSARIAL.name):
+        return {}
+
+    if len(pattern) != len(word):
+        return {}
+
+    game = game_session['game_session']
+    t_word = tuple(ord(letter) for letter in word)
+    t_pattern = statics.emoji_to_code(pattern)
+
+    if not game.is_valid_move(t_word, t_pattern) or not game.pool_words:
+        return {}
+
+    with metrics.POOL_FILTERING_SECONDS.time(**game.language_launcher.metric_labels()):
+        pool_words = game.get_filtered_pool(t_word, t_pattern)
+
+    if not pool_words:
+        return {}
+
+    game.pool_words = pool_words
+
+    game.information = -computing.safe_log2(1.0/float(len(game.pool_words)))
+    game.letter_extractor = computing.update_letter_extractor(game.letter_extractor, computing.build_letter_extractor(t_word, t_pattern))
+
+    words_information = game.language_launcher.words_information
+    pool = computing.RankedInformation([word_information for word_information in computing.unordered_entries(words_information)
+                                        if word_information[0] in game.pool_words])
+
+    # No opening scores to rank the pool with (precomputed only, artifacts missing)
+    if not pool:
+        return {}
+
     pool_letters, pool_letters_dupes = computing.gather_pool_letters(pool)
-    suggestions = computing.build_suggestion(game_session['game_session'].language_launcher.words_information,
-                                             pool_letters,
-                                             pool_letters_dupes,
-                                             game_session['game_session'].letter_extractor)
+    suggestions = computing.build_suggestion(words_information, pool_letters, pool_letters_dupes, game.letter_extractor)
 
     if game_session['game_mode'] == statics.GameMode.GAME_MODE_SOLVE.name:
         game_session['guesses'].append(word)
         game_session['patterns'].append(pattern)
         game_session['last_active_timestamp'] = int(time.time())
 
-    return {'pool_words': convert_pool_words(pool),
-            'pool_letters': convert_pool_letters(pool_letters),
-            'pool_letters_dupes': convert_pool_letters_dupes(pool_letters_dupes),
-            'elimination_suggestions': convert_elimination_suggestions(suggestions),
-            'information': game_session['game_session'].information}
+    game_session['last_guess_stats'] = {'pool': pool,
+                                        'pool_letters': pool_letters,
+                                        'pool_letters_dupes': pool_letters_dupes,
+                                        'suggestions': suggestions,
+                                        'solver_guess': pool[0][0],
+                                        'pattern': t_pattern}
+
+    return get_guess_stats_page(game_session, 0, limit)
+
+
+def iter_move_refinements(game_session: dict[str, str | wordle.Wordle | int | list[str]],
+                          limit: int | None=None) -> Iterator[tuple[str, float, dict]]:
+    # Follows submit_move_heuristic: exact rankings after every chunk of guesses scored, then the guess of the session strategy.
+    # Every step is short, the channel stops asking for the next one as soon as the client moves again.
+    game = game_session['game_session']
+    last_guess_stats = game_session['last_guess_stats']
+
+    for progress, pool in game.iter_guesses_information():
+        last_guess_stats['pool'] = pool
+        last_guess_stats['solver_guess'] = solver.best_allowed_guess(game, pool)
+
+        yield statics.ChannelStage.STAGE_EXACT.name, progress, get_guess_stats_page(game_session, 0, limit)
+
+    last_guess_stats['solver_guess'], _ = solver.pick_guess(game, last_guess_stats['pool'], last_guess_stats['pattern'], last_guess_stats['suggestions'],
+                                                            game_session['strategy'], **game_session['strategy_options'])
+
+    yield statics.ChannelStage.STAGE_SOLVER.name, 1.0, get_guess_stats_page(game_session, 0, limit)
 
 
 def submit_guess(game_session: dict[str, str | wordle.Wordle | int | list[str]], word: str) -> str | None:
     if game_session['current_tries'] >= game_session['max_tries']:
         return None
 
-    t_pattern = game_session['game_session'].submit_guess(tuple(ord(letter) for letter in word))
+    t_word = tuple(ord(letter) for letter in word)
+
+    if game_session['game_mode'] == statics.GameMode.GAME_MODE_ADVERSARIAL.name:
+        t_pattern = game_session['game_session'].submit_guess_adversarial(t_word)
+    else:
+        t_pattern = game_session['game_session'].submit_guess(t_word)
 
-    if not t_pattern or t_pattern is None:
+    if t_pattern is None:
         return None
 
-    pattern = statics.pattern_to_emoji(t_pattern)
+    pattern = statics.code_to_emoji(t_pattern, len(word))
 
     game_session['guesses'].append(word)
     game_session['patterns'].append(pattern)
@@ -163,8 +411,205 @@ def submit_guess(game_session: dict[str, str | wordle.Wordle | int | list[str]],
     return pattern
 
 
-def convert_pool_words(pool: list | list[tuple[tuple[int, ...], float]]) -> list | list[dict[str, float]]:
-    return [{"".join(chr(ord_letter) for ord_letter in suggestion): round(information, 5)} for suggestion, information in pool]
+def submit_multi_guess(game_session: dict[str, str | multi_wordle.MultiWordle | int | list[str]], word: str) -> list[str] | None:
+    if game_session['current_tries'] >= game_session['max_tries'] or game_session['game_session'].is_over():
+        return None
+
+    t_patterns = game_session['game_session'].submit_guess(tuple(ord(letter) for letter in word))
+
+    if t_patterns is None:
+        return None
+
+    patterns = [statics.code_to_emoji(t_pattern, len(word)) if t_pattern is not None else "" for t_pattern in t_patterns]
+
+    game_session['guesses'].append(word)
+    # One entry per guess, as on a single board: the boards' patterns joined like the words to guess
+    game_session['patterns'].append(",".join(patterns))
+    game_session['current_tries'] = game_session['current_tries'] + 1
+    game_session['last_active_timestamp'] = int(time.time())
+
+    return patterns
+
+
+def get_multi_guess_stats(game_session: dict[str, str | multi_wordle.MultiWordle | int | list[str]],
+                          word: str,
+                          patterns: list[str],
+                          limit: int | None=None) -> dict | dict[str, list[dict[str, bool | int | float | list[str]]] | list[dict[str, float]] | str]:
+    if game_session['game_mode'] == statics.GameMode.GAME_MODE_PLAY.name:
+        return {}
+
+    if any(pattern and len(pattern) != len(word) for pattern in patterns):
+        return {}
+
+    game = game_session['game_session']
+    t_word = tuple(ord(letter) for letter in word)
+    t_patterns = [statics.emoji_to_code(pattern) if pattern else None for pattern in patterns]
+
+    if (guesses_information := game.submit_guess_and_patterns(t_word, t_patterns)) is None:
+        return {}
+
+    solver_guess = multi_wordle.best_boards_guess(game)
+
+    if game_session['game_mode'] == statics.GameMode.GAME_MODE_SOLVE.name:
+        game_session['guesses'].append(word)
+        game_session['patterns'].append(",".join(patterns))
+        game_session['last_active_timestamp'] = int(time.time())
+
+    return {'boards': [{'solved': solved,
+                        'pool_size': len(board.pool_words),
+                        'information': board.information if not solved else 0.0,
+                        'pool_words': ["".join(chr(ord_letter) for ord_letter in pool_word) for pool_word in sorted(board.pool_words)[:limit]]}
+                       for board, solved in zip(game.boards, game.solved)],
+            'guesses_information': list(iter_pool_words(guesses_information, 0, limit)),
+            'solver_guess': "".join(chr(ord_letter) for ord_letter in solver_guess)}
+
+
+def get_strategy_options(app_sources: dict, move_time_budget: float | None=None) -> dict[str, int | float]:
+    return {'top_k': app_sources.get('LOOKAHEAD_TOP_K', solver.LOOKAHEAD_TOP_K),
+            'time_budget': move_time_budget if move_time_budget is not None else app_sources.get('MOVE_TIME_BUDGET_SECONDS', solver.LOOKAHEAD_TIME_BUDGET),
+            'approximate_pool_size': app_sources.get('APPROXIMATE_POOL_SIZE', sampling.APPROXIMATE_POOL_SIZE)}
+
+
+def get_batch_targets(lang_launcher: helpers.LangLauncher, targets: list[str] | str) -> list | list[tuple[int, ...]]:
+    if isinstance(targets, str):
+        if targets.lower() != "all":
+            return []
+
+        return sorted(lang_launcher.words)
+
+    t_targets = [tuple(ord(letter) for letter in word.lower()) for word in targets]
+
+    return [t_target for t_target in dict.fromkeys(t_targets) if t_target in lang_launcher.words]
+
+
+def batch_solve_word(lang_launcher: helpers.LangLauncher, word: tuple[int, ...],
+                     strategy: str, max_tries: int=6,
+                     strategy_options: dict[str, int | float] | None=None,
+                     scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict[str, str | list[str] | int | bool | float]:
+    result = solver.solve_word(lang_launcher, word, solver.get_strategy(strategy), max_tries, scorer=scorer, **(strategy_options or {}))
+
+    return convert_solve_result(word, result, result['duration'])
+
+
+def batch_simulate_words(lang_launcher: helpers.LangLauncher, words: list[tuple[int, ...]],
+                         strategy: str, max_tries: int=6,
+                         strategy_options: dict[str, int | float] | None=None,
+                         scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> list[dict[str, str | list[str] | int | bool | float]]:
+    tic = time.perf_counter()
+    results = simulation.simulate_targets(lang_launcher, words, solver.get_strategy(strategy), max_tries, scorer=scorer, **(strategy_options or {}))
+    tac = time.perf_counter() - tic
+
+    # Targets are played together, each one is given an even share of the whole simulation
+    return [convert_solve_result(word, results[word], tac / len(results)) for word in words if word in results]
+
+
+def convert_solve_result(word: tuple[int, ...], result: dict[str, list[tuple[int, ...]] | list[int] | int | bool | float],
+                         duration: float) -> dict[str, str | list[str] | int | bool | float]:
+    return {'target': "".join(chr(ord_letter) for ord_letter in word),
+            'guesses': ["".join(chr(ord_letter) for ord_letter in guess) for guess in result['guesses']],
+            'patterns': [statics.code_to_emoji(pattern, len(word)) for pattern in result['patterns']],
+            'tries': result['tries'],
+            'solved': result['solved'],
+            'suggestion_used': result['suggestion_used'],
+            'duration': round(duration, 5)}
+
+
+def get_next_cursor(nb_entries: int, cursor: int=0, limit: int | None=None) -> int | None:
+    if limit is None or cursor + limit >= nb_entries:
+        return None
+
+    return cursor + limit
+
+
+def count_suggestions(suggestions: list[list[tuple[tuple[int, ...], float]]]) -> int:
+    return sum(len(ranked_suggestions) for ranked_suggestions in suggestions if ranked_suggestions)
+
+
+def iter_pool_words(pool: list | list[tuple[tuple[int, ...], float]],
+                    cursor: int=0, limit: int | None=None) -> Iterator[dict[str, float]]:
+    stop = None if limit is None else cursor + limit
+
+    # Slicing a computing.RankedInformation only ranks what the page needs
+    for suggestion, information in pool[cursor:stop]:
+        yield {"".join(chr(ord_letter) for ord_letter in suggestion): round(information, 5)}
+
+
+def iter_ranked_pages(suggestions: list[list[tuple[tuple[int, ...], float]]],
+                      cursor: int=0, limit: int | None=None) -> Iterator[tuple[int, list[tuple[tuple[int, ...], float]]]]:
+    # Highest ranks first: those are the words testing the most unknown letters, thus the ones worth a page
+    for rank in range(len(suggestions) - 1, -1, -1):
+        if limit is not None and limit <= 0:
+            return
+
+        if not suggestions[rank]:
+            continue
+
+        if cursor >= len(suggestions[rank]):
+            cursor = cursor - len(suggestions[rank])
+            continue
+
+        stop = None if limit is None else cursor + limit
+        page = suggestions[rank][cursor:stop]
+
+        yield rank + 1, page
+
+        cursor = 0
+        limit = None if limit is None else limit - len(page)
+
+
+def iter_elimination_suggestions(suggestions: list[list[tuple[tuple[int, ...], float]]],
+                                 cursor: int=0, limit: int | None=None) -> Iterator[tuple[int, dict[str, float]]]:
+    for rank, page in iter_ranked_pages(suggestions, cursor, limit):
+        for suggestion, information in page:
+            yield rank, {"".join(chr(ord_letter) for ord_letter in suggestion): round(information, 5)}
+
+
+def pack_scores(scores: list[float]) -> str:
+    packed_scores = array('f', scores)
+
+    # Little endian float32, whatever the server is running on
+    if sys.byteorder != 'little':
+        packed_scores.byteswap()
+
+    return base64.b64encode(packed_scores.tobytes()).decode('ascii')
+
+
+def convert_columns(entries: list[tuple[tuple[int, ...], float]], packed: bool=False) -> dict[str, list[str] | list[float] | str]:
+    # Words are ASCII folded (see helpers.get_words_list), bytes() turns them back without a chr() per letter
+    words = [bytes(word).decode('ascii') for word, _ in entries]
+    scores = [information for _, information in entries]
+
+    if packed:
+        # Every word has the same lenght, no separator needed
+        return {'words': "".join(words), 'scores': pack_scores(scores)}
+
+    return {'words': words, 'scores': list(map(round, scores, it.repeat(5)))}
+
+
+def convert_pool_words_columnar(pool: list | list[tuple[tuple[int, ...], float]],
+                                cursor: int=0, limit: int | None=None, packed: bool=False) -> dict[str, list[str] | list[float] | str]:
+    stop = None if limit is None else cursor + limit
+
+    return convert_columns(pool[cursor:stop], packed)
+
+
+def convert_elimination_suggestions_columnar(suggestions: list[list[tuple[tuple[int, ...], float]]],
+                                             cursor: int=0, limit: int | None=None, packed: bool=False) -> dict[str, list[int] | list[str] | list[float] | str]:
+    ranks: list[int] = []
+    counts: list[int] = []
+    entries: list[tuple[tuple[int, ...], float]] = []
+
+    for rank, page in iter_ranked_pages(suggestions, cursor, limit):
+        ranks.append(rank)
+        counts.append(len(page))
+        entries.extend(page)
+
+    return {'ranks': ranks, 'counts': counts} | convert_columns(entries, packed)
+
+
+def convert_pool_words(pool: list | list[tuple[tuple[int, ...], float]],
+                       cursor: int=0, limit: int | None=None) -> list | list[dict[str, float]]:
+    return list(iter_pool_words(pool, cursor, limit))
 
 
 def convert_pool_letters(pool_letters: set[int]) -> list | list[str]:
@@ -172,20 +617,18 @@ def convert_pool_letters(pool_letters: set[int]) -> list | list[str]:
 
 
 def convert_pool_letters_dupes(pool_letters_dupes: dict[int, int]) -> dict | dict[str, int]:
-    return {str(key): val for key, val in pool_letters_dupes}
+    return {chr(key): val for key, val in pool_letters_dupes.items()}
 
 
-def convert_elimination_suggestions(suggestions: list[list[tuple[tuple[int, ...], float]]]) -> dict | dict[int, list[dict[str, float]]]:
+def convert_elimination_suggestions(suggestions: list[list[tuple[tuple[int, ...], float]]],
+                                    cursor: int=0, limit: int | None=None) -> dict | dict[int, list[dict[str, float]]]:
     elimination_suggestions: dict[int, list[dict[str, float]]] = {}
 
-    for rank, ranked_suggestions in enumerate(suggestions):
-        if ranked_suggestions:
-            temp_suggs = [{"".join(chr(ord_letter) for ord_letter in suggestion): round(information, 5)} for suggestion, information in ranked_suggestions]
-
-            if elimination_suggestions.get(rank+1) is None:
-                elimination_suggestions[rank+1] = [temp_suggs]
-                continue
+    for rank, suggestion in iter_elimination_suggestions(suggestions, cursor, limit):
+        if elimination_suggestions.get(rank) is None:
+            elimination_suggestions[rank] = [[suggestion]]
+            continue
 
-            elimination_suggestions[rank+1].append(temp_suggs)
+        elimination_suggestions[rank][0].append(suggestion)
 
     return elimination_suggestions
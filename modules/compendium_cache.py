@@ -22,6 +22,8 @@ from typing import Any
 
 __version__ = '0.1.0'
 
+SPARSE_TABLE_NAME = "compendium"
+
 
 def try_process_to_str_or_null_str(val: None | str | Any) -> str:
     curr_func = inspect.currentframe().f_code.co_name
@@ -40,6 +42,14 @@ def try_process_to_str_or_null_str(val: None | str | Any) -> str:
         return 'NULL'
 
 
+def get_table_name(table_name: str | int | tuple[int, ...]) -> str:
+    # Patterns are stored under their integer code, tuples are only joined for callers still using them
+    if isinstance(table_name, tuple):
+        return "".join(str(letter) for letter in table_name)
+
+    return str(table_name)
+
+
 class CacheDB:
     def __init__(self, db_file_path: str | pathlib.Path, table_names: set[str] | set[int] | set[tuple[int, ...]]=None, **kwargs: str) -> None:
         curr_func = inspect.currentframe().f_code.co_name
@@ -55,13 +65,20 @@ class CacheDB:
         self.lock = Lock()
         self.db = sqlite3.connect(self.db_path, timeout=3.0, isolation_level=None, check_same_thread=False)
 
+        # Names of the existing tables, read once: a look up does not scan sqlite_master, whatever the number of tables
+        self.existing_tables: set[str] = set()
+        self._load_existing_tables()
+
         if self.table_names is not None:
             try:
                 with self.lock:
                     with self.db:
-                        if all(not self._check_table(table_name) for table_name in self.table_names):
+                        # Only the tables already there are checked, long words have tens of thousands of patterns
+                        if all(not self._check_table(table_name) for table_name in self.table_names if get_table_name(table_name) in self.existing_tables):
                             print(f"{curr_func} -- Either database is corrupted or newly created...")
 
+                        # One transaction for every table instead of one (and a sync) per table
+                        self.db.execute('BEGIN')
                         for table_name in self.table_names:
                             self._create_table(table_name)
 
@@ -98,10 +115,7 @@ class CacheDB:
     def _check_table(self, table_name: str | int | tuple[int, ...]) -> bool:
         curr_func = inspect.currentframe().f_code.co_name
 
-        if isinstance(table_name, tuple):
-            table_name = "".join(str(letter) for letter in table_name)
-        else:
-            table_name = str(table_name)
+        table_name = get_table_name(table_name)
 
         try:
             # https://docs.python.org/3/library/sqlite3.html#sqlite3-howto-row-factory
@@ -123,28 +137,20 @@ class CacheDB:
         return False
 
 
-    def _check_table_exists(self, table_name: str | int | tuple[int, ...]) -> bool:
+    def _load_existing_tables(self) -> None:
         curr_func = inspect.currentframe().f_code.co_name
 
-        if isinstance(table_name, tuple):
-            table_name = "".join(str(letter) for letter in table_name)
-        else:
-            table_name = str(table_name)
-
         try:
             with self.lock:
-                # https://docs.python.org/3/library/sqlite3.html#sqlite3-howto-row-factory
-                self.db.row_factory = sqlite3.Row
                 with self.db:
-                    cursor: list[sqlite3.Row] = list(self.db.execute('SELECT name FROM sqlite_master WHERE type="table"'))
-
-                # https://stackoverflow.com/questions/70148120/reset-row-factory-attribute-of-an-python-sqlite3-object
-                self.db.row_factory = None
-                return table_name in [ row[key] for row in cursor for key in row.keys() ]
+                    self.existing_tables = {row[0] for row in self.db.execute('SELECT name FROM sqlite_master WHERE type="table"')}
 
         except Exception as err:
-            print(f"{curr_func} -- Failed to check if {table_name} table exists: {repr(err)}")
-            return False
+            print(f"{curr_func} -- Failed to list tables: {repr(err)}")
+
+
+    def _check_table_exists(self, table_name: str | int | tuple[int, ...]) -> bool:
+        return get_table_name(table_name) in self.existing_tables
 
 
     def _create_table(self, table_name: str | int | tuple[int, ...]) -> None:
@@ -152,15 +158,13 @@ class CacheDB:
 
         data_types = tuple('{} {}'.format(key, val if val.split(' ', maxsplit=1)[0] in ('INTEGER', 'REAL', 'TEXT', 'BLOB') else 'TEXT') for (key, val) in self.columns.items())
 
-        if isinstance(table_name, tuple):
-            table_name = "".join(str(letter) for letter in table_name)
-        else:
-            table_name = str(table_name)
+        table_name = get_table_name(table_name)
 
         # print(f"{curr_func} -- Creating table {table_name} with dtypes {data_types}")
 
         try:
             self.db.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({", ".join(data_types)})')
+            self.existing_tables.add(table_name)
 
         except Exception as err:
             print(f"{curr_func} -- Failed to CREATE TABLE {table_name}: {repr(err)}")
@@ -183,10 +187,7 @@ class CacheDB:
     def add_entries(self, table_name: str | int | tuple[int, ...], **kwargs: list[str]) -> bool:
         curr_func = inspect.currentframe().f_code.co_name
 
-        if isinstance(table_name, tuple):
-            table_name = "".join(str(letter) for letter in table_name)
-        else:
-            table_name = str(table_name)
+        table_name = get_table_name(table_name)
 
         if not self._check_table_exists(table_name):
             return False
@@ -233,13 +234,11 @@ class CacheDB:
     def get_entries(self, table_name: str | int | tuple[int, ...], columns: set[str] | tuple[str, ...]=(), constraints: str="", **kwargs) -> list[dict[str, int | float | str]]:
         curr_func = inspect.currentframe().f_code.co_name
 
-        if isinstance(table_name, tuple):
-            table_name = "".join(str(letter) for letter in table_name)
-        else:
-            table_name = str(table_name)
+        table_name = get_table_name(table_name)
 
+        # Only the patterns that occur get a table, any other one has no entry
         if not self._check_table_exists(table_name):
-            return False
+            return []
 
         cols = ','.join(col for col in columns if self._is_valid_column(col))
         if not cols:
@@ -269,3 +268,36 @@ class CacheDB:
             return []
 
         return [ { key: row[key] for key in row.keys() } for row in cursor ]
+
+
+class SparseCacheDB(CacheDB):
+    # Every pattern in a single table, indexed by its (integer) code: long words have tens of thousands of patterns,
+    # each sharing only a few couples, a table apiece makes the schema (and every CREATE TABLE) grow with them
+    def __init__(self, db_file_path: str | pathlib.Path, table_names: set[str] | set[int] | set[tuple[int, ...]]=None, **kwargs: str) -> None:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        super().__init__(db_file_path, None, pattern="INTEGER", **kwargs)
+        self.table_names = table_names
+
+        try:
+            with self.lock:
+                with self.db:
+                    self._create_table(SPARSE_TABLE_NAME)
+                    self.db.execute(f'CREATE INDEX IF NOT EXISTS "{SPARSE_TABLE_NAME}_pattern" ON "{SPARSE_TABLE_NAME}" (pattern)')
+
+        except Exception as err:
+            print(f"{curr_func} -- Failed to create db: {repr(err)}")
+
+
+    def _check_table_exists(self, table_name: str | int | tuple[int, ...]) -> bool:
+        return SPARSE_TABLE_NAME in self.existing_tables
+
+
+    def add_entries(self, table_name: str | int | tuple[int, ...], **kwargs: list[str]) -> bool:
+        nbr_entries = len(next(iter(kwargs.values()), []))
+
+        return super().add_entries(SPARSE_TABLE_NAME, pattern=[int(table_name)]*nbr_entries, **kwargs)
+
+
+    def get_entries(self, table_name: str | int | tuple[int, ...], columns: set[str] | tuple[str, ...]=(), constraints: str="", **kwargs) -> list[dict[str, int | float | str]]:
+        return super().get_entries(SPARSE_TABLE_NAME, columns, constraints, pattern=int(table_name), **kwargs)
@@ -10,11 +10,17 @@ Created on Wed May 15 15:10:51 2024
 #===================================================================================================
 import inspect
 
+import time
 import math
+import heapq
 
 from collections import Counter
+from collections.abc import Sequence
+from typing import Callable
 from copy import deepcopy
-from multiprocessing import Process, managers, Manager, cpu_count
+from operator import itemgetter
+from multiprocessing import Process, Value, managers, Manager, cpu_count
+from multiprocessing.sharedctypes import Synchronized
 
 #pylint: disable=wrong-import-position, wrong-import-order
 from modules import statics
@@ -23,29 +29,113 @@ from modules import statics
 
 __version__ = '0.1.0'
 
+# Guess rows between two progress updates of a compendium worker, seconds between two progress reports
+COMPENDIUM_PROGRESS_STEP = 64
+COMPENDIUM_PROGRESS_INTERVAL = 5.0
 
-def compute_pattern(guess: tuple[int, ...], word: tuple[int, ...]) -> tuple | tuple[int, ...]:
-    pattern = [statics.StatusLetter.MISS.value] * len(word)
+# Digits of a pattern code, read once rather than through the enum for every couple
+EXACT_DIGIT = statics.StatusLetter.EXACT.value
+MISPLACED_DIGIT = statics.StatusLetter.MISPLACED.value
+
+
+# Words information ranked by decreasing information, lazily:
+# only the best entries asked for are selected (heap based), the full sort happens once, when something past them is required
+class RankedInformation(Sequence):
+    def __init__(self, words_information: list | list[tuple[tuple[int, ...], float]]) -> None:
+        self.entries: list[tuple[tuple[int, ...], float]] = list(words_information)
+        self.ranked: list[tuple[tuple[int, ...], float]] = []
+        self.fully_ranked = False
+
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+    def __iter__(self):
+        return iter(self.rank_all())
+
+
+    def __getitem__(self, idx: int | slice) -> tuple[tuple[int, ...], float] | list[tuple[tuple[int, ...], float]]:
+        if isinstance(idx, slice):
+            if idx.stop is None or idx.stop < 0 or (idx.start or 0) < 0:
+                return self.rank_all()[idx]
+
+            return self.top(idx.stop)[idx]
+
+        if idx < 0:
+            return self.rank_all()[idx]
+
+        if idx >= len(self.entries):
+            raise IndexError(idx)
+
+        return self.top(idx + 1)[idx]
+
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.entries)} entries, {len(self.ranked)} ranked)"
+
+
+    def unordered(self) -> list[tuple[tuple[int, ...], float]]:
+        return self.entries
+
+
+    def top(self, k: int) -> list | list[tuple[tuple[int, ...], float]]:
+        if self.fully_ranked or k <= len(self.ranked):
+            return self.ranked[:k]
+
+        # Grows geometrically so that walking down the ranking does not pay a heap selection per step
+        k = max(k, 2*len(self.ranked))
+
+        if k >= len(self.entries) // 2:
+            return self.rank_all()[:k]
+
+        # Same order as sorted(..., reverse=True), ties included
+        self.ranked = heapq.nlargest(k, self.entries, key=itemgetter(1))
+
+        return self.ranked
+
+
+    def rank_all(self) -> list | list[tuple[tuple[int, ...], float]]:
+        if not self.fully_ranked:
+            self.ranked = sorted(self.entries, key=itemgetter(1), reverse=True)
+            self.fully_ranked = True
+
+        return self.ranked
+
+
+def unordered_entries(words_information: RankedInformation | list[tuple[tuple[int, ...], float]]) -> list[tuple[tuple[int, ...], float]]:
+    if isinstance(words_information, RankedInformation):
+        return words_information.unordered()
+
+    return words_information
+
+
+def compute_pattern(guess: tuple[int, ...], word: tuple[int, ...]) -> int:
+    # The code is summed digit by digit (status * 3**position), MISS digits are 0 and add nothing
+    powers = statics.get_pattern_powers(len(word))
     temp_guess = list(guess)
+    code = 0
 
     for w_cptr, w_letter in enumerate(word):
         if w_letter == guess[w_cptr]:
-            pattern[w_cptr] = statics.StatusLetter.EXACT.value
+            # The position may already hold the MISPLACED digit of an earlier letter, EXACT replaces it
+            code = code + (EXACT_DIGIT - MISPLACED_DIGIT if temp_guess[w_cptr] == -1 else EXACT_DIGIT)*powers[w_cptr]
             temp_guess[w_cptr] = -1
 
         else:
-            if temp_guess.count(w_letter) == 0:
+            if w_letter not in temp_guess:
                 continue
 
             idx = temp_guess.index(w_letter)
-            pattern[idx] = statics.StatusLetter.MISPLACED.value
+            code = code + MISPLACED_DIGIT*powers[idx]
             temp_guess[idx] = -1
 
-    return tuple(pattern)
+    return code
 
 
-def build_letter_extractor(guess: tuple[int, ...], pattern: tuple[int, ...]) -> dict[str, dict] | dict[str, dict[int, int]]:
+def build_letter_extractor(guess: tuple[int, ...], pattern: int) -> dict[str, dict] | dict[str, dict[int, int]]:
     extractor: dict[str, dict] | dict[str, dict[str, int]] = {"incl": {}, "excl": {}}
+    pattern = statics.code_to_pattern(pattern, len(guess))
 
     for pos, letter in enumerate(guess):
         if pattern[pos] != statics.StatusLetter.MISS.value:
@@ -78,7 +168,7 @@ def gather_pool_letters(pool_words: list[tuple[tuple[int, ...], float]]) -> tupl
     pool_letters = set()
     dupes: dict[int, int] = {}
 
-    for word in pool_words:
+    for word in unordered_entries(pool_words):
         unique_letters = set(word[0])
         pool_letters.update(unique_letters)
 
@@ -93,7 +183,7 @@ def gather_pool_letters(pool_words: list[tuple[tuple[int, ...], float]]) -> tupl
 def build_suggestion(pool_words_information: list[tuple[tuple[int, ...], float]],
                      pool_letters: set[int],
                      pool_letters_dupes: dict[str, int],
-                     letter_extractor: dict[str, dict[int, int]]) -> list[list] | list[list[tuple[tuple[int, ...], float]]]:
+                     letter_extractor: dict[str, dict[int, int]]) -> list[RankedInformation | None]:
     known_letters = set()
 
     for letter in letter_extractor["incl"]:
@@ -111,9 +201,9 @@ def build_suggestion(pool_words_information: list[tuple[tuple[int, ...], float]]
         known_letters.add(letter)
 
     unknown_letters = pool_letters.difference(known_letters)
-    suggestions: list[list[tuple[tuple[int, ...], float]]] = [None]*(len(pool_words_information[0][0])+1)
+    suggestions: list[RankedInformation | None] = [None]*(len(unordered_entries(pool_words_information)[0][0])+1)
 
-    for word_information in pool_words_information:
+    for word_information in unordered_entries(pool_words_information):
         nb_letters_in_common = len(set(word_information[0]).intersection(unknown_letters))
 
         if suggestions[nb_letters_in_common] is None:
@@ -124,7 +214,7 @@ def build_suggestion(pool_words_information: list[tuple[tuple[int, ...], float]]
 
     for idx, sugg_letters_in_common in enumerate(suggestions):
         if sugg_letters_in_common:
-            suggestions[idx] = sorted(sugg_letters_in_common, key = lambda x: x[-1], reverse=True)
+            suggestions[idx] = RankedInformation(sugg_letters_in_common)
 
     return suggestions
 
@@ -133,6 +223,76 @@ def safe_log2(x: int | float) -> int | float:
     return math.log2(x) if x > 0 else 0
 
 
+def compute_partition_entropy(bucket_sizes: list[int] | tuple[int, ...], nbr_words: int) -> float:
+    return -sum((bucket_size / nbr_words) * safe_log2(bucket_size / nbr_words) for bucket_size in bucket_sizes)
+
+
+def compute_patterns_table(guesses: list[tuple[int, ...]], pool_words: list[tuple[int, ...]]) -> dict[tuple[int, ...], dict[tuple[int, ...], int]]:
+    # Every (guess, word) pattern computed once, partitions of any sub pool are then plain look-ups
+    return {guess: {word: compute_pattern(guess=guess, word=word) for word in pool_words} for guess in guesses}
+
+
+def compute_partition(guess_patterns: dict[tuple[int, ...], int], pool_words: list[tuple[int, ...]]) -> dict[int, list[tuple[int, ...]]]:
+    partition: dict[int, list[tuple[int, ...]]] = {}
+
+    for word in pool_words:
+        partition.setdefault(guess_patterns[word], []).append(word)
+
+    return partition
+
+
+def compute_lookahead_guess(pool_words_information: list[tuple[tuple[int, ...], float]],
+                            top_k: int=10, time_budget: float=1.0) -> tuple[int, ...]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    deadline = time.perf_counter() + time_budget
+
+    # Only the best top_k one step guesses are candidates, for both plies
+    candidates = [word for word, _ in pool_words_information[:top_k]]
+    pool_words = [word for word, _ in unordered_entries(pool_words_information)]
+    nbr_words = len(pool_words)
+
+    if nbr_words <= 2:
+        return candidates[0]
+
+    patterns_table = compute_patterns_table(candidates, pool_words)
+
+    best_guess, best_information = candidates[0], -1.0
+    cptr_evaluated = 0
+
+    for guess in candidates:
+        partition = compute_partition(patterns_table[guess], pool_words)
+        information = compute_partition_entropy([len(bucket) for bucket in partition.values()], nbr_words)
+
+        for bucket in partition.values():
+            if len(bucket) <= 1:
+                continue
+
+            # Checked before a bucket rather than after, so a guess whose last bucket ends past the deadline still counts
+            if time.perf_counter() > deadline:
+                break
+
+            # Expected information of the best second guess, weighted by the odds of landing in that bucket
+            best_next = max(compute_partition_entropy(list(Counter(patterns_table[next_guess][word] for word in bucket).values()), len(bucket))
+                            for next_guess in candidates)
+            information = information + (len(bucket) / nbr_words) * best_next
+
+        else:
+            cptr_evaluated = cptr_evaluated + 1
+
+            if information > best_information:
+                best_guess, best_information = guess, information
+
+            continue
+
+        # Out of time budget: the guess being evaluated is dropped, the best fully evaluated one is kept
+        break
+
+    print(f"{curr_func} -- Evaluated {cptr_evaluated}/{len(candidates)} candidates, best expects {round(best_information, 2)} bit(s) over two guesses")
+
+    return best_guess
+
+
 def prepare_worker_datas(pool_words: set[tuple[int, ...]], threads: int=0) -> tuple[list[list[tuple[int, ...]]], managers.DictProxy, list[Process]]:
     if not 0 < threads <= cpu_count():
         threads = cpu_count()
@@ -153,10 +313,10 @@ def prepare_worker_datas(pool_words: set[tuple[int, ...]], threads: int=0) -> tu
 #####################################
 
 
-def build_pattern_compendium(pool_words: set[tuple[int, ...]]) -> dict | dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]]:
+def build_pattern_compendium(pool_words: set[tuple[int, ...]]) -> dict | dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]:
     pool_words_pile: set[tuple[int, ...]] = deepcopy(pool_words)
 
-    pattern_compendium: dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
+    pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
 
     while pool_words_pile:
         word_piled = pool_words_pile.pop()
@@ -177,8 +337,108 @@ def build_pattern_compendium(pool_words: set[tuple[int, ...]]) -> dict | dict[tu
     return pattern_compendium
 
 
-def compute_word_counter_by_pattern(pattern_compendium: dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]]) -> dict[tuple[int, ...], dict[tuple[int, ...], int]]:
-    word_counter_by_pattern: dict[tuple[int, ...], dict[tuple[int, ...], int]] = {}
+def build_pattern_compendium_delta(pool_words: set[tuple[int, ...]], new_words: set[tuple[int, ...]]) -> dict | dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]:
+    # Only the couples involving a new word (pool_words already includes them), in both directions as build_pattern_compendium does
+    delta_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
+
+    for new_word in new_words:
+        for word in pool_words:
+
+            if word == new_word:
+                continue
+
+            couple = tuple(sorted([new_word, word]))
+            delta_compendium.setdefault(compute_pattern(guess=new_word, word=word), set()).add(couple)
+            delta_compendium.setdefault(compute_pattern(guess=word, word=new_word), set()).add(couple)
+
+    return delta_compendium
+
+
+def merge_pattern_compendium(pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]],
+                             delta_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]) -> dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]:
+    for pattern, couples in delta_compendium.items():
+        pattern_compendium.setdefault(pattern, set()).update(couples)
+
+    return pattern_compendium
+
+
+def build_pattern_compendium_worker(guesses_chunk: list[tuple[int, ...]], pool_words: list[tuple[int, ...]],
+                                    chunk_idx: int, progress: Synchronized, return_dict_compendium: managers.DictProxy) -> None:
+    # Every guess row of the chunk against the whole pool, the same couples build_pattern_compendium gives for these guesses
+    pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
+
+    for cptr, guess in enumerate(guesses_chunk, 1):
+        for word in pool_words:
+
+            if word == guess:
+                continue
+
+            couple = (guess, word) if guess < word else (word, guess)
+            pattern = compute_pattern(guess=guess, word=word)
+
+            if pattern not in pattern_compendium:
+                pattern_compendium[pattern] = {couple}
+                continue
+
+            pattern_compendium[pattern].add(couple)
+
+        if cptr % COMPENDIUM_PROGRESS_STEP == 0 or cptr == len(guesses_chunk):
+            with progress.get_lock():
+                progress.value = progress.value + (cptr - 1) % COMPENDIUM_PROGRESS_STEP + 1
+
+    return_dict_compendium[chunk_idx] = pattern_compendium
+
+
+def build_pattern_compendium_faster(pool_words: set[tuple[int, ...]], threads: int=0,
+                                    progress_interval: float=COMPENDIUM_PROGRESS_INTERVAL) -> dict | dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
+    pool_words_chunked, return_dict_compendium, jobs = prepare_worker_datas(pool_words, threads)
+    pool_words = list(pool_words)
+    nbr_words = len(pool_words)
+    progress = Value('Q', 0)
+
+    tic = time.perf_counter()
+
+    # Guess rows are split across the workers, each one hands its partial compendium over through the shared dict
+    for chunk_idx, pool_words_chunk in enumerate(pool_words_chunked):
+        jobs.append(Process(target=build_pattern_compendium_worker,
+                            args=(pool_words_chunk, pool_words, chunk_idx, progress, return_dict_compendium)))
+        jobs[-1].start()
+
+    for process in jobs:
+        while process.is_alive():
+            process.join(progress_interval)
+
+            done = progress.value
+            elapsed = time.perf_counter() - tic
+            throughput = done*(nbr_words - 1) / elapsed if elapsed > 0 else 0.0
+            eta = (nbr_words - done)*(nbr_words - 1) / throughput if throughput > 0 else math.inf
+
+            print(f"{curr_func} -- {done}/{nbr_words} guess rows ({round(100*done/nbr_words, 1)}%) -- "
+                  f"{round(throughput)} patterns/s -- ETA {round(eta, 1)} second(s)")
+
+    tac_patterns = time.perf_counter() - tic
+
+    try:
+        for chunk_idx in range(len(pool_words_chunked)):
+            merge_pattern_compendium(pattern_compendium, return_dict_compendium[chunk_idx])
+
+    except Exception as err:
+        print(f"{curr_func} -- Something went wrong: {repr(err)}")
+        return {}
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Computed {nbr_words*(nbr_words - 1)} patterns with {len(jobs)} worker(s) in {round(tac_patterns, 2)} second(s) "
+          f"({round(nbr_words*(nbr_words - 1) / tac_patterns) if tac_patterns > 0 else 0} patterns/s), merged in {round(tac - tac_patterns, 2)} second(s)")
+
+    return pattern_compendium
+
+
+def compute_word_counter_by_pattern(pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]) -> dict[int, dict[tuple[int, ...], int]]:
+    word_counter_by_pattern: dict[int, dict[tuple[int, ...], int]] = {}
 
     for pattern, compendium in pattern_compendium.items():
         pattern_words = [word for word_matched in compendium for word in word_matched]
@@ -187,7 +447,7 @@ def compute_word_counter_by_pattern(pattern_compendium: dict[tuple[int, ...], se
     return word_counter_by_pattern
 
 
-def compute_word_entropy_faster(word: tuple[int, ...], word_counter_by_pattern: dict[tuple[int, ...], dict[tuple[int, ...], int]], nbr_words: int) -> float:
+def compute_word_entropy_faster(word: tuple[int, ...], word_counter_by_pattern: dict[int, dict[tuple[int, ...], int]], nbr_words: int) -> float:
     entropy = 0.0
 
     for _, compendium_word_count in word_counter_by_pattern.items():
@@ -197,33 +457,63 @@ def compute_word_entropy_faster(word: tuple[int, ...], word_counter_by_pattern:
     return entropy
 
 
-def compute_word_entropy_faster_worker(pool_words_chunk: set[tuple[int, ...]], word_counter_by_pattern: dict[tuple[int, ...], dict[tuple[int, ...], int]], nbr_words: int,
-                                       return_dict_entropy: managers.DictProxy) -> None:
-    for word in pool_words_chunk:
-        return_dict_entropy[word] = compute_word_entropy_faster(word, word_counter_by_pattern, nbr_words)
+def compute_words_histograms(pool_words: set[tuple[int, ...]] | list[tuple[int, ...]],
+                             word_counter_by_pattern: dict[int, dict[tuple[int, ...], int]]) -> dict[tuple[int, ...], list[int]]:
+    # Shared kernel: one pass over the compendium counters gives the bucket sizes of every word, any scorer then reads them
+    words_histograms: dict[tuple[int, ...], list[int]] = {word: [] for word in pool_words}
 
+    for compendium_word_count in word_counter_by_pattern.values():
+        for word, count in compendium_word_count.items():
+            if word in words_histograms:
+                words_histograms[word].append(count)
 
-def compute_words_information_faster(pool_words: set[tuple[int, ...]],
-                                     pattern_compendium: dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]],
-                                     threads: int=0) -> list | list[tuple[tuple[int, ...], float]]:
+    return words_histograms
+
+
+def compute_words_histograms_worker(pool_words_chunk: set[tuple[int, ...]], word_counter_by_pattern: dict[int, dict[tuple[int, ...], int]],
+                                    return_dict_histograms: managers.DictProxy) -> None:
+    return_dict_histograms.update(compute_words_histograms(pool_words_chunk, word_counter_by_pattern))
+
+
+def score_histograms(words_histograms: dict[tuple[int, ...], list[int]] | list[tuple[tuple[int, ...], list[int]]], nbr_words: int,
+                     scorer: Callable=compute_partition_entropy) -> RankedInformation:
+    # Higher is better for every scorer (see modules/scorers.py), the ranking stays a plain RankedInformation
+    if isinstance(words_histograms, dict):
+        words_histograms = words_histograms.items()
+
+    return RankedInformation([(word, scorer(bucket_sizes, nbr_words)) for word, bucket_sizes in words_histograms])
+
+
+def compute_words_histograms_faster(pool_words: set[tuple[int, ...]],
+                                    pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]],
+                                    threads: int=0) -> dict[tuple[int, ...], list[int]]:
     curr_func = inspect.currentframe().f_code.co_name
 
-    words_information: list | list[tuple[tuple[int, ...], float]] = []
-    pool_words_chunked, return_dict_entropy, jobs = prepare_worker_datas(pool_words, threads)
+    words_histograms: dict[tuple[int, ...], list[int]] = {}
+    pool_words_chunked, return_dict_histograms, jobs = prepare_worker_datas(pool_words, threads)
     word_counter_by_pattern = compute_word_counter_by_pattern(pattern_compendium)
 
     for pool_words_chunk in pool_words_chunked:
-        jobs.append(Process(target=compute_word_entropy_faster_worker,
-                            args=(set(pool_words_chunk), word_counter_by_pattern, len(pool_words), return_dict_entropy)))
+        jobs.append(Process(target=compute_words_histograms_worker,
+                            args=(set(pool_words_chunk), word_counter_by_pattern, return_dict_histograms)))
         jobs[-1].start()
 
     for process in jobs:
         process.join()
 
     try:
-        words_information = sorted(return_dict_entropy.items(), key=lambda x : x[1], reverse=True)
+        words_histograms = dict(return_dict_histograms.items())
 
     except Exception as err:
         print(f"{curr_func} -- Something went wrong: {repr(err)}")
 
-    return words_information
+    return words_histograms
+
+
+def compute_words_information_faster(pool_words: set[tuple[int, ...]],
+                                     pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]],
+                                     threads: int=0,
+                                     scorer: Callable=compute_partition_entropy) -> RankedInformation:
+    words_histograms = compute_words_histograms_faster(pool_words, pattern_compendium, threads)
+
+    return score_histograms(words_histograms, len(pool_words), scorer)
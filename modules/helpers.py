@@ -11,29 +11,53 @@ Created on Tue Apr 02 10:20:51 2024
 import time
 import inspect
 import pathlib
+import mmap
 import pickle
+import struct
+import sys
 
-import unidecode
+from array import array
 
 #pylint: disable=wrong-import-position, wrong-import-order
-from modules import computing, compendium_cache
+from modules import statics, computing, compendium_cache, metrics, words_index, pattern_matrix, streaming_build
 #pylint: enable=wrong-import-position, wrong-import-order
 #===================================================================================================
 
 __version__ = '0.1.0'
 
+# Binary words_information: header (magic, version, word lenght, number of words),
+# then the ASCII letters of every word (fixed width, they identify the word), then the float64 scores, same order (best first)
+INFO_MAGIC = b"AWIF"
+INFO_VERSION = 1
+INFO_BINARY_SUFFIX = ".bin"
+INFO_HEADER = struct.Struct("<4sHHI")
+
+# From that lenght on, the compendium cache holds every pattern in one indexed table (see compendium_cache.SparseCacheDB)
+SPARSE_CACHE_MIN_LENGHT = 8
+
 
 class LangLauncher():
     def __init__(self, words_path: str | pathlib.Path,
                  compute_best_opening: bool=False,
                  word_lenght: int=5,
-                 threads: int=0) -> None:
+                 threads: int=0,
+                 words: set[tuple[int, ...]] | None=None,
+                 allowed_path: str | pathlib.Path | None=None,
+                 allowed_words: set[tuple[int, ...]] | None=None,
+                 streaming: bool=False,
+                 memory_ceiling_mb: int=streaming_build.DEFAULT_MEMORY_CEILING_MB,
+                 load_only: bool=False) -> None:
         curr_func = inspect.currentframe().f_code.co_name
 
         tic = time.perf_counter()
 
         self.word_lenght = word_lenght
         self.threads = threads
+        # Out of core build of the cache (see modules/streaming_build.py), for lenghts whose compendium does not fit in memory
+        self.streaming = streaming
+        self.memory_ceiling_mb = memory_ceiling_mb
+        # Prebuilt artifacts are loaded as they are, nothing is computed (see precompute.py)
+        self.load_only = load_only
 
         print(f"{curr_func} -- Acquiring file {words_path}...")
         if isinstance(words_path, str):
@@ -41,14 +65,25 @@ class LangLauncher():
         else:
             self.words_file = words_path
 
-        print(f"{curr_func} -- Building word list...")
-        self.words = get_words_list(self.words_file, self.word_lenght)
+        if words is None:
+            print(f"{curr_func} -- Building word list...")
+            words = get_words_list(self.words_file, self.word_lenght)
+
+        self.words = words
         if not self.words:
             raise ValueError
         print(f"{curr_func} -- Found {len(self.words)} words...")
 
+        # Possible answers are self.words, any of them is also an allowed guess
+        if allowed_words is None and allowed_path is not None:
+            allowed_words = get_words_list(pathlib.Path(allowed_path).expanduser(), self.word_lenght)
+
+        self.allowed_words = self.words.union(allowed_words or set())
+        print(f"{curr_func} -- Found {len(self.allowed_words)} allowed guesses...")
+
         self.cache: compendium_cache.CacheDB | None = None
         self.words_information = self.compute_words_information(compute_best_opening)
+        self.pattern_matrix = self.load_build_pattern_matrix(compute_best_opening)
 
         tac = time.perf_counter() - tic
 
@@ -59,61 +94,90 @@ class LangLauncher():
         return self.__class__.__name__
 
 
-    def get_couples_from_compendium(self, pattern: str) -> set | set[tuple[tuple[int, ...]]]:
+    def metric_labels(self) -> dict[str, str]:
+        return {'lang': self.words_file.stem, 'word_lenght': str(self.word_lenght)}
+
+
+    def partition_pool(self, guess: tuple[int, ...], pool_words: set[tuple[int, ...]]) -> dict[int, set[tuple[int, ...]]]:
+        # Whole partition of a pool by a guess in one pass: matrix row look ups, patterns computed only without a matrix (or an unknown guess)
+        if self.pattern_matrix is not None and (partition := self.pattern_matrix.partition_pool(guess, pool_words)) is not None:
+            return partition
+
+        partition: dict[int, set[tuple[int, ...]]] = {}
+
+        for word in pool_words:
+            partition.setdefault(computing.compute_pattern(guess=guess, word=word), set()).add(word)
+
+        return partition
+
+
+    def get_couples_from_compendium(self, pattern: int) -> set | set[tuple[tuple[int, ...]]]:
+        labels = self.metric_labels()
+        metrics.COMPENDIUM_LOOKUPS.inc(**labels)
+
         if self.cache is None:
             return set()
 
         couples: set[tuple[tuple[int, ...]]] = set()
 
-        for result in self.cache.get_entries(pattern):
-            couples.add(tuple(tuple(ord(letter) for letter in value) for key, value in result.items() if key != "__pkid"))
+        with metrics.COMPENDIUM_LOOKUP_SECONDS.time(**labels):
+            for result in self.cache.get_entries(pattern, ("guess", "word")):
+                couples.add(tuple(tuple(ord(letter) for letter in value) for value in result.values()))
+
+        if couples:
+            metrics.COMPENDIUM_HITS.inc(**labels)
 
         return couples
 
 
+    def open_cache(self, path: pathlib.Path, table_names: set[int] | None=None) -> compendium_cache.CacheDB:
+        if self.word_lenght >= SPARSE_CACHE_MIN_LENGHT:
+            return compendium_cache.SparseCacheDB(path, table_names, guess="TEXT", word="TEXT")
+
+        return compendium_cache.CacheDB(path, table_names, guess="TEXT", word="TEXT")
+
+
     def load_build_cache_compendium(self, path: pathlib.Path,
-                                    pattern_compendium: dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]]=None) -> None | compendium_cache.CacheDB:
+                                    pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]=None) -> None | compendium_cache.CacheDB:
         curr_func = inspect.currentframe().f_code.co_name
 
         if path.exists():
-            return compendium_cache.CacheDB(path, guess="TEXT", word="TEXT")
+            return self.open_cache(path)
 
         if pattern_compendium is None:
             print(f"{curr_func} -- {path} does not exists and pattern compendium was not provided... First time here?")
             return None
 
         print(f"{curr_func} -- Building cache compendium...")
-        cache = compendium_cache.CacheDB(path, set(pattern_compendium.keys()), guess="TEXT", word="TEXT")
+        cache = self.open_cache(path, set(pattern_compendium.keys()))
 
         tic = time.perf_counter()
-
-        cptr = 0
-        for pattern, combinations in pattern_compendium.items():
-            guesses = ["".join(chr(letter_ord) for letter_ord in pair[0]) for pair in combinations]
-            words   = ["".join(chr(letter_ord) for letter_ord in pair[-1]) for pair in combinations]
-
-            cache.add_entries(pattern, guess=guesses, word=words)
-            cptr = cptr + len(combinations)
-
+        cptr = add_compendium_entries(cache, pattern_compendium)
         tac = time.perf_counter() - tic
 
         print(f"{curr_func} -- Added {cptr} entries in cache compendium in {round(tac, 2)} second(s)...")
         return cache
 
 
-    def build_pattern_compendium(self, path: pathlib.Path) -> dict | dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]]:
+    def build_pattern_compendium(self, path: pathlib.Path) -> dict | dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]:
         curr_func = inspect.currentframe().f_code.co_name
 
         print(f"{curr_func} -- Building pattern compendium...")
-        pattern_compendium: dict | dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
+        pattern_compendium: dict | dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] = {}
 
         tic = time.perf_counter()
 
         if path.exists():
             pattern_compendium = pickle.load(path.open('rb'))
 
+            # Compendiums pickled before patterns became integer codes are keyed by tuples
+            if pattern_compendium and isinstance(next(iter(pattern_compendium)), tuple):
+                print(f"{curr_func} -- Converting {path.name} to pattern codes...")
+                pattern_compendium = {statics.pattern_to_code(pattern): couples for pattern, couples in pattern_compendium.items()}
+                pickle.dump(pattern_compendium, path.open('wb'))
+
         else:
-            pattern_compendium = computing.build_pattern_compendium(self.words)
+            pattern_compendium = computing.build_pattern_compendium_faster(self.words, self.threads)
             pickle.dump(pattern_compendium, path.open('wb'))
 
         tac = time.perf_counter() - tic
@@ -123,29 +187,162 @@ class LangLauncher():
         return pattern_compendium
 
 
+    def load_build_pattern_matrix(self, compute_best_opening: bool) -> None | pattern_matrix.PatternMatrix:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        matrix_file = get_pattern_matrix_path(self.words_file, self.word_lenght)
+        matrix = pattern_matrix.read_pattern_matrix(matrix_file)
+
+        if matrix is not None and pattern_matrix.is_matrix_up_to_date(matrix, self.allowed_words, self.words):
+            print(f"{curr_func} -- Loaded {len(matrix.guesses)}x{len(matrix.answers)} pattern matrix...")
+            return matrix
+
+        if not compute_best_opening or self.load_only:
+            print(f"{curr_func} -- No (up to date) pattern matrix for {self.words_file.name}, guesses will be scored against the pool only...")
+            return None
+
+        matrix_size = len(self.allowed_words)*len(self.words)*array(pattern_matrix.get_typecode(self.word_lenght)).itemsize
+        if self.streaming and matrix_size > self.memory_ceiling_mb*1024*1024:
+            print(f"{curr_func} -- A {matrix_size // (1024*1024)} MB pattern matrix exceeds the {self.memory_ceiling_mb} MB ceiling, guesses will be scored against the pool only...")
+            return None
+
+        # Words were only added: the stored cells are kept and the new rows and columns computed
+        if matrix is None or (matrix := pattern_matrix.extend_pattern_matrix(matrix, self.allowed_words, self.words)) is None:
+            matrix = pattern_matrix.build_pattern_matrix(self.allowed_words, self.words, self.threads)
+
+        pattern_matrix.save_pattern_matrix(matrix_file, matrix)
+
+        return matrix
+
+
+    def build_streaming_words_information(self, cache_file: pathlib.Path,
+                                          words_information_file: pathlib.Path) -> list | list[tuple[tuple[int, ...], float]]:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        # Resumes the <cache>.partial checkpoint if any, a complete cache of another word list is built again
+        cache_file.unlink(missing_ok=True)
+
+        words_information = streaming_build.build_cache_streaming(self.words, cache_file, self.threads, self.memory_ceiling_mb,
+                                                                  self.word_lenght >= SPARSE_CACHE_MIN_LENGHT)
+
+        if words_information is None:
+            print(f"{curr_func} -- Streaming build of {cache_file.name} did not complete, solver is thus unavailable...")
+            return []
+
+        self.cache = self.load_build_cache_compendium(cache_file)
+        save_words_information(words_information_file, words_information)
+        save_words_information_binary(get_words_information_binary_path(words_information_file), words_information)
+
+        return words_information
+
+
+    def update_words_information(self, stored_words: set[tuple[int, ...]],
+                                 compendium_file: pathlib.Path, cache_file: pathlib.Path,
+                                 words_information_file: pathlib.Path) -> list | list[tuple[tuple[int, ...], float]]:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        tic = time.perf_counter()
+
+        new_words = self.words.difference(stored_words)
+
+        if stored_words.difference(self.words) or not compendium_file.exists():
+            # Removing couples is not supported, everything is built again
+            print(f"{curr_func} -- Words were removed from {self.words_file.name} (or the compendium is missing), rebuilding...")
+            compendium_file.unlink(missing_ok=True)
+            cache_file.unlink(missing_ok=True)
+            pattern_compendium = self.build_pattern_compendium(compendium_file)
+            self.cache = self.load_build_cache_compendium(cache_file, pattern_compendium)
+
+        else:
+            print(f"{curr_func} -- Adding {len(new_words)} new word(s) of {self.words_file.name}...")
+            pattern_compendium = self.build_pattern_compendium(compendium_file)
+
+            # Only the new couples are computed, O(new x all) instead of O(all x all)
+            delta_compendium = computing.build_pattern_compendium_delta(self.words, new_words)
+            computing.merge_pattern_compendium(pattern_compendium, delta_compendium)
+            pickle.dump(pattern_compendium, compendium_file.open('wb'))
+
+            if cache_file.exists():
+                self.cache = self.open_cache(cache_file, set(delta_compendium.keys()))
+                add_compendium_entries(self.cache, delta_compendium)
+
+            else:
+                self.cache = self.load_build_cache_compendium(cache_file, pattern_compendium)
+
+        # Every score depends on the pool size, so they are all affected: counted again from the compendium, no pattern is computed
+        words_information = computing.compute_words_information_faster(self.words, pattern_compendium, self.threads)
+        save_words_information(words_information_file, words_information)
+        save_words_information_binary(get_words_information_binary_path(words_information_file), words_information)
+
+        tac = time.perf_counter() - tic
+
+        print(f"{curr_func} -- Updated words information in {round(tac, 2)} second(s)...")
+
+        return words_information
+
+
+    def load_words_information(self, cache_file: pathlib.Path,
+                               words_information_file: pathlib.Path) -> list | list[tuple[tuple[int, ...], float]]:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        # Missing or stale artifacts leave the solver unavailable for this language rather than being computed
+        if not words_information_file.exists() or not cache_file.exists():
+            print(f"{curr_func} -- Missing prebuilt artifacts for {self.words_file.name} ({self.word_lenght} letters), run precompute.py, solver is thus unavailable...")
+            return []
+
+        print(f"{curr_func} -- Loading prebuilt exhaustive information for best opening...")
+        words_information = load_ranked_words_information(words_information_file)
+
+        if {word_info[0] for word_info in words_information} != self.words:
+            print(f"{curr_func} -- {words_information_file.name} does not match {self.words_file.name}, run precompute.py, solver is thus unavailable...")
+            return []
+
+        self.cache = self.load_build_cache_compendium(cache_file)
+
+        return words_information
+
+
     def compute_words_information(self, compute_best_opening: bool) -> list | list[tuple[tuple[int, ...], float]]:
         curr_func = inspect.currentframe().f_code.co_name
 
-        pattern_compendium: dict[tuple[int, ...], set[tuple[tuple[int, ...], tuple[int, ...]]]] | None = None
+        pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]] | None = None
         words_information: list | list[tuple[tuple[int, ...], float]] = []
 
         compendium_file, cache_file, words_information_file = get_data_paths(self.words_file, self.word_lenght)
 
+        if self.load_only:
+            return self.load_words_information(cache_file, words_information_file)
+
         if words_information_file.exists():
             print(f"{curr_func} -- Loading exhaustive information for best opening...")
-            words_information = load_words_information(words_information_file)
+            words_information = load_ranked_words_information(words_information_file)
+            stored_words = {word_info[0] for word_info in words_information}
+
+            if stored_words != self.words or (self.streaming and not cache_file.exists()):
+                if compute_best_opening and self.streaming:
+                    return self.build_streaming_words_information(cache_file, words_information_file)
+
+                if compute_best_opening:
+                    return self.update_words_information(stored_words, compendium_file, cache_file, words_information_file)
+
+                print(f"{curr_func} -- {words_information_file.name} does not match {self.words_file.name}, enable 'compute_best_opening' to update it...")
 
             if not cache_file.exists():
                 pattern_compendium = self.build_pattern_compendium(compendium_file)
 
             self.cache = self.load_build_cache_compendium(cache_file, pattern_compendium)
 
+        elif compute_best_opening and self.streaming:
+            print(f"{curr_func} -- Streaming exhaustive information for best opening...")
+            words_information = self.build_streaming_words_information(cache_file, words_information_file)
+
         elif compute_best_opening:
             print(f"{curr_func} -- Computing and saving exhaustive information for best opening...")
             pattern_compendium = self.build_pattern_compendium(compendium_file)
             self.cache = self.load_build_cache_compendium(cache_file, pattern_compendium)
             words_information = computing.compute_words_information_faster(self.words, pattern_compendium, self.threads)
             save_words_information(words_information_file, words_information)
+            save_words_information_binary(get_words_information_binary_path(words_information_file), words_information)
 
         else:
             print(f"{curr_func} -- Nothing to do, 'words_information' and 'cache' are empty, solver is thus unavailable...")
@@ -156,7 +353,11 @@ class LangLauncher():
 def init_lang_app_data(lang_files: list[pathlib.Path],
                        exhautsive_files: list[pathlib.Path],
                        compute_best_opening: bool=False,
-                       client: bool=False) -> dict[str, dict[str, str | pathlib.Path | dict[str, dict[str, str | pathlib.Path | int | LangLauncher]]]]:
+                       client: bool=False,
+                       allowed_files: list[pathlib.Path] | None=None,
+                       streaming_lenghts: list[int] | None=None,
+                       memory_ceiling_mb: int=streaming_build.DEFAULT_MEMORY_CEILING_MB,
+                       load_only: bool=False) -> dict[str, dict[str, str | pathlib.Path | dict[str, dict[str, str | pathlib.Path | int | LangLauncher]]]]:
     curr_func = inspect.currentframe().f_code.co_name
 
     app_sources: dict[str, dict[str, str | pathlib.Path | dict[str, dict[str, str | pathlib.Path | int | LangLauncher]]]] = {}
@@ -166,18 +367,35 @@ def init_lang_app_data(lang_files: list[pathlib.Path],
         app_sources[lang_file.stem] = {'path': lang_file if not client else lang_file.name,
                                        'pre_computed': {}}
 
-        for exhautsive_file in exhautsive_files:
-            if lang_file.stem in exhautsive_file.stem:
-                word_lenght = int(exhautsive_file.stem.split('_')[1])
+        lang_exhautsive_files = get_lang_exhaustive_files(lang_file, exhautsive_files)
 
-                pre_computed = {'path': exhautsive_file if not client else exhautsive_file.name,
-                                'lenght': word_lenght,
-                                'lang_launcher': LangLauncher(lang_file, compute_best_opening, word_lenght) if not client else str(LangLauncher)}
-                app_sources[lang_file.stem]['pre_computed'][str(word_lenght)] = pre_computed
+        # One pass over the language file for every configured lenght, each launcher gets its own bucket
+        words_buckets = words_index.load_words_buckets(lang_file, set(lang_exhautsive_files)) if not client else {}
+
+        # Optional <lang>_allowed.txt: extra words accepted (and scored) as guesses, but never picked as the word to guess
+        allowed_file = next((file for file in allowed_files or [] if file.stem == f"{lang_file.stem}_allowed"), None)
+        allowed_buckets = words_index.load_words_buckets(allowed_file, set(lang_exhautsive_files)) if allowed_file is not None and not client else {}
+
+        for word_lenght, exhautsive_file in lang_exhautsive_files.items():
+            pre_computed = {'path': exhautsive_file if not client else exhautsive_file.name,
+                            'lenght': word_lenght,
+                            'lang_launcher': LangLauncher(lang_file, compute_best_opening, word_lenght,
+                                                          words=words_buckets[word_lenght],
+                                                          allowed_words=allowed_buckets.get(word_lenght),
+                                                          streaming=word_lenght in (streaming_lenghts or []),
+                                                          memory_ceiling_mb=memory_ceiling_mb,
+                                                          load_only=load_only) if not client else str(LangLauncher)}
+            app_sources[lang_file.stem]['pre_computed'][str(word_lenght)] = pre_computed
 
     return app_sources
 
 
+def get_lang_exhaustive_files(lang_file: pathlib.Path, exhautsive_files: list[pathlib.Path]) -> dict[int, pathlib.Path]:
+    # <lang>_<lenght>.txt files enable a word lenght for <lang>.txt
+    return {int(exhautsive_file.stem.split('_')[1]): exhautsive_file
+            for exhautsive_file in exhautsive_files if lang_file.stem in exhautsive_file.stem}
+
+
 def get_words_list(path: pathlib.Path, word_lenght: int=5) -> set | set[tuple[int, ...]]:
     curr_func = inspect.currentframe().f_code.co_name
 
@@ -187,13 +405,8 @@ def get_words_list(path: pathlib.Path, word_lenght: int=5) -> set | set[tuple[in
         print(f"{curr_func} -- Invalid path for file {path}")
         return words
 
-    with path.open('r', encoding='utf-8') as fp:
-        for word in fp.readlines():
-            word = unidecode.unidecode(word.strip()).lower()
-            if (len(word) == word_lenght and word.isalpha()):
-                words.add(tuple(ord(letter) for letter in word))
-
-    return words
+    # Normalised once into a binary index next to the source (rebuilt whenever the source changes)
+    return words_index.load_words(path, word_lenght)
 
 
 def get_data_paths(words_file: pathlib.Path, word_lenght: int) -> tuple[pathlib.Path, pathlib.Path, pathlib.Path]:
@@ -201,8 +414,11 @@ def get_data_paths(words_file: pathlib.Path, word_lenght: int) -> tuple[pathlib.
                                               f"{words_file.stem}_{str(word_lenght)}_compendium.pkl")
     compendium_file = pathlib.Path(compendium_path).expanduser()
 
+    # Tables are named after pattern codes, the name differs from the former (joined tuples) one so that old caches are not read,
+    # long words get their own name as well, their cache is a single table
+    cache_layout = "sparse" if word_lenght >= SPARSE_CACHE_MIN_LENGHT else "codes"
     cache_path = str(words_file).replace(words_file.name,
-                                         f"{words_file.stem}_{str(word_lenght)}_compendium.sqlite")
+                                         f"{words_file.stem}_{str(word_lenght)}_compendium_{cache_layout}.sqlite")
     cache_file = pathlib.Path(cache_path).expanduser()
 
     words_information_path = str(words_file).replace(words_file.name,
@@ -212,6 +428,23 @@ def get_data_paths(words_file: pathlib.Path, word_lenght: int) -> tuple[pathlib.
     return compendium_file, cache_file, words_information_file
 
 
+def add_compendium_entries(cache: compendium_cache.CacheDB,
+                           pattern_compendium: dict[int, set[tuple[tuple[int, ...], tuple[int, ...]]]]) -> int:
+    cptr = 0
+    for pattern, combinations in pattern_compendium.items():
+        guesses = ["".join(chr(letter_ord) for letter_ord in pair[0]) for pair in combinations]
+        words   = ["".join(chr(letter_ord) for letter_ord in pair[-1]) for pair in combinations]
+
+        cache.add_entries(pattern, guess=guesses, word=words)
+        cptr = cptr + len(combinations)
+
+    return cptr
+
+
+def get_pattern_matrix_path(words_file: pathlib.Path, word_lenght: int) -> pathlib.Path:
+    return words_file.with_name(f"{words_file.stem}_{str(word_lenght)}_patterns.bin")
+
+
 def save_words_information(path: pathlib.Path, words_information: list[tuple[tuple[int, ...], float]]) -> None:
     path.unlink(missing_ok=True)
 
@@ -233,3 +466,74 @@ def load_words_information(path: pathlib.Path) -> list | list[tuple[tuple[int, .
             words_information.append((word_info[0], word_info[1]))
 
     return words_information
+
+
+def get_words_information_binary_path(words_information_file: pathlib.Path) -> pathlib.Path:
+    return words_information_file.with_suffix(INFO_BINARY_SUFFIX)
+
+
+def save_words_information_binary(path: pathlib.Path, words_information: list[tuple[tuple[int, ...], float]]) -> None:
+    words_information = list(words_information)
+    word_lenght = len(words_information[0][0]) if words_information else 0
+
+    letters = bytes(letter for word_info in words_information for letter in word_info[0])
+    scores = array('d', (word_info[1] for word_info in words_information))
+    if sys.byteorder != 'little':
+        scores.byteswap()
+    padding = b"\0"*(-(INFO_HEADER.size + len(letters)) % scores.itemsize)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open('wb') as fp:
+        fp.write(INFO_HEADER.pack(INFO_MAGIC, INFO_VERSION, word_lenght, len(words_information)))
+        fp.write(letters)
+        fp.write(padding)
+        fp.write(scores.tobytes())
+    tmp_path.replace(path)
+
+
+def load_words_information_binary(path: pathlib.Path) -> None | list | list[tuple[tuple[int, ...], float]]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    # An empty file can not be mapped
+    if path.stat().st_size < INFO_HEADER.size:
+        print(f"{curr_func} -- {path} is truncated")
+        return None
+
+    with path.open('rb') as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as info:
+            magic, version, word_lenght, nb_words = INFO_HEADER.unpack_from(info, 0)
+
+            if magic != INFO_MAGIC or version != INFO_VERSION:
+                print(f"{curr_func} -- {path} is not a words information file (or an outdated one)")
+                return None
+
+            letters_end = INFO_HEADER.size + nb_words*word_lenght
+            scores_start = letters_end + (-letters_end % 8)
+
+            scores = array('d')
+
+            # A partial write would otherwise load as a shorter ranked list
+            if len(info) != scores_start + nb_words*scores.itemsize:
+                print(f"{curr_func} -- {path} does not match its header ({len(info)} bytes)")
+                return None
+
+            scores.frombytes(info[scores_start:])
+            if sys.byteorder != 'little':
+                scores.byteswap()
+            words = zip(*[iter(info[INFO_HEADER.size:letters_end])]*word_lenght)
+
+            return list(zip(words, scores))
+
+
+def load_ranked_words_information(words_information_file: pathlib.Path) -> list | list[tuple[tuple[int, ...], float]]:
+    binary_file = get_words_information_binary_path(words_information_file)
+
+    # The text file stays the reference (and export) format, the binary one is rebuilt whenever it is older
+    if binary_file.exists() and binary_file.stat().st_mtime_ns >= words_information_file.stat().st_mtime_ns:
+        if (words_information := load_words_information_binary(binary_file)) is not None:
+            return words_information
+
+    words_information = load_words_information(words_information_file)
+    save_words_information_binary(binary_file, words_information)
+
+    return words_information
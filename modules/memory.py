@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:54:07 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import os
+import sys
+import types
+import inspect
+import pathlib
+import resource
+
+from array import array
+from typing import Any
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import compendium_cache
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Shared by every instance, never accounted for
+SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# Copies of a container attempted while another thread keeps changing its size
+SNAPSHOT_RETRIES = 5
+
+
+def get_rss_bytes() -> int:
+    # Current resident set size of this process, peak one where /proc is not available
+    try:
+        with open('/proc/self/statm', encoding='utf-8') as fp:
+            return int(fp.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak*1024
+
+
+def get_process_rss_bytes(pid: int) -> int:
+    try:
+        with open(f'/proc/{pid}/statm', encoding='utf-8') as fp:
+            return int(fp.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def get_children_pids(pids: set[int]) -> set[int]:
+    # Processes whose parent is in pids, read from /proc/<pid>/stat (the parent pid follows the parenthesised command name)
+    children: set[int] = set()
+
+    for stat_path in pathlib.Path('/proc').glob('[0-9]*/stat'):
+        try:
+            if int(stat_path.read_text(encoding='utf-8').rsplit(')', 1)[1].split()[1]) in pids:
+                children.add(int(stat_path.parent.name))
+
+        except (OSError, ValueError, IndexError):
+            continue
+
+    return children
+
+
+def get_tree_rss_bytes() -> int:
+    # This process and every process it started (multiprocessing workers, Manager servers), and their own children
+    if not pathlib.Path('/proc/self/statm').exists():
+        return get_rss_bytes()
+
+    tree = {os.getpid()}
+    parents = set(tree)
+
+    while parents := get_children_pids(parents).difference(tree):
+        tree.update(parents)
+
+    return sum(get_process_rss_bytes(pid) for pid in tree)
+
+
+def snapshot_container(container: dict | list | tuple | set | frozenset) -> list:
+    # Sessions are changed by the batch and channel executor threads while walked: the walk reads a copy
+    for _ in range(SNAPSHOT_RETRIES):
+        try:
+            return list(container.items()) if isinstance(container, dict) else list(container)
+
+        except RuntimeError:
+            continue
+
+    return []
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None=None) -> int:
+    # Iterative walk of containers and instance attributes, objects already in seen (ids) are not counted again:
+    # passing the same seen set across calls only counts what the later objects do not share with the former
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+
+        if id(current) in seen or isinstance(current, SKIPPED_TYPES):
+            continue
+
+        seen.add(id(current))
+        size = size + sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            for key, value in snapshot_container(current):
+                stack.append(key)
+                stack.append(value)
+
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(snapshot_container(current))
+
+        if hasattr(current, '__dict__'):
+            stack.append(vars(current))
+
+        for slot in getattr(type(current), '__slots__', ()):
+            if hasattr(current, slot):
+                stack.append(getattr(current, slot))
+
+    return size
+
+
+def get_cache_occupancy(cache: compendium_cache.CacheDB | None, count_rows: bool=False) -> dict[str, str | int | None]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    if cache is None:
+        return {}
+
+    path = pathlib.Path(cache.db_path)
+    occupancy: dict[str, str | int | None] = {'path': path.name,
+                                              'file_bytes': path.stat().st_size if path.exists() else 0}
+
+    try:
+        with cache.lock:
+            occupancy['page_size'] = cache.db.execute('PRAGMA page_size').fetchone()[0]
+            occupancy['page_count'] = cache.db.execute('PRAGMA page_count').fetchone()[0]
+            occupancy['free_pages'] = cache.db.execute('PRAGMA freelist_count').fetchone()[0]
+            occupancy['page_cache_pages'] = cache.db.execute('PRAGMA cache_size').fetchone()[0]
+            tables = [row[0] for row in cache.db.execute('SELECT name FROM sqlite_master WHERE type="table"')]
+            occupancy['tables'] = len(tables)
+
+            # One COUNT(*) per pattern table, only on demand
+            occupancy['rows'] = sum(cache.db.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables) if count_rows else None
+
+    except Exception as err:
+        print(f"{curr_func} -- Failed to query {path.name}: {repr(err)}")
+
+    return occupancy
+
+
+def get_alternative_representations(lang_launcher: Any) -> dict[str, dict[str, int]]:
+    # What the same data would take with other layouts, built for real and measured
+    words = lang_launcher.words
+    nbr_words = len(words)
+    word_lenght = lang_launcher.word_lenght
+    words_information = lang_launcher.words_information
+
+    index_typecode = 'H' if nbr_words <= 2**16 else 'I'
+
+    return {'words': {'set_of_int_tuples': deep_sizeof(words),
+                      'set_of_str': deep_sizeof({"".join(chr(letter) for letter in word) for word in words}),
+                      'packed_ascii_bytes': sys.getsizeof(bytes(nbr_words*word_lenght))},
+            'words_information': {'list_of_tuples': deep_sizeof(words_information),
+                                  'packed_ascii_bytes_and_float64_array': sys.getsizeof(bytes(len(words_information)*word_lenght)) + sys.getsizeof(array('d', bytes(8*len(words_information)))),
+                                  'packed_ascii_bytes_and_float32_array': sys.getsizeof(bytes(len(words_information)*word_lenght)) + sys.getsizeof(array('f', bytes(4*len(words_information))))},
+            # A session starts with a full copy of the pool, sharing the word tuples of the launcher
+            'session_pool_words': {'set_of_shared_tuples': sys.getsizeof(set(words)),
+                                   f'array_{index_typecode}_of_word_indexes': sys.getsizeof(array(index_typecode, range(nbr_words))),
+                                   'bitmap_of_word_indexes': sys.getsizeof(bytes((nbr_words + 7) // 8))}}
+
+
+def get_lang_launcher_report(lang_launcher: Any, count_rows: bool=False) -> dict[str, int | dict]:
+    pattern_matrix = lang_launcher.pattern_matrix
+
+    return {'words': len(lang_launcher.words),
+            'allowed_words': len(lang_launcher.allowed_words),
+            'deep_bytes': {'words': deep_sizeof(lang_launcher.words),
+                           # allowed_words reuses the word tuples, only its own share is counted
+                           'allowed_words': deep_sizeof(lang_launcher.allowed_words, {id(word) for word in lang_launcher.words}),
+                           'words_information': deep_sizeof(lang_launcher.words_information),
+                           'pattern_matrix': deep_sizeof(pattern_matrix) if pattern_matrix is not None else 0,
+                           'total': deep_sizeof(lang_launcher)},
+            'cache': get_cache_occupancy(lang_launcher.cache, count_rows),
+            'alternatives': get_alternative_representations(lang_launcher)}
+
+
+def get_sessions_report(game_sessions: dict[str, dict], max_sessions: int=0) -> dict[str, int | float | dict[str, int]]:
+    per_session: dict[str, int] = {}
+    launchers_seen: dict[int, set[int]] = {}
+
+    for session_uuid, game_session in list(game_sessions.items()):
+        lang_launcher = game_session['game_session'].language_launcher
+
+        # What the launcher holds (word tuples included) is shared by every session of that language
+        if id(lang_launcher) not in launchers_seen:
+            launcher_seen: set[int] = set()
+            deep_sizeof(lang_launcher, launcher_seen)
+            launchers_seen[id(lang_launcher)] = launcher_seen
+
+        per_session[session_uuid] = deep_sizeof(game_session, set(launchers_seen[id(lang_launcher)]))
+
+    total = sum(per_session.values())
+    average = total / len(per_session) if per_session else 0.0
+
+    return {'count': len(per_session),
+            'total_bytes': total,
+            'average_bytes': round(average),
+            'max_bytes': max(per_session.values(), default=0),
+            'max_sessions': max_sessions,
+            'projected_max_sessions_bytes': round(average*max_sessions),
+            'per_session': per_session}
+
+
+def build_memory_report(app_sources: dict, game_sessions: dict[str, dict], count_rows: bool=False) -> dict[str, int | dict]:
+    languages: dict[str, dict[str, dict]] = {}
+
+    for lang, lang_sources in app_sources.items():
+        if not isinstance(lang_sources, dict) or 'pre_computed' not in lang_sources:
+            continue
+
+        for word_lenght, pre_computed in lang_sources['pre_computed'].items():
+            if (lang_launcher := pre_computed.get('lang_launcher')) is None or isinstance(lang_launcher, str):
+                continue
+
+            languages.setdefault(lang, {})[word_lenght] = get_lang_launcher_report(lang_launcher, count_rows)
+
+    return {'rss_bytes': get_rss_bytes(),
+            'languages': languages,
+            'sessions': get_sessions_report(game_sessions, app_sources.get('MAX_SESSIONS', 0))}
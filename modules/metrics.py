@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:35:01 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import time
+import math
+
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Iterator
+
+#pylint: disable=wrong-import-position, wrong-import-order
+
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def format_value(value: int | float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def escape_label_value(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels) + "}"
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.lock = Lock()
+
+
+    def __str__ (self) -> str:
+        return self.__class__.__name__
+
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], int | float]]:
+        yield from ()
+
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name}{format_labels(labels)} {format_value(value)}" for name, labels, value in self.samples())
+
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self.values: dict[tuple[tuple[str, str], ...], int | float] = {}
+
+
+    def inc(self, amount: int | float=1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], int | float]]:
+        with self.lock:
+            values = list(self.values.items())
+
+        for labels, value in values:
+            yield f"{self.name}_total", labels, value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        super().__init__(name, documentation)
+        self.values: dict[tuple[tuple[str, str], ...], int | float] = {}
+        self.func: Callable | None = None
+
+
+    def set(self, value: int | float, **labels: str) -> None:
+        with self.lock:
+            self.values[tuple(sorted(labels.items()))] = value
+
+
+    def inc(self, amount: int | float=1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+    def dec(self, amount: int | float=1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+    def set_function(self, func: Callable) -> None:
+        # Evaluated at scrape time, func returns either a number or a {labels tuple: number} dict
+        self.func = func
+
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], int | float]]:
+        with self.lock:
+            values = list(self.values.items())
+
+        if self.func is not None:
+            result = self.func()
+            values.extend(result.items() if isinstance(result, dict) else [((), result)])
+
+        for labels, value in values:
+            yield self.name, labels, value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...]=DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.values: dict[tuple[tuple[str, str], ...], list[int | float]] = {}
+
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+
+        with self.lock:
+            # One (non cumulative) count per bucket, then sum and count
+            if (counts := self.values.get(key)) is None:
+                counts = [0]*(len(self.buckets) + 2)
+                self.values[key] = counts
+
+            for idx, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    counts[idx] = counts[idx] + 1
+                    break
+
+            counts[-2] = counts[-2] + value
+            counts[-1] = counts[-1] + 1
+
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        tic = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            self.observe(time.perf_counter() - tic, **labels)
+
+
+    def samples(self) -> Iterator[tuple[str, tuple[tuple[str, str], ...], int | float]]:
+        with self.lock:
+            values = [(labels, list(counts)) for labels, counts in self.values.items()]
+
+        for labels, counts in values:
+            cumulated = 0
+
+            for idx, upper_bound in enumerate(self.buckets):
+                cumulated = cumulated + counts[idx]
+                yield f"{self.name}_bucket", labels + (("le", format_value(upper_bound)),), cumulated
+
+            yield f"{self.name}_sum", labels, counts[-2]
+            yield f"{self.name}_count", labels, counts[-1]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+        self.lock = Lock()
+
+
+    def register(self, metric: Metric) -> Metric:
+        with self.lock:
+            self.metrics[metric.name] = metric
+
+        return metric
+
+
+    def render(self) -> str:
+        with self.lock:
+            metrics = list(self.metrics.values())
+
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+POOL_FILTERING_SECONDS: Histogram = REGISTRY.register(Histogram("wordle_pool_filtering_seconds",
+                                                                "Time spent narrowing the pool words down with a guess and its pattern"))
+COMPENDIUM_LOOKUP_SECONDS: Histogram = REGISTRY.register(Histogram("wordle_compendium_lookup_seconds",
+                                                                   "Time spent fetching the couples matching a pattern from the compendium cache"))
+ENTROPY_COMPUTATION_SECONDS: Histogram = REGISTRY.register(Histogram("wordle_entropy_computation_seconds",
+                                                                     "Time spent computing the information of the pool words"))
+SUGGESTION_BUILDING_SECONDS: Histogram = REGISTRY.register(Histogram("wordle_suggestion_building_seconds",
+                                                                     "Time spent building the letter elimination suggestions"))
+RESPONSE_SERIALIZATION_SECONDS: Histogram = REGISTRY.register(Histogram("wordle_response_serialization_seconds",
+                                                                        "Time spent converting solver results into a response"))
+
+COMPENDIUM_LOOKUPS: Counter = REGISTRY.register(Counter("wordle_compendium_lookups",
+                                                        "Pattern lookups against the compendium cache"))
+COMPENDIUM_HITS: Counter = REGISTRY.register(Counter("wordle_compendium_hits",
+                                                     "Pattern lookups against the compendium cache that returned couples"))
+
+ACTIVE_SESSIONS: Gauge = REGISTRY.register(Gauge("wordle_active_sessions",
+                                                 "Game sessions currently held by the server"))
+COMPENDIUM_HIT_RATIO: Gauge = REGISTRY.register(Gauge("wordle_compendium_hit_ratio",
+                                                      "Share of compendium cache lookups that returned couples"))
+WORKER_QUEUE_DEPTH: Gauge = REGISTRY.register(Gauge("wordle_worker_queue_depth",
+                                                    "Jobs submitted to the batch solve pool and not done yet"))
+
+
+def compute_hit_ratio() -> dict[tuple[tuple[str, str], ...], float]:
+    with COMPENDIUM_LOOKUPS.lock:
+        lookups = dict(COMPENDIUM_LOOKUPS.values)
+
+    with COMPENDIUM_HITS.lock:
+        hits = dict(COMPENDIUM_HITS.values)
+
+    return {labels: hits.get(labels, 0) / nb_lookups for labels, nb_lookups in lookups.items() if nb_lookups}
+
+
+COMPENDIUM_HIT_RATIO.set_function(compute_hit_ratio)
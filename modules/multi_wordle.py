@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:59:58 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import time
+import inspect
+
+import random
+
+from collections import Counter
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import statics, helpers, computing, wordle, solver, scorers
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Dordle (2 boards), Quordle (4), Octordle (8)... every guess is played on every board still unsolved
+MAX_BOARDS = 32
+EXTRA_TRIES = 5
+
+
+def get_default_max_tries(nb_boards: int) -> int:
+    return nb_boards + EXTRA_TRIES
+
+
+class MultiWordle():
+    def __init__(self, language_launcher: helpers.LangLauncher, nb_boards: int=4, scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> None:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        self.language_launcher = language_launcher
+        self.scorer = scorers.get_scorer(scorer) or scorers.score_entropy
+        self.nb_boards = max(1, min(nb_boards, MAX_BOARDS))
+
+        print(f"{curr_func} -- Setting up {self.nb_boards} boards...")
+        self.boards = [wordle.Wordle(language_launcher, scorer) for _ in range(self.nb_boards)]
+        self.solved = [False]*self.nb_boards
+        self.guesses_information: list | list[tuple[tuple[int, ...], float]] = []
+        self.boards_histograms: list | list[tuple[tuple[int, ...], list[list[int]]]] = []
+
+        self.reset()
+
+
+    def __str__ (self) -> str:
+        return self.__class__.__name__
+
+
+    def _is_invalid_word(self, word: tuple[int, ...]) -> bool:
+        return len(word) != self.language_launcher.word_lenght or word not in self.language_launcher.allowed_words
+
+
+    def reset(self) -> None:
+        for board in self.boards:
+            board.reset()
+
+        # Distinct words whenever the list is long enough
+        words = sorted(self.language_launcher.words)
+        if len(words) >= self.nb_boards:
+            board_words = random.sample(words, self.nb_boards)
+        else:
+            board_words = random.choices(words, k=self.nb_boards)
+
+        for board, word in zip(self.boards, board_words):
+            board.word = word
+
+        self.solved = [False]*self.nb_boards
+        self.guesses_information = []
+        self.boards_histograms = []
+
+
+    def set_words(self, words: list[tuple[int, ...]]) -> None:
+        for board, word in zip(self.boards, words):
+            board.word = word
+
+
+    def get_unsolved_boards(self) -> list[wordle.Wordle]:
+        return [board for board, solved in zip(self.boards, self.solved) if not solved]
+
+
+    def is_over(self) -> bool:
+        return all(self.solved)
+
+
+    def submit_guess(self, guess: tuple[int, ...]) -> None | list[int | None]:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        if self._is_invalid_word(guess):
+            print(f"{curr_func} -- Word {''.join(chr(ord_letter) for ord_letter in guess)} is not allowed")
+            return None
+
+        solved_pattern = statics.get_solved_code(len(guess))
+        patterns: list[int | None] = []
+
+        # Boards solved by an earlier guess get no pattern
+        for idx, board in enumerate(self.boards):
+            if self.solved[idx]:
+                patterns.append(None)
+                continue
+
+            pattern = computing.compute_pattern(guess=guess, word=board.word)
+            self.solved[idx] = pattern == solved_pattern
+            patterns.append(pattern)
+
+        return patterns
+
+
+    def submit_guess_and_patterns(self, guess: tuple[int, ...], patterns: list[int | None]) -> None | computing.RankedInformation:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        if self._is_invalid_word(guess) or len(patterns) != self.nb_boards:
+            print(f"{curr_func} -- Word {guess} or patterns {patterns} are not allowed")
+            return None
+
+        tic = time.perf_counter()
+
+        solved_pattern = statics.get_solved_code(len(guess))
+
+        # Every board is checked before any is touched: a bad pattern on one board leaves the whole session as it was
+        for board, pattern in zip(self.boards, patterns):
+            if pattern is not None and not board.is_valid_move(guess, pattern):
+                print(f"{curr_func} -- Pattern {pattern} is not allowed")
+                return None
+
+        boards_pool_words: dict[int, set[tuple[int, ...]]] = {}
+
+        for idx, (board, pattern) in enumerate(zip(self.boards, patterns)):
+            if pattern is None:
+                continue
+
+            if pattern == solved_pattern:
+                boards_pool_words[idx] = {guess}
+                continue
+
+            # Only the pool is filtered on each board, the guesses are scored across the boards below
+            if not (pool_words := board.get_filtered_pool(guess, pattern)):
+                print(f"{curr_func} -- Pool words of board {idx + 1} is empty")
+                return None
+
+            boards_pool_words[idx] = pool_words
+
+        for idx, pool_words in boards_pool_words.items():
+            self.boards[idx].pool_words = pool_words
+
+            if patterns[idx] == solved_pattern:
+                self.solved[idx] = True
+                continue
+
+            self.boards[idx].information = -computing.safe_log2(1.0/float(len(pool_words)))
+
+        guesses_information = self.update_guesses_information()
+
+        tac = time.perf_counter() - tic
+
+        print(f"{curr_func} -- Scored {len(guesses_information)} guesses across {len(self.get_unsolved_boards())} board(s) in {round(tac, 2)} second(s)")
+
+        return guesses_information
+
+
+    def update_guesses_information(self) -> computing.RankedInformation:
+        unsolved_boards = self.get_unsolved_boards()
+        boards_pool_words = [board.pool_words for board in unsolved_boards]
+        matrix = self.language_launcher.pattern_matrix
+
+        if matrix is not None:
+            self.boards_histograms = matrix.compute_boards_histograms(boards_pool_words)
+
+        else:
+            # Without the matrix the guesses are limited to the pools' words, as on a single board
+            guesses = sorted(set().union(*boards_pool_words))
+            self.boards_histograms = [(guess, [list(Counter(computing.compute_pattern(guess=guess, word=word) for word in pool_words).values())
+                                               for pool_words in boards_pool_words])
+                                      for guess in guesses]
+
+        # Boards are independent: the information a guess brings is the sum of what it brings on each board
+        self.guesses_information = computing.RankedInformation([(guess, sum(self.scorer(histogram, len(pool_words))
+                                                                            for histogram, pool_words in zip(histograms, boards_pool_words)))
+                                                                for guess, histograms in self.boards_histograms])
+
+        return self.guesses_information
+
+
+def best_boards_guess(game: MultiWordle) -> tuple[int, ...]:
+    unsolved_boards = game.get_unsolved_boards()
+
+    # A board down to one word is a sure solve
+    for board in unsolved_boards:
+        if len(board.pool_words) == 1:
+            return next(iter(board.pool_words))
+
+    if not game.guesses_information:
+        return solver.get_opening(game.language_launcher)
+
+    # Among the best guesses, one that may be the answer of a board wins the tie
+    best_guess, best_information = game.guesses_information[0]
+
+    for word, information in game.guesses_information:
+        if information < best_information:
+            break
+
+        if any(word in board.pool_words for board in unsolved_boards):
+            return word
+
+    return best_guess
+
+
+def solve_words(language_launcher: helpers.LangLauncher, words: list[tuple[int, ...]],
+                max_tries: int | None=None,
+                scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> dict[str, list[tuple[int, ...]] | list[list[int | None]] | list[int | None] | int | bool | float]:
+    tic = time.perf_counter()
+
+    if max_tries is None:
+        max_tries = get_default_max_tries(len(words))
+
+    game = MultiWordle(language_launcher, len(words), scorer)
+    game.set_words(words)
+
+    guesses: list[tuple[int, ...]] = []
+    patterns: list[list[int | None]] = []
+    boards_tries: list[int | None] = [None]*len(words)
+
+    while len(guesses) < max_tries*2 and not game.is_over():
+        guess = best_boards_guess(game)
+        guess_patterns = game.submit_guess(guess)
+        guesses.append(guess)
+        patterns.append(guess_patterns)
+
+        for idx, solved in enumerate(game.solved):
+            if solved and boards_tries[idx] is None:
+                boards_tries[idx] = len(guesses)
+
+        if game.is_over() or game.submit_guess_and_patterns(guess, guess_patterns) is None:
+            break
+
+    tac = time.perf_counter() - tic
+
+    return {'guesses': guesses,
+            'patterns': patterns,
+            'boards_tries': boards_tries,
+            'tries': len(guesses),
+            'solved': game.is_over() and len(guesses) <= max_tries,
+            'duration': tac}
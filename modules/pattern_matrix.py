@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:42:56 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import sys
+import time
+import zlib
+import struct
+import inspect
+import pathlib
+
+from array import array
+from collections import Counter
+from operator import itemgetter
+from typing import Callable
+from multiprocessing import Process, managers
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import computing
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Layout (little endian): header (magic, version, word lenght, number of guesses, number of answers, crc32 of both word lists as stored),
+# the ASCII letters of the guesses then of the answers, then one row of pattern codes per guess (one code per answer)
+MATRIX_MAGIC = b"AWPM"
+MATRIX_VERSION = 1
+MATRIX_HEADER = struct.Struct("<4sHHIIII")
+
+
+def get_typecode(word_lenght: int) -> str:
+    # Smallest array type holding every 3**word_lenght pattern code (up to 40 letters)
+    if 3**word_lenght <= 2**8:
+        return 'B'
+
+    if 3**word_lenght <= 2**16:
+        return 'H'
+
+    if 3**word_lenght <= 2**32:
+        return 'I'
+
+    return 'Q'
+
+
+def compute_pattern_rows_worker(guesses_chunk: list[tuple[int, ...]], answers: list[tuple[int, ...]], typecode: str,
+                                return_dict_rows: managers.DictProxy) -> None:
+    for guess in guesses_chunk:
+        row = array(typecode, (computing.compute_pattern(guess=guess, word=answer) for answer in answers))
+        return_dict_rows[guess] = row.tobytes()
+
+
+class PatternMatrix():
+    def __init__(self, guesses: list[tuple[int, ...]], answers: list[tuple[int, ...]], rows: list[array]) -> None:
+        self.guesses = guesses
+        self.answers = answers
+        self.rows = rows
+        self.word_lenght = len(answers[0]) if answers else 0
+
+        self.guess_index = {guess: idx for idx, guess in enumerate(guesses)}
+        self.answer_index = {answer: idx for idx, answer in enumerate(answers)}
+
+
+    def __str__ (self) -> str:
+        return self.__class__.__name__
+
+
+    def get_row(self, guess: tuple[int, ...]) -> None | array:
+        if (idx := self.guess_index.get(guess)) is None:
+            return None
+
+        return self.rows[idx]
+
+
+    def get_answers_indexes(self, answers: set[tuple[int, ...]] | list[tuple[int, ...]]) -> list[int]:
+        return sorted(self.answer_index[answer] for answer in answers if answer in self.answer_index)
+
+
+    def slice_row(self, row: array, answers_indexes: list[int]) -> tuple[int, ...]:
+        # itemgetter picks every column at C speed, it only returns a bare value for a single index
+        if len(answers_indexes) == 1:
+            return (row[answers_indexes[0]],)
+
+        return itemgetter(*answers_indexes)(row)
+
+
+    def filter_pool(self, guess: tuple[int, ...], pattern_code: int, pool_words: set[tuple[int, ...]]) -> set[tuple[int, ...]]:
+        if (row := self.get_row(guess)) is None:
+            return set()
+
+        return {answer for answer in pool_words if row[self.answer_index[answer]] == pattern_code}
+
+
+    def partition_pool(self, guess: tuple[int, ...], pool_words: set[tuple[int, ...]]) -> None | dict[int, set[tuple[int, ...]]]:
+        # Every pool word under the pattern the guess gets against it, read from the guess row
+        if (row := self.get_row(guess)) is None:
+            return None
+
+        partition: dict[int, set[tuple[int, ...]]] = {}
+
+        for answer in pool_words:
+            partition.setdefault(row[self.answer_index[answer]], set()).add(answer)
+
+        return partition
+
+
+    def compute_partition_sizes(self, guess: tuple[int, ...], answers_indexes: list[int]) -> list[int]:
+        if (row := self.get_row(guess)) is None or not answers_indexes:
+            return []
+
+        return list(Counter(self.slice_row(row, answers_indexes)).values())
+
+
+    def compute_histograms(self, pool_words: set[tuple[int, ...]] | list[tuple[int, ...]],
+                           guesses: list[tuple[int, ...]] | None=None) -> list[tuple[tuple[int, ...], list[int]]]:
+        # (allowed guesses) x (current pool): one row slice and one bucket count per guess, nothing is rebuilt
+        answers_indexes = self.get_answers_indexes(pool_words)
+
+        if guesses is None:
+            guesses = self.guesses
+
+        return [(guess, self.compute_partition_sizes(guess, answers_indexes)) for guess in guesses]
+
+
+    def compute_boards_histograms(self, boards_pool_words: list[set[tuple[int, ...]]],
+                                  guesses: list[tuple[int, ...]] | None=None) -> list[tuple[tuple[int, ...], list[list[int]]]]:
+        # Several pools at once (one per board): every guess row is fetched once, then sliced and counted once per board
+        boards_answers_indexes = [self.get_answers_indexes(pool_words) for pool_words in boards_pool_words]
+
+        if guesses is None:
+            guesses = self.guesses
+
+        histograms: list[tuple[tuple[int, ...], list[list[int]]]] = []
+
+        for guess in guesses:
+            if (row := self.get_row(guess)) is None:
+                continue
+
+            histograms.append((guess, [list(Counter(self.slice_row(row, answers_indexes)).values()) if answers_indexes else []
+                                       for answers_indexes in boards_answers_indexes]))
+
+        return histograms
+
+
+    def rank_guesses(self, pool_words: set[tuple[int, ...]] | list[tuple[int, ...]],
+                     guesses: list[tuple[int, ...]] | None=None,
+                     scorer: Callable=computing.compute_partition_entropy) -> computing.RankedInformation:
+        return computing.score_histograms(self.compute_histograms(pool_words, guesses), len(self.get_answers_indexes(pool_words)), scorer)
+
+
+def get_words_signature(words: list[tuple[int, ...]]) -> int:
+    return zlib.crc32(bytes(letter for word in words for letter in word))
+
+
+def build_pattern_matrix(guesses: set[tuple[int, ...]], answers: set[tuple[int, ...]], threads: int=0) -> PatternMatrix:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    tic = time.perf_counter()
+
+    guesses = sorted(guesses)
+    answers = sorted(answers)
+    typecode = get_typecode(len(answers[0]))
+
+    guesses_chunked, return_dict_rows, jobs = computing.prepare_worker_datas(guesses, threads)
+
+    for guesses_chunk in guesses_chunked:
+        jobs.append(Process(target=compute_pattern_rows_worker,
+                            args=(guesses_chunk, answers, typecode, return_dict_rows)))
+        jobs[-1].start()
+
+    for process in jobs:
+        process.join()
+
+    rows: list[array] = []
+    for guess in guesses:
+        row = array(typecode)
+        row.frombytes(return_dict_rows[guess])
+        rows.append(row)
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Built {len(guesses)}x{len(answers)} pattern matrix in {round(tac, 2)} second(s)")
+
+    return PatternMatrix(guesses, answers, rows)
+
+
+def save_pattern_matrix(path: pathlib.Path, matrix: PatternMatrix) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with tmp_path.open('wb') as fp:
+        fp.write(MATRIX_HEADER.pack(MATRIX_MAGIC, MATRIX_VERSION, matrix.word_lenght, len(matrix.guesses), len(matrix.answers),
+                                    get_words_signature(matrix.guesses), get_words_signature(matrix.answers)))
+        fp.write(bytes(letter for word in matrix.guesses for letter in word))
+        fp.write(bytes(letter for word in matrix.answers for letter in word))
+
+        for row in matrix.rows:
+            if sys.byteorder != 'little':
+                row = array(row.typecode, row)
+                row.byteswap()
+
+            fp.write(row.tobytes())
+
+    tmp_path.replace(path)
+
+
+def read_pattern_matrix(path: pathlib.Path) -> None | PatternMatrix:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    if not path.is_file():
+        return None
+
+    content = path.read_bytes()
+
+    if len(content) < MATRIX_HEADER.size:
+        return None
+
+    magic, version, word_lenght, nb_guesses, nb_answers, guesses_crc, answers_crc = MATRIX_HEADER.unpack_from(content, 0)
+
+    if magic != MATRIX_MAGIC or version != MATRIX_VERSION:
+        print(f"{curr_func} -- {path} is not a pattern matrix (or an outdated one)")
+        return None
+
+    # Words are kept in their stored order (sorted when built, extended ones get the new words appended)
+    guesses_end = MATRIX_HEADER.size + nb_guesses*word_lenght
+    answers_end = guesses_end + nb_answers*word_lenght
+    guesses = list(zip(*[iter(content[MATRIX_HEADER.size:guesses_end])]*word_lenght))
+    answers = list(zip(*[iter(content[guesses_end:answers_end])]*word_lenght))
+
+    if (guesses_crc, answers_crc) != (get_words_signature(guesses), get_words_signature(answers)):
+        print(f"{curr_func} -- {path} is corrupted")
+        return None
+
+    typecode = get_typecode(word_lenght)
+    row_size = nb_answers*array(typecode).itemsize
+
+    rows: list[array] = []
+    for cptr in range(nb_guesses):
+        row = array(typecode)
+        row.frombytes(content[answers_end + cptr*row_size:answers_end + (cptr + 1)*row_size])
+
+        if sys.byteorder != 'little':
+            row.byteswap()
+
+        rows.append(row)
+
+    return PatternMatrix(guesses, answers, rows)
+
+
+def is_matrix_up_to_date(matrix: PatternMatrix, guesses: set[tuple[int, ...]], answers: set[tuple[int, ...]]) -> bool:
+    return len(matrix.guesses) == len(guesses) and len(matrix.answers) == len(answers) and \
+           guesses.issuperset(matrix.guesses) and answers.issuperset(matrix.answers)
+
+
+def extend_pattern_matrix(matrix: PatternMatrix, guesses: set[tuple[int, ...]], answers: set[tuple[int, ...]]) -> None | PatternMatrix:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    # Only words added since the matrix was built are handled, a removed one requires a full build
+    if not guesses.issuperset(matrix.guesses) or not answers.issuperset(matrix.answers):
+        return None
+
+    tic = time.perf_counter()
+
+    typecode = get_typecode(matrix.word_lenght)
+    new_guesses = sorted(guesses.difference(matrix.guesses))
+    new_answers = sorted(answers.difference(matrix.answers))
+    all_answers = matrix.answers + new_answers
+
+    # Stored cells are kept as they are: new columns are appended to the existing rows, then come the rows of the new guesses
+    rows: list[array] = []
+    for guess, row in zip(matrix.guesses, matrix.rows):
+        row = array(typecode, row)
+        row.extend(computing.compute_pattern(guess=guess, word=answer) for answer in new_answers)
+        rows.append(row)
+
+    for guess in new_guesses:
+        rows.append(array(typecode, (computing.compute_pattern(guess=guess, word=answer) for answer in all_answers)))
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Added {len(new_guesses)} guess(es) and {len(new_answers)} answer(s) to the pattern matrix in {round(tac, 2)} second(s)")
+
+    return PatternMatrix(matrix.guesses + new_guesses, all_answers, rows)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:35:44 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import io
+import time
+import uuid
+import inspect
+import pathlib
+import pstats
+import cProfile
+
+from typing import Any, Callable
+
+#pylint: disable=wrong-import-position, wrong-import-order
+
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+PROFILE_SUFFIX = ".pstats"
+# Profiles kept in the folder, the oldest ones go first
+MAX_PROFILES = 100
+
+
+def prune_profiles(profiles_folder: pathlib.Path, max_profiles: int=MAX_PROFILES) -> int:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    profiles = sorted(profiles_folder.glob(f"*{PROFILE_SUFFIX}"), key=lambda path: path.stat().st_mtime)
+    pruned = 0
+
+    for path in profiles[:max(0, len(profiles) - max_profiles)]:
+        try:
+            path.unlink()
+            pruned = pruned + 1
+
+        except OSError as err:
+            print(f"{curr_func} -- Failed to remove {path.name}: {repr(err)}")
+
+    return pruned
+
+
+def profile_call(profiles_folder: pathlib.Path, tag: str, func: Callable, *args,
+                 max_profiles: int=MAX_PROFILES, **kwargs) -> tuple[Any, str]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    # Deterministic profiling of the calling thread only, work handed over to child processes is not accounted for
+    profiler = cProfile.Profile()
+
+    tic = time.perf_counter()
+    result = profiler.runcall(func, *args, **kwargs)
+    tac = time.perf_counter() - tic
+
+    profiles_folder.mkdir(parents=True, exist_ok=True)
+    profile_id = f"{tag}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+    profiler.dump_stats(profiles_folder/f"{profile_id}{PROFILE_SUFFIX}")
+
+    # Any client can ask for a profile: the folder never holds more than max_profiles of them
+    prune_profiles(profiles_folder, max_profiles)
+
+    print(f"{curr_func} -- Profiled {tag} in {round(tac, 2)} second(s), saved as {profile_id}")
+
+    return result, profile_id
+
+
+def list_profiles(profiles_folder: pathlib.Path) -> list[str]:
+    if not profiles_folder.is_dir():
+        return []
+
+    return sorted(path.stem for path in profiles_folder.glob(f"*{PROFILE_SUFFIX}"))
+
+
+def get_profile_path(profiles_folder: pathlib.Path, profile_id: str) -> None | pathlib.Path:
+    # Only ids listed in the folder are served, nothing coming from the client is used as a path
+    if profile_id not in list_profiles(profiles_folder):
+        return None
+
+    return profiles_folder/f"{profile_id}{PROFILE_SUFFIX}"
+
+
+def summarize_profile(path: pathlib.Path, sort_key: str="cumulative", nb_lines: int=40) -> str:
+    stream = io.StringIO()
+
+    stats = pstats.Stats(str(path), stream=stream)
+    stats.strip_dirs().sort_stats(sort_key).print_stats(nb_lines)
+
+    return stream.getvalue()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:12:25 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import time
+import math
+import inspect
+
+import random
+
+from collections import Counter
+from operator import itemgetter
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import helpers, computing
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Early in a game the exact entropy of every guess against a pool of thousands of words dominates a move.
+# Above APPROXIMATE_POOL_SIZE words, guesses are first scored on a random sample of the pool, with a confidence interval:
+# a guess whose upper bound is below the best lower bound is dropped, then only the best half goes on to a sample twice bigger
+# (successive halving). The few survivors are scored exactly, against the whole pool.
+APPROXIMATE_POOL_SIZE = 1000
+SAMPLE_SIZE = 64
+FINAL_CANDIDATES = 32
+# About 99% two sided
+CONFIDENCE_Z = 2.58
+# Same pool, same sample: sessions and simulations stay reproducible
+SAMPLING_SEED = 0
+
+
+def estimate_entropy(bucket_sizes: list[int] | tuple[int, ...], sample_size: int, pool_size: int,
+                     confidence_z: float=CONFIDENCE_Z) -> tuple[float, float]:
+    # Entropy of the sample's partition (Miller-Madow corrected) and the half width of its confidence interval (delta method)
+    entropy = 0.0
+    second_moment = 0.0
+
+    for bucket_size in bucket_sizes:
+        probability = bucket_size / sample_size
+        information = -computing.safe_log2(probability)
+        entropy = entropy + probability*information
+        second_moment = second_moment + probability*information*information
+
+    # Sampled without replacement: both the bias and the interval vanish once the sample is the whole pool
+    finite_population = (pool_size - sample_size) / (pool_size - 1) if pool_size > 1 else 0.0
+    bias = finite_population*max(0, len(bucket_sizes) - 1) / (2*sample_size*math.log(2))
+    half_width = confidence_z*math.sqrt(max(0.0, second_moment - entropy*entropy)*finite_population / sample_size)
+
+    return entropy + bias, half_width
+
+
+def rank_guesses_sampled(language_launcher: helpers.LangLauncher, pool_words: set[tuple[int, ...]],
+                         guesses: list[tuple[int, ...]],
+                         final_candidates: int=FINAL_CANDIDATES,
+                         confidence_z: float=CONFIDENCE_Z) -> tuple[list[tuple[tuple[int, ...], list[int]]], dict[tuple[int, ...], float]]:
+    # Exact histograms of the surviving guesses (in the guesses order), and the last estimate of every guess dropped on the way
+    curr_func = inspect.currentframe().f_code.co_name
+
+    tic = time.perf_counter()
+
+    matrix = language_launcher.pattern_matrix
+    pool_size = len(pool_words)
+
+    # Nested samples: every round reads a longer prefix of the same shuffled pool
+    sample = sorted(pool_words)
+    random.Random(SAMPLING_SEED).shuffle(sample)
+
+    def get_histogram(guess: tuple[int, ...], sample_words: list[tuple[int, ...]], answers_indexes: list[int] | None) -> list[int]:
+        if answers_indexes is not None:
+            return matrix.compute_partition_sizes(guess, answers_indexes)
+
+        return list(Counter(computing.compute_pattern(guess=guess, word=word) for word in sample_words).values())
+
+    candidates = list(guesses)
+    estimates: dict[tuple[int, ...], float] = {}
+    sample_size = min(SAMPLE_SIZE, pool_size)
+    nbr_rounds = 0
+
+    while len(candidates) > final_candidates and sample_size < pool_size:
+        sample_words = sample[:sample_size]
+        answers_indexes = matrix.get_answers_indexes(sample_words) if matrix is not None else None
+
+        bounds = [(guess, *estimate_entropy(get_histogram(guess, sample_words, answers_indexes), sample_size, pool_size, confidence_z))
+                  for guess in candidates]
+        best_lower_bound = max(entropy - half_width for _, entropy, half_width in bounds)
+
+        for guess, entropy, _ in bounds:
+            estimates[guess] = entropy
+
+        # Out for good when even its best case is beaten, then the best half of what is left goes on
+        survivors = sorted([(guess, entropy) for guess, entropy, half_width in bounds if entropy + half_width >= best_lower_bound],
+                           key=itemgetter(1), reverse=True)
+        kept = {guess for guess, _ in survivors[:max(final_candidates, len(bounds) // 2)]}
+
+        candidates = [guess for guess in candidates if guess in kept]
+        sample_size = min(pool_size, sample_size*2)
+        nbr_rounds = nbr_rounds + 1
+
+    for guess in candidates:
+        estimates.pop(guess, None)
+
+    answers_indexes = matrix.get_answers_indexes(pool_words) if matrix is not None else None
+    pool_list = list(pool_words)
+    guesses_histograms = [(guess, get_histogram(guess, pool_list, answers_indexes)) for guess in candidates]
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- {len(guesses)} guesses down to {len(candidates)} in {nbr_rounds} sampled round(s) over {pool_size} words in {round(tac, 2)} second(s)")
+
+    return guesses_histograms, estimates
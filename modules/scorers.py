@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:44:53 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+from typing import Callable
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import statics, computing
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# A scorer gets the bucket sizes a guess splits the pool into (its partition histogram) and the pool size.
+# Higher is always better, scorers minimizing something return its opposite so they all rank the same way.
+
+
+def score_entropy(bucket_sizes: list[int] | tuple[int, ...], nbr_words: int) -> float:
+    return computing.compute_partition_entropy(bucket_sizes, nbr_words)
+
+
+def score_minimax(bucket_sizes: list[int] | tuple[int, ...], _nbr_words: int) -> float:
+    # Worst case: size of the biggest bucket the guess can leave
+    return -float(max(bucket_sizes, default=0))
+
+
+def score_expected_size(bucket_sizes: list[int] | tuple[int, ...], nbr_words: int) -> float:
+    # A bucket of size s is landed in with odds s/n and leaves s words
+    if nbr_words <= 0:
+        return 0.0
+
+    return -sum(bucket_size*bucket_size for bucket_size in bucket_sizes) / nbr_words
+
+
+def score_distinct_buckets(bucket_sizes: list[int] | tuple[int, ...], _nbr_words: int) -> float:
+    return float(len(bucket_sizes))
+
+
+SCORERS: dict[str, Callable] = {statics.GuessScorer.SCORER_ENTROPY.name: score_entropy,
+                                statics.GuessScorer.SCORER_MINIMAX.name: score_minimax,
+                                statics.GuessScorer.SCORER_EXPECTED_SIZE.name: score_expected_size,
+                                statics.GuessScorer.SCORER_DISTINCT_BUCKETS.name: score_distinct_buckets}
+
+
+def get_scorer(scorer: str) -> None | Callable:
+    return SCORERS.get(scorer.upper())
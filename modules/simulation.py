@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:57:49 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import time
+import inspect
+
+from copy import deepcopy
+from typing import Callable
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import statics, helpers, computing, wordle, solver, scorers, sampling
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Every target is played at once, move by move: targets that got the same patterns so far share the same pool,
+# the same letter extractor and thus the same next guess, so each group of them is scored once instead of once per target.
+# Strategies whose guess only depends on the pool also share it between groups reaching the same pool another way.
+POOL_ONLY_STRATEGIES = (solver.entropy_strategy, solver.lookahead_strategy)
+
+
+class SimulatedGame(wordle.Wordle):
+    # What the strategies read from a game, without the per game set up (copy of the words, random word, prints)
+    def __init__(self, language_launcher: helpers.LangLauncher, pool_words: set[tuple[int, ...]], scorer: Callable,
+                 approximate_pool_size: int | None=sampling.APPROXIMATE_POOL_SIZE) -> None: #pylint: disable=super-init-not-called
+        self.language_launcher = language_launcher
+        self.scorer = scorer
+        self.approximate_pool_size = approximate_pool_size
+
+        self.pool_words = pool_words
+        self.information = -computing.safe_log2(1.0/float(len(pool_words)))
+        self.word = tuple()
+        self.letter_extractor = {"incl": {}, "excl": {}}
+        self.guesses_information: list | list[tuple[tuple[int, ...], float]] = []
+        self.guesses_histograms: list | list[tuple[tuple[int, ...], list[int]]] = []
+        self.guesses_estimates: dict[tuple[int, ...], float] = {}
+
+
+def build_target_result(guesses: list[tuple[int, ...]], patterns: list[int], solved: bool,
+                        suggestion_used: int, max_tries: int) -> dict[str, list[tuple[int, ...]] | list[int] | int | bool]:
+    # Same keys as solver.solve_word, but for the duration (the whole simulation is timed instead)
+    return {'guesses': guesses,
+            'patterns': patterns,
+            'tries': len(guesses),
+            'solved': solved and len(guesses) <= max_tries,
+            'suggestion_used': suggestion_used}
+
+
+def simulate_targets(language_launcher: helpers.LangLauncher, targets: list[tuple[int, ...]] | set[tuple[int, ...]],
+                     func_strategy: Callable, max_tries: int=6,
+                     best_opening: bool=True, scorer: str=statics.GuessScorer.SCORER_ENTROPY.name,
+                     **strategy_options) -> dict[tuple[int, ...], dict[str, list[tuple[int, ...]] | list[int] | int | bool]]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    tic = time.perf_counter()
+
+    func_scorer = scorers.get_scorer(scorer) or scorers.score_entropy
+    solved_pattern = statics.get_solved_code(language_launcher.word_lenght)
+    pool_only = func_strategy in POOL_ONLY_STRATEGIES
+
+    results: dict[tuple[int, ...], dict[str, list[tuple[int, ...]] | list[int] | int | bool]] = {}
+    guesses_by_pool: dict[frozenset[tuple[int, ...]], tuple[tuple[int, ...], bool]] = {}
+    cptr_scored = 0
+
+    # Targets outside of the word list could not be the answer of a game, they are not played
+    groups = [{'targets': [target for target in targets if target in language_launcher.words],
+               'pool_words': language_launcher.words,
+               'guess': solver.get_opening(language_launcher, best_opening),
+               'guesses': [],
+               'patterns': [],
+               'letter_extractor': {"incl": {}, "excl": {}},
+               'suggestion_used': 0}]
+
+    while groups:
+        next_groups = []
+
+        for group in groups:
+            guess = group['guess']
+            guesses = group['guesses'] + [guess]
+
+            # The group's pool holds its targets: one pass gives both the next pools and the targets' patterns
+            pool_partition = language_launcher.partition_pool(guess, group['pool_words'])
+            targets_partition: dict[int, list[tuple[int, ...]]] = {}
+
+            for pattern, pool_words in pool_partition.items():
+                for target in group['targets']:
+                    if target in pool_words:
+                        targets_partition.setdefault(pattern, []).append(target)
+
+            for pattern, pattern_targets in targets_partition.items():
+                patterns = group['patterns'] + [pattern]
+
+                if pattern == solved_pattern or len(guesses) >= max_tries*2:
+                    for target in pattern_targets:
+                        results[target] = build_target_result(guesses, patterns, pattern == solved_pattern, group['suggestion_used'], max_tries)
+                    continue
+
+                pool_words = pool_partition[pattern]
+                pool_key = frozenset(pool_words)
+                letter_extractor = deepcopy(group['letter_extractor'])
+
+                if pool_only and pool_key in guesses_by_pool:
+                    next_guess, suggestion_used = guesses_by_pool[pool_key]
+
+                else:
+                    game = SimulatedGame(language_launcher, pool_words, func_scorer,
+                                         strategy_options.get('approximate_pool_size', sampling.APPROXIMATE_POOL_SIZE))
+                    pool = game.update_guesses_information()
+                    next_guess, suggestion_used = func_strategy(game, pool, pattern, guess, letter_extractor, **strategy_options)
+                    guesses_by_pool[pool_key] = (next_guess, suggestion_used)
+                    cptr_scored = cptr_scored + 1
+
+                next_groups.append({'targets': pattern_targets,
+                                    'pool_words': pool_words,
+                                    'guess': next_guess,
+                                    'guesses': guesses,
+                                    'patterns': patterns,
+                                    'letter_extractor': letter_extractor,
+                                    'suggestion_used': group['suggestion_used'] + int(suggestion_used)})
+
+        groups = next_groups
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Played {len(results)} target(s) with {cptr_scored} scored pool(s) in {round(tac, 2)} second(s)")
+
+    return results
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:30:38 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import inspect
+
+import time
+import random
+
+from typing import Callable
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import statics, helpers, computing, wordle, sampling
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+LOOKAHEAD_TOP_K = 10
+LOOKAHEAD_TIME_BUDGET = 1.0
+
+
+def rank_suggestions(game: wordle.Wordle, suggestions: list[computing.RankedInformation | None],
+                     top_k: int=1) -> tuple[list[tuple[int, ...]], int]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    for sugg_rank in range(game.language_launcher.word_lenght - 1, 0 - 1, -1):
+        if suggestions[sugg_rank]:
+            print(f"{curr_func} -- Rank {sugg_rank} has {len(suggestions[sugg_rank])} suggestions")
+            break
+
+    # crutch_guess only ever plays the best one, no need to rank the whole bucket
+    sugg_guesses = [sugg[0] for sugg in suggestions[sugg_rank][:top_k]]
+
+    return sugg_guesses, sugg_rank
+
+
+def crutch_suggestion(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                      letter_extractor: dict[str, dict[int, int]],
+                      top_k: int=1) -> tuple[list[tuple[int, ...]], int]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    pool_letters, pool_letters_dupes = computing.gather_pool_letters(pool)
+    suggestions = computing.build_suggestion(game.language_launcher.words_information,
+                                             pool_letters,
+                                             pool_letters_dupes,
+                                             letter_extractor)
+
+    print(f"{curr_func} -- Found {len(pool_letters)} different letters to try with {len(pool_letters_dupes)} dupes")
+
+    return rank_suggestions(game, suggestions, top_k)
+
+
+def crutch_guess(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                 pattern: int,
+                 sugg_guesses: list[tuple[int, ...]], sugg_rank: int) -> tuple[tuple[int, ...], bool]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    suggestion_used = False
+    thresh_sugg = (game.language_launcher.word_lenght % 2) + game.language_launcher.word_lenght // 2
+
+    if len(pool) <= 2:
+        guess = pool[0][0]
+
+    elif len(pool) > 2 and \
+    sugg_rank > game.language_launcher.word_lenght - thresh_sugg and \
+    statics.count_exact(pattern, game.language_launcher.word_lenght) >= thresh_sugg:
+        guess = sugg_guesses[0]
+
+        print(f"{curr_func} -- ⚠️  Using suggestion '{''.join(chr(ord_letter) for ord_letter in guess)}' on next attemp ⚠️")
+
+        suggestion_used = True
+
+    else:
+        guess = pool[0][0]
+
+    return guess, suggestion_used
+
+
+def fast_strategy(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                  pattern: int, guess: tuple[int, ...],
+                  letter_extractor: dict[str, dict[int, int]],
+                  **_strategy_options) -> tuple[tuple[int, ...], bool]:
+    # Far from being the best solver, but somewhat OK speed wise...
+
+    letter_extractor = computing.update_letter_extractor(letter_extractor,
+                                                         computing.build_letter_extractor(guess, pattern))
+    sugg_guesses, sugg_rank = crutch_suggestion(game, pool, letter_extractor)
+
+    return crutch_guess(game, pool, pattern, sugg_guesses, sugg_rank)
+
+
+def slow_strategy(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                  pattern: int, guess: tuple[int, ...],
+                  letter_extractor: dict[str, dict[int, int]],
+                  **_strategy_options) -> tuple[tuple[int, ...], bool]:
+    # As the name implies, it's a lot slower and cumputing intensive... Especially if ran in a single thread...
+
+    words = [word_ord for word_ord, _ in computing.unordered_entries(pool)]
+    pattern_compendium = computing.build_pattern_compendium(words)
+    updated_pool = computing.compute_words_information_faster(words, pattern_compendium, game.language_launcher.threads)
+
+    return fast_strategy(game, updated_pool, pattern, guess, letter_extractor)
+
+
+def lookahead_strategy(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                       pattern: int, guess: tuple[int, ...],
+                       letter_extractor: dict[str, dict[int, int]],
+                       top_k: int=LOOKAHEAD_TOP_K, time_budget: float=LOOKAHEAD_TIME_BUDGET,
+                       **_strategy_options) -> tuple[tuple[int, ...], bool]:
+    # Two plies instead of one, kept affordable by only looking at the top_k one step guesses and a time budget per move
+
+    computing.update_letter_extractor(letter_extractor, computing.build_letter_extractor(guess, pattern))
+
+    return computing.compute_lookahead_guess(pool, top_k, time_budget), False
+
+
+def best_allowed_guess(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]]) -> tuple[int, ...]:
+    # Best split of the pool among every allowed guess (see Wordle.guesses_information), a pool word wins a tie since it may be the answer
+    if len(pool) <= 2 or not game.guesses_information:
+        return pool[0][0]
+
+    best_guess, best_information = game.guesses_information[0]
+    if best_guess in game.pool_words:
+        return best_guess
+
+    for word, information in game.guesses_information:
+        if information < best_information:
+            break
+
+        if word in game.pool_words:
+            return word
+
+    return best_guess
+
+
+def entropy_strategy(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+                     pattern: int, guess: tuple[int, ...],
+                     letter_extractor: dict[str, dict[int, int]],
+                     **_strategy_options) -> tuple[tuple[int, ...], bool]:
+    computing.update_letter_extractor(letter_extractor, computing.build_letter_extractor(guess, pattern))
+
+    return best_allowed_guess(game, pool), False
+
+
+STRATEGIES: dict[str, Callable] = {statics.SolverStrategy.STRATEGY_FAST.name: fast_strategy,
+                                   statics.SolverStrategy.STRATEGY_SLOW.name: slow_strategy,
+                                   statics.SolverStrategy.STRATEGY_LOOKAHEAD.name: lookahead_strategy,
+                                   statics.SolverStrategy.STRATEGY_ENTROPY.name: entropy_strategy}
+
+
+def get_strategy(strategy: str) -> None | Callable:
+    return STRATEGIES.get(strategy.upper())
+
+
+def get_opening(language_launcher: helpers.LangLauncher, best_opening: bool=True) -> tuple[int, ...]:
+    if best_opening and language_launcher.words_information:
+        return language_launcher.words_information[0][0]
+
+    return random.choice(list(language_launcher.words))
+
+
+def pick_guess(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
+               pattern: int, suggestions: list[computing.RankedInformation | None],
+               strategy: str, **strategy_options) -> tuple[tuple[int, ...], bool]:
+    # Same picks as the strategies, for a game whose letter extractor and suggestions are already up to date
+    if strategy.upper() == statics.SolverStrategy.STRATEGY_LOOKAHEAD.name:
+        return computing.compute_lookahead_guess(pool,
+                                                 strategy_options.get('top_k', LOOKAHEAD_TOP_K),
+                                                 strategy_options.get('time_budget', LOOKAHEAD_TIME_BUDGET)), False
+
+    if strategy.upper() == statics.SolverStrategy.STRATEGY_ENTROPY.name:
+        return best_allowed_guess(game, pool), False
+
+    return crutch_guess(game, pool, pattern, *rank_suggestions(game, suggestions))
+
+
+def solve_word(language_launcher: helpers.LangLauncher, word: tuple[int, ...],
+               func_strategy: Callable, max_tries: int=6,
+               best_opening: bool=True, scorer: str=statics.GuessScorer.SCORER_ENTROPY.name,
+               **strategy_options) -> dict[str, list[tuple[int, ...]] | list[int] | int | bool | float]:
+    tic = time.perf_counter()
+
+    game = wordle.Wordle(language_launcher, scorer, strategy_options.get('approximate_pool_size', sampling.APPROXIMATE_POOL_SIZE))
+    game.word = word
+
+    guess = get_opening(language_launcher, best_opening)
+    letter_extractor = {"incl": {}, "excl": {}}
+    solved_pattern = statics.get_solved_code(len(word))
+
+    guesses: list[tuple[int, ...]] = []
+    patterns: list[int] = []
+    solved = False
+    cptr_suggestion_used = 0
+
+    while len(guesses) < max_tries*2:
+        pattern = game.submit_guess(guess)
+        guesses.append(guess)
+        patterns.append(pattern)
+
+        if pattern == solved_pattern:
+            solved = True
+            break
+
+        pool = game.submit_guess_and_pattern(guess, pattern)
+        if pool is None:
+            break
+
+        guess, suggestion_used = func_strategy(game, pool, pattern, guess, letter_extractor, **strategy_options)
+
+        if suggestion_used:
+            cptr_suggestion_used = cptr_suggestion_used + 1
+
+    tac = time.perf_counter() - tic
+
+    return {'guesses': guesses,
+            'patterns': patterns,
+            'tries': len(guesses),
+            'solved': solved and len(guesses) <= max_tries,
+            'suggestion_used': cptr_suggestion_used,
+            'duration': tac}
+
+
+def compute_batch_stats(nb_guesses: list[int], nb_solved: int, tac: float) -> dict[str, int | float]:
+    cptr_games = len(nb_guesses)
+
+    if cptr_games == 0:
+        return {'games': 0, 'solved': 0, 'failed': 0, 'duration': round(tac, 5)}
+
+    sorted_guesses = sorted(nb_guesses)
+    half = cptr_games // 2
+    median_guesses = sorted_guesses[half] if cptr_games % 2 == 1 else (sorted_guesses[half - 1] + sorted_guesses[half]) / 2
+
+    return {'games': cptr_games,
+            'solved': nb_solved,
+            'failed': cptr_games - nb_solved,
+            'average_tries': round(sum(nb_guesses) / cptr_games, 5),
+            'median_tries': median_guesses,
+            'min_tries': sorted_guesses[0],
+            'max_tries': sorted_guesses[-1],
+            'lucky_guesses': nb_guesses.count(1),
+            'duration': round(tac, 5)}
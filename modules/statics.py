@@ -29,6 +29,33 @@ class GameMode(enum.Enum):
     GAME_MODE_PLAY = enum.auto()
     GAME_MODE_SOLVE = enum.auto()
     GAME_MODE_ASSISTED = enum.auto()
+    GAME_MODE_ADVERSARIAL = enum.auto()
+
+
+class SolverStrategy(enum.Enum):
+    STRATEGY_FAST = enum.auto()
+    STRATEGY_SLOW = enum.auto()
+    STRATEGY_LOOKAHEAD = enum.auto()
+    STRATEGY_ENTROPY = enum.auto()
+
+
+class GuessScorer(enum.Enum):
+    SCORER_ENTROPY = enum.auto()
+    SCORER_MINIMAX = enum.auto()
+    SCORER_EXPECTED_SIZE = enum.auto()
+    SCORER_DISTINCT_BUCKETS = enum.auto()
+
+
+class ResponseFormat(enum.Enum):
+    FORMAT_DEFAULT = enum.auto()
+    FORMAT_COLUMNAR = enum.auto()
+    FORMAT_PACKED = enum.auto()
+
+
+class ChannelStage(enum.Enum):
+    STAGE_HEURISTIC = enum.auto()
+    STAGE_EXACT = enum.auto()
+    STAGE_SOLVER = enum.auto()
 
 
 class StatusFunction(enum.Enum):
@@ -40,18 +67,91 @@ class StatusFunction(enum.Enum):
     WARNING = enum.auto()
 
 
+# Patterns are handled as base 3 integer codes (first letter is the lowest digit) everywhere but at the API edge:
+# hashing, comparing and storing them is then a plain integer operation
+EMOJI_BY_STATUS = {StatusLetter.MISS.value: "⬛",
+                   StatusLetter.MISPLACED.value: "🟨",
+                   StatusLetter.EXACT.value: "🟩"}
+STATUS_BY_EMOJI = {emoji: status for status, emoji in EMOJI_BY_STATUS.items()}
+
+# Encode/decode tables are precomputed per word lenght up to that lenght (3**7 codes), arithmetic is used past it:
+# for long words most of the 3**lenght patterns never occur, tables of them would only cost memory for a marginal gain
+PATTERN_TABLES_MAX_LENGHT = 7
+PATTERN_TABLES: dict[int, tuple[dict[tuple[int, ...], int], list[tuple[int, ...]]]] = {}
+# Weight of each position's digit in a code (3**position), per word lenght
+PATTERN_POWERS: dict[int, tuple[int, ...]] = {}
+
+
+def get_pattern_tables(word_lenght: int) -> tuple[dict[tuple[int, ...], int], list[tuple[int, ...]]] | None:
+    if word_lenght > PATTERN_TABLES_MAX_LENGHT:
+        return None
+
+    if (tables := PATTERN_TABLES.get(word_lenght)) is None:
+        # product() enumerates with its last element as the lowest digit, reversing gives the code order
+        decode = [tuple(reversed(statuses)) for statuses in it.product(range(len(StatusLetter)), repeat=word_lenght)]
+        encode = {pattern: code for code, pattern in enumerate(decode)}
+        tables = (encode, decode)
+        PATTERN_TABLES[word_lenght] = tables
+
+    return tables
+
+
+def get_pattern_powers(word_lenght: int) -> tuple[int, ...]:
+    if (powers := PATTERN_POWERS.get(word_lenght)) is None:
+        powers = tuple(3**position for position in range(word_lenght))
+        PATTERN_POWERS[word_lenght] = powers
+
+    return powers
+
+
+def pattern_to_code(pattern: tuple[int, ...]) -> int:
+    if (tables := get_pattern_tables(len(pattern))) is not None:
+        return tables[0][pattern]
+
+    code = 0
+    for letter_status in reversed(pattern):
+        code = code*3 + letter_status
+    return code
+
+
+def code_to_pattern(code: int, word_lenght: int) -> tuple[int, ...]:
+    if (tables := get_pattern_tables(word_lenght)) is not None:
+        return tables[1][code]
+
+    pattern = []
+    for _ in range(word_lenght):
+        code, letter_status = divmod(code, 3)
+        pattern.append(letter_status)
+    return tuple(pattern)
+
+
+def get_solved_code(word_lenght: int) -> int:
+    # Every digit is EXACT (2)
+    return 3**word_lenght - 1
+
+
+def is_valid_code(code: int, word_lenght: int) -> bool:
+    return 0 <= code < 3**word_lenght
+
+
+def count_exact(code: int, word_lenght: int) -> int:
+    return code_to_pattern(code, word_lenght).count(StatusLetter.EXACT.value)
+
+
 def pattern_to_emoji(pattern: tuple[int, ...]) -> str:
-    d = {StatusLetter.MISS.value: "⬛",
-         StatusLetter.MISPLACED.value: "🟨",
-         StatusLetter.EXACT.value: "🟩"}
-    return "".join(d[x] for x in pattern)
+    return "".join(EMOJI_BY_STATUS[x] for x in pattern)
 
 
 def emoji_to_pattern(pattern: str) -> str:
-    d = {"⬛": StatusLetter.MISS.value,
-         "🟨": StatusLetter.MISPLACED.value,
-         "🟩": StatusLetter.EXACT.value}
-    return "".join(str(d[x]) for x in pattern)
+    return "".join(str(STATUS_BY_EMOJI[x]) for x in pattern)
+
+
+def code_to_emoji(code: int, word_lenght: int) -> str:
+    return pattern_to_emoji(code_to_pattern(code, word_lenght))
+
+
+def emoji_to_code(pattern: str) -> int:
+    return pattern_to_code(tuple(STATUS_BY_EMOJI[x] for x in pattern))
 
 
 def pattern_permutations(word_lenght: int=5) -> set | set[tuple[int, ...]]:
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:52:06 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import time
+import inspect
+import pathlib
+import sqlite3
+
+from multiprocessing import Process, managers
+
+#pylint: disable=wrong-import-position, wrong-import-order
+from modules import computing, pattern_matrix, memory, compendium_cache
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Out of core build of the compendium cache: guess rows are processed by blocks, every block goes straight to a
+# <cache>.partial SQLite file along with its rows' scores, in one transaction. The transaction is the checkpoint:
+# an interrupted build resumes after the last committed block, the file only takes the cache name once complete.
+# Neither the {pattern: couples} dict nor its pickle are ever held, so the pattern compendium .pkl is not produced.
+
+PARTIAL_SUFFIX = ".partial"
+DEFAULT_MEMORY_CEILING_MB = 2048
+MAX_BLOCK_ROWS = 4096
+# Rough size of one couple waiting to be written (tuple, two str and the pattern int)
+COUPLE_BYTES = 256
+# Seconds between two footprint readings while a block's workers run
+RSS_POLL_INTERVAL = 0.2
+
+
+def get_partial_path(cache_file: pathlib.Path) -> pathlib.Path:
+    return cache_file.with_name(cache_file.name + PARTIAL_SUFFIX)
+
+
+def estimate_block_rows(nbr_words: int, memory_ceiling: int) -> int:
+    # A quarter of the ceiling for the couples of one block, the rest is left to the words and the interpreter
+    return max(1, min(MAX_BLOCK_ROWS, (memory_ceiling // 4) // max(1, nbr_words*COUPLE_BYTES)))
+
+
+def compute_block_rows_worker(rows_chunk: list[tuple[int, tuple[int, ...]]], words: list[tuple[int, ...]],
+                              return_dict_rows: managers.DictProxy) -> None:
+    nbr_words = len(words)
+
+    for row_idx, guess in rows_chunk:
+        counts: dict[int, int] = {}
+        couples: list[tuple[int, str, str]] = []
+        str_guess = "".join(chr(letter) for letter in guess)
+
+        for word in words:
+
+            if word == guess:
+                continue
+
+            pattern = computing.compute_pattern(guess=guess, word=word)
+            reverse = computing.compute_pattern(guess=word, word=guess)
+
+            # The couple sits in both patterns' sets: the row gets its whole histogram without waiting for the other rows
+            counts[pattern] = counts.get(pattern, 0) + 1
+            if reverse != pattern:
+                counts[reverse] = counts.get(reverse, 0) + 1
+
+            # The reverse set is written by the other word's row, a couple under twice the same pattern only once
+            if reverse != pattern or guess < word:
+                str_word = "".join(chr(letter) for letter in word)
+                couples.append((pattern, str_guess, str_word) if guess < word else (pattern, str_word, str_guess))
+
+        return_dict_rows[row_idx] = (computing.compute_partition_entropy(list(counts.values()), nbr_words), couples)
+
+
+def open_partial_cache(partial_path: pathlib.Path, words: list[tuple[int, ...]]) -> tuple[sqlite3.Connection, int, set[str]]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    signature = pattern_matrix.get_words_signature(words)
+
+    db = sqlite3.connect(str(partial_path), isolation_level=None)
+    db.execute('CREATE TABLE IF NOT EXISTS "__build_meta" (key TEXT PRIMARY KEY, value INTEGER)')
+    db.execute('CREATE TABLE IF NOT EXISTS "__build_rows" (row INTEGER PRIMARY KEY, word TEXT, score REAL)')
+
+    meta = dict(db.execute('SELECT key, value FROM "__build_meta"'))
+
+    # A checkpoint of another word list is worthless
+    if meta and (meta.get('signature'), meta.get('nbr_words')) != (signature, len(words)):
+        print(f"{curr_func} -- {partial_path.name} was started for another word list, starting over...")
+        db.close()
+        partial_path.unlink()
+        return open_partial_cache(partial_path, words)
+
+    if not meta:
+        db.executemany('INSERT INTO "__build_meta" (key, value) VALUES (?, ?)', [('signature', signature), ('nbr_words', len(words))])
+
+    done_rows = db.execute('SELECT COUNT(*) FROM "__build_rows"').fetchone()[0]
+    tables = {row[0] for row in db.execute('SELECT name FROM sqlite_master WHERE type="table"')}
+
+    return db, done_rows, tables
+
+
+def write_block(db: sqlite3.Connection, tables: set[str], block: list[tuple[int, tuple[int, ...]]],
+                rows_results: dict[int, tuple[float, list[tuple[int, str, str]]]], sparse: bool=False) -> int:
+    couples_by_pattern: dict[str, list[tuple[str, str]]] = {}
+
+    for row_idx, _ in block:
+        for pattern, guess, word in rows_results[row_idx][1]:
+            couples_by_pattern.setdefault(str(pattern), []).append((guess, word))
+
+    db.execute('BEGIN')
+
+    try:
+        if sparse:
+            # Same layout as compendium_cache.SparseCacheDB(path, guess="TEXT", word="TEXT"), a single table indexed by pattern code
+            table_name = compendium_cache.SPARSE_TABLE_NAME
+
+            if table_name not in tables:
+                db.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" (__pkid INTEGER PRIMARY KEY, pattern INTEGER, guess TEXT, word TEXT)')
+                db.execute(f'CREATE INDEX IF NOT EXISTS "{table_name}_pattern" ON "{table_name}" (pattern)')
+                tables.add(table_name)
+
+            db.executemany(f'INSERT INTO "{table_name}" (pattern, guess, word) VALUES (?, ?, ?)',
+                           [(int(pattern), guess, word) for pattern, couples in couples_by_pattern.items() for guess, word in couples])
+
+        else:
+            # Same layout as compendium_cache.CacheDB(path, guess="TEXT", word="TEXT"), tables named after the pattern codes
+            for table_name, couples in couples_by_pattern.items():
+                if table_name not in tables:
+                    db.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" (__pkid INTEGER PRIMARY KEY, guess TEXT, word TEXT)')
+                    tables.add(table_name)
+
+                db.executemany(f'INSERT INTO "{table_name}" (guess, word) VALUES (?, ?)', couples)
+
+        db.executemany('INSERT INTO "__build_rows" (row, word, score) VALUES (?, ?, ?)',
+                       [(row_idx, "".join(chr(letter) for letter in guess), rows_results[row_idx][0]) for row_idx, guess in block])
+
+        db.execute('COMMIT')
+
+    except Exception:
+        db.execute('ROLLBACK')
+        raise
+
+    return sum(len(couples) for couples in couples_by_pattern.values())
+
+
+def build_cache_streaming(words: set[tuple[int, ...]], cache_file: pathlib.Path, threads: int=0,
+                          memory_ceiling_mb: int=DEFAULT_MEMORY_CEILING_MB, sparse: bool=False) -> None | list[tuple[tuple[int, ...], float]]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    words = sorted(words)
+    nbr_words = len(words)
+    memory_ceiling = memory_ceiling_mb*1024*1024
+    partial_path = get_partial_path(cache_file)
+
+    db, done_rows, tables = open_partial_cache(partial_path, words)
+    block_rows = estimate_block_rows(nbr_words, memory_ceiling)
+
+    if done_rows:
+        print(f"{curr_func} -- Resuming {partial_path.name} after {done_rows}/{nbr_words} guess rows...")
+
+    tic = time.perf_counter()
+    start_rows = done_rows
+
+    try:
+        while done_rows < nbr_words:
+            block = [(row_idx, words[row_idx]) for row_idx in range(done_rows, min(nbr_words, done_rows + block_rows))]
+
+            block_chunked, return_dict_rows, jobs = computing.prepare_worker_datas(block, threads)
+
+            for block_chunk in block_chunked:
+                jobs.append(Process(target=compute_block_rows_worker, args=(block_chunk, words, return_dict_rows)))
+                jobs[-1].start()
+
+            # The block's couples live in the workers, then in the Manager server, then here: the whole process tree is measured,
+            # at its peak while the workers run and once more when the couples are copied over
+            rss = memory.get_tree_rss_bytes()
+
+            while any(process.is_alive() for process in jobs):
+                next(process for process in jobs if process.is_alive()).join(timeout=RSS_POLL_INTERVAL)
+                rss = max(rss, memory.get_tree_rss_bytes())
+
+            rows_results = dict(return_dict_rows.items())
+            rss = max(rss, memory.get_tree_rss_bytes())
+
+            nbr_couples = write_block(db, tables, block, rows_results, sparse)
+            done_rows = done_rows + len(block)
+
+            elapsed = time.perf_counter() - tic
+            throughput = (done_rows - start_rows)*(nbr_words - 1) / elapsed if elapsed > 0 else 0.0
+
+            print(f"{curr_func} -- {done_rows}/{nbr_words} guess rows ({round(100*done_rows/nbr_words, 1)}%) -- "
+                  f"{nbr_couples} couples written -- {round(throughput)} rows x words/s -- RSS {rss // (1024*1024)}/{memory_ceiling_mb} MB")
+
+            # Blocks shrink while over the ceiling, and grow back while far below it
+            if rss > memory_ceiling:
+                if block_rows == 1:
+                    print(f"{curr_func} -- Memory ceiling of {memory_ceiling_mb} MB reached with single row blocks, stopping (progress is kept)...")
+                    return None
+
+                block_rows = max(1, block_rows // 2)
+
+            elif rss < memory_ceiling // 2:
+                block_rows = min(MAX_BLOCK_ROWS, block_rows*2)
+
+        words_information = [(tuple(ord(letter) for letter in word), score)
+                             for word, score in db.execute('SELECT word, score FROM "__build_rows" ORDER BY score DESC')]
+
+        db.execute('DROP TABLE "__build_rows"')
+        db.execute('DROP TABLE "__build_meta"')
+
+    finally:
+        db.close()
+
+    partial_path.replace(cache_file)
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Streamed {nbr_words - start_rows} guess rows to {cache_file.name} in {round(tac, 2)} second(s)")
+
+    return words_information
@@ -10,42 +10,56 @@ Created on Tue Apr 02 10:20:51 2024
 #===================================================================================================
 import time
 import inspect
+import math
 
 import random
 
+from typing import Iterator
+
 #pylint: disable=wrong-import-position, wrong-import-order
-from modules import statics, helpers, computing
+from modules import statics, helpers, computing, metrics, scorers, sampling
 #pylint: enable=wrong-import-position, wrong-import-order
 #===================================================================================================
 
 __version__ = '0.1.0'
 
+# Allowed guesses scored between two partial rankings of iter_guesses_information
+GUESSES_CHUNK_SIZE = 1024
+
 
 class Wordle ():
-    def __init__(self, language_launcher: helpers.LangLauncher) -> None:
+    def __init__(self, language_launcher: helpers.LangLauncher, scorer: str=statics.GuessScorer.SCORER_ENTROPY.name,
+                 approximate_pool_size: int | None=sampling.APPROXIMATE_POOL_SIZE) -> None:
         curr_func = inspect.currentframe().f_code.co_name
 
         self.language_launcher = language_launcher
+        self.scorer = scorers.get_scorer(scorer) or scorers.score_entropy
+        # Pools bigger than this are ranked from samples first (see modules/sampling.py), None or 0 keeps every ranking exact
+        self.approximate_pool_size = approximate_pool_size
 
         print(f"{curr_func} -- Computing remaining information...")
         self.pool_words = set()
         self.information = 0.0
         self.word = tuple()
         self.letter_extractor = {"incl": {}, "excl": {}}
+        self.guesses_information: list | list[tuple[tuple[int, ...], float]] = []
+        self.guesses_histograms: list | list[tuple[tuple[int, ...], list[int]]] = []
+        self.guesses_estimates: dict[tuple[int, ...], float] = {}
 
         self.reset()
         print(f"{curr_func} -- Remaining information is: {round(self.information, 2)} bit(s)")
 
 
     def _is_invalid_word(self, word: tuple[int, ...]) -> bool:
-        return len(word) != self.language_launcher.word_lenght or word not in self.language_launcher.words
+        return len(word) != self.language_launcher.word_lenght or word not in self.language_launcher.allowed_words
+
 
+    def _is_invalid_pattern(self, pattern: int) -> bool:
+        return not isinstance(pattern, int) or not statics.is_valid_code(pattern, self.language_launcher.word_lenght)
 
-    def _is_invalid_pattern(self, pattern: tuple[int, ...]) -> bool:
-        allowed = [entry.value for entry in statics.StatusLetter]
-        foreign_found = not all(eval in allowed for eval in set(pattern))
 
-        return len(pattern) != self.language_launcher.word_lenght or foreign_found
+    def is_valid_move(self, guess: tuple[int, ...], pattern: int) -> bool:
+        return not self._is_invalid_word(guess) and not self._is_invalid_pattern(pattern)
 
 
     def reset(self) -> None:
@@ -54,9 +68,129 @@ class Wordle ():
         self.word = random.choice(list(self.pool_words))
 
         self.letter_extractor = {"incl": {}, "excl": {}}
+        self.guesses_information = []
+        self.guesses_histograms = []
+        self.guesses_estimates = {}
+
+
+    def is_approximate(self) -> bool:
+        # Sampled estimates are entropies, the other scorers are always exact
+        return bool(self.approximate_pool_size) and len(self.pool_words) > self.approximate_pool_size and self.scorer is scorers.score_entropy
+
+
+    def score_guesses(self) -> computing.RankedInformation:
+        # Ranks the guesses with the current scorer from the stored histograms, the pool words keep their own score
+        self.guesses_information = computing.score_histograms(self.guesses_histograms, len(self.pool_words), self.scorer)
+
+        if self.guesses_estimates:
+            # Guesses dropped on samples keep their estimate, capped strictly below the best exact score:
+            # they can not even tie it, so the chosen guess is always an exact one
+            best_information = math.nextafter(self.guesses_information[0][1], -math.inf)
+            self.guesses_information = computing.RankedInformation(self.guesses_information.unordered() +
+                                                                   [(guess, min(information, best_information))
+                                                                    for guess, information in self.guesses_estimates.items()])
+
+        return computing.RankedInformation([word_information for word_information in self.guesses_information.unordered()
+                                            if word_information[0] in self.pool_words])
+
+
+    def get_filtered_pool(self, guess: tuple[int, ...], pattern: int) -> set[tuple[int, ...]]:
+        # The pool the move would leave, self.pool_words is left untouched
+        matrix = self.language_launcher.pattern_matrix
+
+        if matrix is not None:
+            # The guess row holds its pattern against every answer, guesses outside of the pool included
+            return matrix.filter_pool(guess, pattern, self.pool_words)
+
+        pool_words: set[tuple[int, ...]] = set()
+        for pair_words in self.language_launcher.get_couples_from_compendium(pattern):
+            try:
+                conj = int(not bool(pair_words.index(guess)))
+                pool_words.add(pair_words[conj])
+            except:
+                pass
+
+        return self.pool_words.intersection(pool_words)
+
+
+    def filter_pool(self, guess: tuple[int, ...], pattern: int) -> set[tuple[int, ...]]:
+        self.pool_words = self.get_filtered_pool(guess, pattern)
+
+        return self.pool_words
+
+
+    def update_guesses_information(self) -> computing.RankedInformation:
+        matrix = self.language_launcher.pattern_matrix
+        self.guesses_estimates = {}
+
+        if self.is_approximate():
+            guesses = matrix.guesses if matrix is not None else sorted(self.pool_words)
+            self.guesses_histograms, self.guesses_estimates = sampling.rank_guesses_sampled(self.language_launcher, self.pool_words, guesses)
+
+        elif matrix is not None:
+            # Every allowed guess against the current pool
+            self.guesses_histograms = matrix.compute_histograms(self.pool_words)
+
+        else:
+            pool_pattern_compendium = computing.build_pattern_compendium(self.pool_words)
+            self.guesses_histograms = list(computing.compute_words_histograms_faster(self.pool_words, pool_pattern_compendium).items())
+
+        return self.score_guesses()
+
+
+    def iter_guesses_information(self, chunk_size: int=GUESSES_CHUNK_SIZE) -> Iterator[tuple[float, computing.RankedInformation]]:
+        # Same ranking as update_guesses_information, given back (with the share of guesses scored) after every chunk of guesses.
+        # The pool words are scored first so that their ranking is exact from the first chunk on, the other guesses only refine the best guess.
+        matrix = self.language_launcher.pattern_matrix
+
+        if matrix is None or self.is_approximate():
+            yield 1.0, self.update_guesses_information()
+            return
+
+        self.guesses_estimates = {}
+
+        pool_guesses = [guess for guess in matrix.guesses if guess in self.pool_words]
+        guesses = pool_guesses + [guess for guess in matrix.guesses if guess not in self.pool_words]
+        nbr_words = len(self.pool_words)
+
+        self.guesses_histograms = []
+        guesses_information: list[tuple[tuple[int, ...], float]] = []
+        start = 0
 
+        while start < len(guesses):
+            stop = min(len(guesses), max(start + chunk_size, len(pool_guesses)))
+            guesses_histograms = matrix.compute_histograms(self.pool_words, guesses[start:stop])
 
-    def submit_guess_and_pattern(self, guess: tuple[int, ...], pattern: tuple[int, ...]) -> None | list | list[tuple[tuple[int, ...], float]]:
+            self.guesses_histograms.extend(guesses_histograms)
+            guesses_information.extend(computing.score_histograms(guesses_histograms, nbr_words, self.scorer).unordered())
+            start = stop
+
+            # Back to the matrix order once complete, ties are then broken as update_guesses_information does
+            if start == len(guesses):
+                self.guesses_histograms.sort(key=lambda guess_histogram: matrix.guess_index[guess_histogram[0]])
+                guesses_information.sort(key=lambda word_information: matrix.guess_index[word_information[0]])
+
+            self.guesses_information = computing.RankedInformation(guesses_information)
+
+            yield start/len(guesses), computing.RankedInformation([word_information for word_information in guesses_information
+                                                                   if word_information[0] in self.pool_words])
+
+
+    def set_scorer(self, scorer: str) -> None | computing.RankedInformation:
+        # No pattern work, the histograms of the last guess are only scored again
+        if (func_scorer := scorers.get_scorer(scorer)) is None:
+            return None
+
+        self.scorer = func_scorer
+
+        # Sampled estimates do not carry over to another scorer, nor the exact histograms of the survivors to the entropy
+        if self.guesses_estimates or self.is_approximate():
+            return self.update_guesses_information()
+
+        return self.score_guesses()
+
+
+    def submit_guess_and_pattern(self, guess: tuple[int, ...], pattern: int) -> None | list | list[tuple[tuple[int, ...], float]]:
         curr_func = inspect.currentframe().f_code.co_name
 
         if self._is_invalid_word(guess):
@@ -73,26 +207,25 @@ class Wordle ():
             print(f"{curr_func} -- Pool words is empty")
             return None
 
+        labels = self.language_launcher.metric_labels()
+
         # print(f"{curr_func} -- Finding possible matches...")
-        pool_words: set[tuple[int, ...]] = set()
-        for pair_words in self.language_launcher.get_couples_from_compendium(pattern):
-            try:
-                conj = int(not bool(pair_words.index(guess)))
-                pool_words.add(pair_words[conj])
-            except:
-                pass
-        self.pool_words = self.pool_words.intersection(pool_words)
+        with metrics.POOL_FILTERING_SECONDS.time(**labels):
+            pool_words = self.get_filtered_pool(guess, pattern)
 
-        if not self.pool_words:
+        # A move no pool word matches is refused, the game is left as it was
+        if not pool_words:
             print(f"{curr_func} -- Pool words is empty")
             return None
 
+        self.pool_words = pool_words
+
         # print(f"{curr_func} -- Computing matches information...")
-        pool_pattern_compendium = computing.build_pattern_compendium(self.pool_words)
-        pool_words_information = computing.compute_words_information_faster(self.pool_words, pool_pattern_compendium)
+        with metrics.ENTROPY_COMPUTATION_SECONDS.time(**labels):
+            pool_words_information = self.update_guesses_information()
 
         # print(f"{curr_func} -- Computing remaining information...")
-        self.information = -computing.safe_log2(1.0/float(len(pool_words_information)))
+        self.information = -computing.safe_log2(1.0/float(len(self.pool_words)))
 
         tac = time.perf_counter() - tic
 
@@ -102,7 +235,31 @@ class Wordle ():
         return pool_words_information
 
 
-    def submit_guess(self, guess: tuple[int, ...]) -> None | tuple | tuple[int, ...]:
+    def submit_guess_adversarial(self, guess: tuple[int, ...]) -> None | int:
+        curr_func = inspect.currentframe().f_code.co_name
+
+        if self._is_invalid_word(guess):
+            print(f"{curr_func} -- Word {''.join(chr(ord_letter) for ord_letter in guess)} is not allowed")
+            return None
+
+        # No word is committed to: the answer keeps the largest part of the pool, and on a tie the one giving the least away
+        partition = self.language_launcher.partition_pool(guess, self.pool_words)
+        solved_pattern = statics.get_solved_code(len(guess))
+        word_lenght = len(guess)
+
+        pattern = max(partition, key=lambda code: (len(partition[code]), code != solved_pattern, -statics.count_exact(code, word_lenght), -code))
+
+        self.pool_words = partition[pattern]
+        self.information = -computing.safe_log2(1.0/float(len(self.pool_words)))
+        # Any remaining word is consistent with every pattern given so far
+        self.word = min(self.pool_words)
+
+        print(f"{curr_func} -- {statics.code_to_emoji(pattern, word_lenght)} -- {len(self.pool_words)} word(s) left")
+
+        return pattern
+
+
+    def submit_guess(self, guess: tuple[int, ...]) -> None | int:
         curr_func = inspect.currentframe().f_code.co_name
 
         if self._is_invalid_word(guess):
@@ -110,6 +267,6 @@ class Wordle ():
             return None
 
         pattern = computing.compute_pattern(guess=guess, word=self.word)
-        print(f"{curr_func} -- {statics.pattern_to_emoji(pattern)}")
+        print(f"{curr_func} -- {statics.code_to_emoji(pattern, len(guess))}")
 
         return pattern
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:36:26 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import os
+import mmap
+import time
+import zlib
+import struct
+import inspect
+import pathlib
+
+import unidecode
+
+#pylint: disable=wrong-import-position, wrong-import-order
+
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Layout (little endian):
+# - header: magic, version, number of buckets, source size, source crc32
+# - one (word lenght, number of words, offset) entry per bucket
+# - the ASCII folded letters of every bucket, words of a bucket laid out contiguously (no separator, they share the same lenght)
+INDEX_MAGIC = b"AWIX"
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+HEADER = struct.Struct("<4sHHQI")
+BUCKET = struct.Struct("<HIQ")
+
+
+def get_index_path(words_file: pathlib.Path) -> pathlib.Path:
+    return words_file.with_name(f"{words_file.stem}_words{INDEX_SUFFIX}")
+
+
+def get_source_signature(words_file: pathlib.Path) -> tuple[int, int]:
+    content = words_file.read_bytes()
+    return len(content), zlib.crc32(content)
+
+
+def normalize_word(word: str) -> str:
+    return unidecode.unidecode(word.strip()).lower()
+
+
+def bucket_words(words_file: pathlib.Path) -> dict[int, list[bytes]]:
+    buckets: dict[int, set[bytes]] = {}
+
+    with words_file.open('r', encoding='utf-8') as fp:
+        for word in fp:
+            word = normalize_word(word)
+
+            if word.isalpha() and word.isascii():
+                buckets.setdefault(len(word), set()).add(word.encode('ascii'))
+
+    return {word_lenght: sorted(words) for word_lenght, words in sorted(buckets.items())}
+
+
+def build_words_index(words_file: pathlib.Path, index_path: pathlib.Path | None=None) -> pathlib.Path:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    if index_path is None:
+        index_path = get_index_path(words_file)
+
+    tic = time.perf_counter()
+
+    source_size, source_crc = get_source_signature(words_file)
+    buckets = bucket_words(words_file)
+
+    table = b""
+    letters = b""
+    for word_lenght, words in buckets.items():
+        table = table + BUCKET.pack(word_lenght, len(words), len(letters))
+        letters = letters + b"".join(words)
+
+    # Written aside then swapped, a reader never sees a half written index
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with tmp_path.open('wb') as fp:
+        fp.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(buckets), source_size, source_crc))
+        fp.write(table)
+        fp.write(letters)
+    os.replace(tmp_path, index_path)
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Indexed {sum(len(words) for words in buckets.values())} words of {len(buckets)} different lenghts from {words_file.name} in {round(tac, 2)} second(s)")
+
+    return index_path
+
+
+def read_index_table(index: mmap.mmap | bytes) -> tuple[tuple[int, int], dict[int, tuple[int, int]]] | None:
+    if len(index) < HEADER.size:
+        return None
+
+    magic, version, nb_buckets, source_size, source_crc = HEADER.unpack_from(index, 0)
+
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        return None
+
+    letters_start = HEADER.size + nb_buckets*BUCKET.size
+    table: dict[int, tuple[int, int]] = {}
+
+    for cptr in range(nb_buckets):
+        word_lenght, nb_words, offset = BUCKET.unpack_from(index, HEADER.size + cptr*BUCKET.size)
+        table[word_lenght] = (nb_words, letters_start + offset)
+
+    return (source_size, source_crc), table
+
+
+def is_index_valid(words_file: pathlib.Path, index_path: pathlib.Path) -> bool:
+    if not index_path.is_file():
+        return False
+
+    with index_path.open('rb') as fp:
+        header = fp.read(HEADER.size)
+
+    if len(header) < HEADER.size:
+        return False
+
+    magic, version, _, source_size, source_crc = HEADER.unpack(header)
+
+    return magic == INDEX_MAGIC and version == INDEX_VERSION and (source_size, source_crc) == get_source_signature(words_file)
+
+
+def load_words_buckets(words_file: pathlib.Path, word_lenghts: list[int] | set[int]) -> dict[int, set[tuple[int, ...]]]:
+    index_path = get_index_path(words_file)
+
+    if not is_index_valid(words_file, index_path):
+        build_words_index(words_file, index_path)
+
+    buckets: dict[int, set[tuple[int, ...]]] = {}
+
+    with index_path.open('rb') as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            _, table = read_index_table(index)
+
+            for word_lenght in word_lenghts:
+                nb_words, start = table.get(word_lenght, (0, 0))
+                letters = index[start:start + nb_words*word_lenght]
+
+                # zip over the same iterator cuts the letters into word_lenght long ord tuples, no per word Python code
+                buckets[word_lenght] = set(zip(*[iter(letters)]*word_lenght))
+
+    return buckets
+
+
+def load_words(words_file: pathlib.Path, word_lenght: int=5) -> set | set[tuple[int, ...]]:
+    return load_words_buckets(words_file, [word_lenght])[word_lenght]
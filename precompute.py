@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:55:52 2026
+
+@rules: https://en.wikipedia.org/wiki/Wordle
+"""
+
+#===================================================================================================
+import sys
+import time
+import inspect
+import pathlib
+import argparse
+
+from multiprocessing import Process, Manager, cpu_count, managers
+
+#pylint: disable=wrong-import-position, wrong-import-order
+import models
+from modules import statics, helpers, words_index, streaming_build
+#pylint: enable=wrong-import-position, wrong-import-order
+#===================================================================================================
+
+__version__ = '0.1.0'
+
+# Builds every artifact (compendium, SQLite cache, words information, pattern matrix) of every language and lenght
+# found in the data folder, so that a server running with 'precomputed_only' only has to load them
+PROGRESS_INTERVAL = 10.0
+
+
+def get_precompute_tasks(conf: dict, langs: list[str] | None=None,
+                         word_lenghts: list[int] | None=None) -> list[tuple[pathlib.Path, int, pathlib.Path | None]]:
+    lang_files, exhaustive_files, allowed_files = models.get_data_files(conf)
+    tasks: list[tuple[pathlib.Path, int, pathlib.Path | None]] = []
+
+    for lang_file in sorted(lang_files):
+        if langs and lang_file.stem not in langs:
+            continue
+
+        allowed_file = next((file for file in allowed_files if file.stem == f"{lang_file.stem}_allowed"), None)
+
+        for word_lenght in sorted(helpers.get_lang_exhaustive_files(lang_file, exhaustive_files)):
+            if word_lenghts and word_lenght not in word_lenghts:
+                continue
+
+            tasks.append((lang_file, word_lenght, allowed_file))
+
+    return tasks
+
+
+def precompute_worker(tasks_chunk: list[tuple[pathlib.Path, int, pathlib.Path | None]], conf: dict, threads: int,
+                      return_dict_tasks: managers.DictProxy) -> None:
+    for lang_file, word_lenght, allowed_file in tasks_chunk:
+        task_name = f"{lang_file.stem}_{word_lenght}"
+        return_dict_tasks[task_name] = {'status': statics.StatusFunction.ONGOING.name, 'started': time.perf_counter()}
+
+        tic = time.perf_counter()
+
+        try:
+            words = words_index.load_words_buckets(lang_file, {word_lenght})[word_lenght]
+            allowed_words = words_index.load_words_buckets(allowed_file, {word_lenght})[word_lenght] if allowed_file is not None else None
+
+            lang_launcher = helpers.LangLauncher(lang_file, True, word_lenght, threads,
+                                                 words=words,
+                                                 allowed_words=allowed_words,
+                                                 streaming=word_lenght in conf.get('streaming_build_lenghts', []),
+                                                 memory_ceiling_mb=conf.get('STREAMING_MEMORY_CEILING_MB', streaming_build.DEFAULT_MEMORY_CEILING_MB))
+
+            status = statics.StatusFunction.DONE if lang_launcher.words_information else statics.StatusFunction.FAIL
+            return_dict_tasks[task_name] = {'status': status.name,
+                                            'words': len(lang_launcher.words),
+                                            'allowed_words': len(lang_launcher.allowed_words),
+                                            'pattern_matrix': lang_launcher.pattern_matrix is not None,
+                                            'seconds': round(time.perf_counter() - tic, 2),
+                                            'error': ''}
+
+        except Exception as err:
+            return_dict_tasks[task_name] = {'status': statics.StatusFunction.ERROR.name,
+                                            'seconds': round(time.perf_counter() - tic, 2),
+                                            'error': repr(err)}
+
+
+def precompute_all(conf: dict, tasks: list[tuple[pathlib.Path, int, pathlib.Path | None]], jobs: int=1,
+                   threads: int=0, progress_interval: float=PROGRESS_INTERVAL) -> dict[str, dict]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    if not tasks:
+        print(f"{curr_func} -- Nothing to build in {conf['data_folder']}")
+        return {}
+
+    jobs = max(1, min(jobs, len(tasks)))
+
+    # Every build spreads over its own workers: cores are shared between the concurrent builds
+    if not 0 < threads <= cpu_count():
+        threads = max(1, cpu_count() // jobs)
+
+    # Biggest languages first, dealt round robin so that the builders end at about the same time
+    tasks = sorted(tasks, key=lambda task: task[0].stat().st_size, reverse=True)
+    tasks_chunked = [tasks[i::jobs] for i in range(jobs)]
+
+    manager = Manager()
+    return_dict_tasks = manager.dict()
+    processes: list[Process] = []
+
+    print(f"{curr_func} -- Building {len(tasks)} language(s) x lenght(s) with {jobs} builder(s) of {threads} worker(s)...")
+
+    tic = time.perf_counter()
+
+    for tasks_chunk in tasks_chunked:
+        processes.append(Process(target=precompute_worker, args=(tasks_chunk, conf, threads, return_dict_tasks)))
+        processes[-1].start()
+
+    reported: set[str] = set()
+
+    while any(process.is_alive() for process in processes):
+        for process in processes:
+            process.join(timeout=progress_interval / len(processes))
+
+        elapsed = time.perf_counter() - tic
+        results = dict(return_dict_tasks.items())
+        ongoing = [task_name for task_name, result in results.items() if result['status'] == statics.StatusFunction.ONGOING.name]
+        finished = [task_name for task_name in results if task_name not in ongoing]
+
+        for task_name in finished:
+            if task_name not in reported:
+                reported.add(task_name)
+                print(f"{curr_func} -- {task_name}: {results[task_name]['status']} in {results[task_name]['seconds']} second(s) {results[task_name]['error']}")
+
+        print(f"{curr_func} -- {len(finished)}/{len(tasks)} done after {round(elapsed)} second(s) -- ongoing: {', '.join(ongoing) or '-'}")
+
+    results = dict(return_dict_tasks.items())
+
+    # A builder that died on its own (killed, out of memory) never reports its remaining tasks
+    for lang_file, word_lenght, _ in tasks:
+        results.setdefault(f"{lang_file.stem}_{word_lenght}", {'status': statics.StatusFunction.ERROR.name, 'error': 'Builder exited early'})
+
+    tac = time.perf_counter() - tic
+
+    print(f"{curr_func} -- Built {len(tasks)} language(s) x lenght(s) in {round(tac, 2)} second(s)")
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Builds the artifacts of every language and lenght of the data folder ahead of the server")
+    parser.add_argument('--jobs', type=int, default=1, help="Languages x lenghts built concurrently")
+    parser.add_argument('--threads', type=int, default=0, help="Workers per build (default: cores shared between the jobs)")
+    parser.add_argument('--lang', nargs='*', default=None, help="Only these languages")
+    parser.add_argument('--lenght', type=int, nargs='*', default=None, help="Only these word lenghts")
+    args = parser.parse_args()
+
+    conf = models.load_config()
+    results = precompute_all(conf, get_precompute_tasks(conf, args.lang, args.lenght), args.jobs, args.threads)
+
+    for task_name, result in sorted(results.items()):
+        print(f"{task_name}: {result}")
+
+    if any(result['status'] != statics.StatusFunction.DONE.name for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,14 @@ Created on Wed May 15 15:10:51 2024
 
 #===================================================================================================
 import inspect
+import pathlib
 
 import time
 import random
+import functools
 
 #pylint: disable=wrong-import-position, wrong-import-order
-from modules import statics, helpers, computing, wordle
+from modules import statics, helpers, wordle, solver, profiling, simulation, multi_wordle
 #pylint: enable=wrong-import-position, wrong-import-order
 #===================================================================================================
 
@@ -22,10 +24,11 @@ __version__ = '0.1.0'
 
 
 def init_game(language_launcher: helpers.LangLauncher, word: tuple[int, ...],
-              best_opening: bool, cptr_games: int) -> tuple[tuple[int, ...], tuple[int, ...], wordle.Wordle]:
+              best_opening: bool, cptr_games: int,
+              scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> tuple[tuple[int, ...], int, wordle.Wordle]:
     curr_func = inspect.currentframe().f_code.co_name
 
-    game = wordle.Wordle(language_launcher)
+    game = wordle.Wordle(language_launcher, scorer)
     game.word = word
 
     print(f"{curr_func} -- Starting game n°{cptr_games + 1}")
@@ -35,90 +38,18 @@ def init_game(language_launcher: helpers.LangLauncher, word: tuple[int, ...],
     if best_opening:
         guess = game.language_launcher.words_information[0][0]
 
-    pattern = tuple([statics.StatusLetter.MISS.value]*len(word))
+    pattern = statics.pattern_to_code(tuple([statics.StatusLetter.MISS.value]*len(word)))
 
     return guess, pattern, game
 
 
-def crutch_suggestion(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
-                      letter_extractor: dict[str, dict[int, int]]) -> tuple[list[tuple[int, ...]], int]:
-    curr_func = inspect.currentframe().f_code.co_name
-
-    pool_letters, pool_letters_dupes = computing.gather_pool_letters(pool)
-    suggestions = computing.build_suggestion(game.language_launcher.words_information,
-                                             pool_letters,
-                                             pool_letters_dupes,
-                                             letter_extractor)
-
-    print(f"{curr_func} -- Found {len(pool_letters)} different letters to try with {len(pool_letters_dupes)} dupes")
-
-    for sugg_rank in range(game.language_launcher.word_lenght - 1, 0 - 1, -1):
-        if suggestions[sugg_rank]:
-            print(f"{curr_func} -- Rank {sugg_rank} has {len(suggestions[sugg_rank])} suggestions")
-            break
-
-    sugg_guesses = [sugg[0] for sugg in suggestions[sugg_rank]]
-    # print(f"{curr_func} -- Suggestion are {sugg_guesses}")
-
-    return sugg_guesses, sugg_rank
-
-
-def crutch_guess(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
-                 pattern: tuple[int, ...],
-                 sugg_guesses: list[tuple[int, ...]], sugg_rank: int) -> tuple[tuple[int, ...], bool]:
-    curr_func = inspect.currentframe().f_code.co_name
-
-    suggestion_used = False
-    thresh_sugg = (game.language_launcher.word_lenght % 2) + game.language_launcher.word_lenght // 2
-
-    if len(pool) <= 2:
-        guess = pool[0][0]
-
-    elif len(pool) > 2 and \
-    sugg_rank > game.language_launcher.word_lenght - thresh_sugg and \
-    pattern.count(statics.StatusLetter.EXACT.value) >= thresh_sugg:
-        guess = sugg_guesses[0]
-
-        print(f"{curr_func} -- ⚠️  Using suggestion '{''.join(chr(ord_letter) for ord_letter in guess)}' on next attemp ⚠️")
-
-        suggestion_used = True
-
-    else:
-        guess = pool[0][0]
-
-    return guess, suggestion_used
-
-
-def fast_test(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
-              pattern: tuple[int, ...], guess: str,
-              letter_extractor: dict[str, dict[int, int]]) -> tuple[tuple[int, ...], bool]:
-    # Far from being the best solver, but somewhat OK speed wise...
-
-    letter_extractor = computing.update_letter_extractor(letter_extractor,
-                                                         computing.build_letter_extractor(guess, pattern))
-    sugg_guesses, sugg_rank = crutch_suggestion(game, pool, letter_extractor)
-
-    return crutch_guess(game, pool, pattern, sugg_guesses, sugg_rank)
-
-
-def slow_test(game: wordle.Wordle, pool: list[tuple[tuple[int, ...], float]],
-              pattern: tuple[int, ...], guess: tuple[int, ...],
-              letter_extractor: dict[str, dict[int, int]]) -> tuple[tuple[int, ...], bool]:
-    # As the name implies, it's a lot slower and cumputing intensive... Especially if ran in a single thread...
-
-    words = [word_ord for word_ord, _ in pool]
-    pattern_compendium = computing.build_pattern_compendium(words)
-    updated_pool = computing.compute_words_information_faster(words, pattern_compendium, game.language_launcher.threads)
-
-    return fast_test(game, updated_pool, pattern, guess, letter_extractor)
-
-
 def run_test(language_launcher: helpers.LangLauncher, word: tuple[int, ...],
              best_opening: bool, max_tries: int,
-             cptr_games: int, func_test: callable) -> tuple[int, ...]:
+             cptr_games: int, func_test: callable,
+             scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> tuple[int, ...]:
     curr_func = inspect.currentframe().f_code.co_name
 
-    guess, pattern, game = init_game(language_launcher, word, best_opening, cptr_games)
+    guess, pattern, game = init_game(language_launcher, word, best_opening, cptr_games, scorer)
     letter_extractor = {"incl": {}, "excl": {}}
 
     cptr_suggestion_used = 0
@@ -128,7 +59,7 @@ def run_test(language_launcher: helpers.LangLauncher, word: tuple[int, ...],
         print(f"{curr_func} -- Attempt n° {cptr_tries + 1} -- Trying word: {''.join(chr(ord_letter) for ord_letter in guess)} -- {len(game.pool_words)}/{len(language_launcher.words)}")
 
         pattern = game.submit_guess(guess)
-        if pattern == tuple([statics.StatusLetter.EXACT.value]*len(word)):
+        if pattern == statics.get_solved_code(len(word)):
             break
 
         pool = game.submit_guess_and_pattern(guess, pattern)
@@ -177,6 +108,70 @@ def show_stats(nb_suggestion_used: list[int], nb_guesses: list[int],
     print(f"{curr_func} -- END -- Crutch suggestion used in {game_where_sugg_used} game(s)")
 
 
+def play_games(language_launcher: helpers.LangLauncher, best_opening: bool,
+               max_tries: int, max_games: int, func_test: callable,
+               scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> tuple[list[int], list[int], int]:
+    curr_func = inspect.currentframe().f_code.co_name
+
+    nb_guesses: list[int] = []
+    nb_suggestion_used: list[int] = []
+
+    cptr_games = 0
+    for word in language_launcher.words:
+
+        cptr_tries, cptr_suggestion_used = run_test(language_launcher, word, best_opening, max_tries, cptr_games, func_test, scorer)
+
+        if cptr_tries == max_tries:
+            print(f"{curr_func} -- FAIL -- autoWordle failed to find a solution in {max_tries} (or less) attemps")
+
+        print("##############################################################")
+
+        nb_guesses.append(cptr_tries + 1)
+        nb_suggestion_used.append(cptr_suggestion_used)
+
+        cptr_games = cptr_games + 1
+
+        if cptr_games == max_games:
+            break
+
+    return nb_guesses, nb_suggestion_used, cptr_games
+
+
+def simulate_games(language_launcher: helpers.LangLauncher, best_opening: bool,
+                   max_tries: int, max_games: int, func_test: callable,
+                   scorer: str=statics.GuessScorer.SCORER_ENTROPY.name) -> tuple[list[int], list[int], int]:
+    # Same games as play_games, all played at once (see modules/simulation.py)
+    words = sorted(language_launcher.words)[:max_games]
+    results = simulation.simulate_targets(language_launcher, words, func_test, max_tries, best_opening, scorer)
+
+    nb_guesses = [results[word]['tries'] for word in words]
+    nb_suggestion_used = [results[word]['suggestion_used'] for word in words]
+
+    return nb_guesses, nb_suggestion_used, len(words)
+
+
+def play_multi_games(language_launcher: helpers.LangLauncher, best_opening: bool,
+                     max_tries: int, max_games: int, func_test: callable,
+                     scorer: str=statics.GuessScorer.SCORER_ENTROPY.name,
+                     nb_boards: int=4) -> tuple[list[int], list[int], int]:
+    # nb_boards words per game, all answered by the same guesses (see modules/multi_wordle.py)
+    # best_opening and func_test are not used: the boards share best_boards_guess, that never falls back on suggestions
+    curr_func = inspect.currentframe().f_code.co_name
+
+    words = sorted(language_launcher.words)
+    nb_guesses: list[int] = []
+
+    for cptr_games in range(max_games):
+        results = multi_wordle.solve_words(language_launcher, random.sample(words, nb_boards), max_tries, scorer)
+
+        if not results['solved']:
+            print(f"{curr_func} -- FAIL -- Game n°{cptr_games + 1} not solved in {max_tries} (or less) attemps")
+
+        nb_guesses.append(results['tries'])
+
+    return nb_guesses, [0]*max_games, max_games
+
+
 def main() -> None:
     curr_func = inspect.currentframe().f_code.co_name
 
@@ -185,9 +180,16 @@ def main() -> None:
     max_chars = 5
     max_tries = 6
     threads = 0
+    profile = False # Dumps a .pstats of the whole run in profiles/
+    lockstep = True # Every word played at once, pools shared by several words are only scored once
+    nb_boards = 1 # More than 1 plays Dordle, Quordle... games: nb_boards words answered by the same guesses
+
+    func_test = solver.fast_strategy
+    # func_test = solver.slow_strategy
+    # func_test = solver.lookahead_strategy
+    # func_test = solver.entropy_strategy
 
-    func_test = fast_test
-    # func_test = slow_test
+    scorer = statics.GuessScorer.SCORER_ENTROPY.name # Or SCORER_MINIMAX, SCORER_EXPECTED_SIZE, SCORER_DISTINCT_BUCKETS
 
     language_launcher = helpers.LangLauncher(file_path, best_opening, max_chars, threads)
     max_games = len(language_launcher.words) # 0 and 1 are forbidden !
@@ -196,28 +198,20 @@ def main() -> None:
         print(f"{curr_func} -- ABORTING -- Not enough max_games: {max_games} (Must be greater than 1)")
         return None
 
-    nb_guesses: list[int] = []
-    nb_suggestion_used: list[int] = []
-
     tic = time.perf_counter()
 
-    cptr_games = 0
-    for word in language_launcher.words:
-
-        cptr_tries, cptr_suggestion_used = run_test(language_launcher, word, best_opening, max_tries, cptr_games, func_test)
-
-        if cptr_tries == max_tries:
-            print(f"{curr_func} -- FAIL -- autoWordle failed to find a solution in {max_tries} (or less) attemps")
+    func_play = simulate_games if lockstep else play_games
 
-        print("##############################################################")
-
-        nb_guesses.append(cptr_tries + 1)
-        nb_suggestion_used.append(cptr_suggestion_used)
+    if nb_boards > 1:
+        max_tries = multi_wordle.get_default_max_tries(nb_boards)
+        func_play = functools.partial(play_multi_games, nb_boards=nb_boards)
 
-        cptr_games = cptr_games + 1
+    if profile:
+        (nb_guesses, nb_suggestion_used, cptr_games), _ = profiling.profile_call(pathlib.Path("profiles/"), "testouille_wordle", func_play,
+                                                                                 language_launcher, best_opening, max_tries, max_games, func_test, scorer)
 
-        if cptr_games == max_games:
-            break
+    else:
+        nb_guesses, nb_suggestion_used, cptr_games = func_play(language_launcher, best_opening, max_tries, max_games, func_test, scorer)
 
     tac = time.perf_counter() - tic
 